@@ -6,20 +6,26 @@ Professional UI for managing projects and building EXEs
 import os
 import sys
 import json
+import re
 import uuid
-import webview
+import hashlib
+import importlib.util
 import threading
-from pathlib import Path
+import time
+import atexit
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import contextlib
 from http.server import HTTPServer, SimpleHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
 import argparse
-import subprocess
 import shutil
 from datetime import datetime
-import tkinter as tk
-from tkinter import filedialog
 import base64
 import io
+import struct
+import zlib
+from email.utils import formatdate, parsedate_to_datetime
 
 # Force UTF-8 encoding for console output to support emojis and Unicode
 if sys.stdout and hasattr(sys.stdout, 'reconfigure'):
@@ -27,17 +33,322 @@ if sys.stdout and hasattr(sys.stdout, 'reconfigure'):
 if sys.stderr and hasattr(sys.stderr, 'reconfigure'):
     sys.stderr.reconfigure(encoding='utf-8')
 
+# GUI and imaging modules (webview, tkinter, PIL, ahocorasick) and the ones only
+# builds, caches and history need (subprocess, sqlite3, gzip) are imported where
+# they are used, so the headless CLI and server startup never load them; the
+# optional ones are only located here. `builder.py bench-startup` guards this.
+# shutil stays above: http.server imports it anyway.
+HAS_PILLOW = importlib.util.find_spec('PIL') is not None
+HAS_AHOCORASICK = importlib.util.find_spec('ahocorasick') is not None
+HAS_BROTLI = importlib.util.find_spec('brotli') is not None
+
+# PyInstaller only adds .exe on Windows; headless builds on Linux runners get no suffix
+EXE_SUFFIX = '.exe' if sys.platform == 'win32' else ''
+
+
+# Runtime for generated HTML apps. It is compiled with PyInstaller into a stub
+# exe and the project is appended to it as an indexed asset archive (see
+# AssetArchive). At startup the archive is memory-mapped and served to the
+# webview by a small local HTTP server, so nothing is unpacked to disk.
+HTML_RUNTIME_SOURCE = r"""
+import json
+import mimetypes
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+# Import errors are reported by the self-test instead of failing before main()
 try:
-    from PIL import Image
-    HAS_PILLOW = True
-except ImportError:
-    HAS_PILLOW = False
+    import webview
+    WEBVIEW_ERROR = None
+except ImportError as e:
+    WEBVIEW_ERROR = e
+
+MAGIC = b'H2EPAK01'
+TRAILER = struct.Struct('<8sQQQ')
+CHUNK_SIZE = 256 * 1024
+
+mimetypes.add_type('text/javascript', '.js')
+mimetypes.add_type('text/javascript', '.mjs')
+mimetypes.add_type('application/wasm', '.wasm')
+mimetypes.add_type('image/svg+xml', '.svg')
+mimetypes.add_type('image/webp', '.webp')
+
+
+class Payload:
+    # Layout: [stub exe][file data][index json][config json][trailer]
+    # index: {path: [offset, length, size, method, etag]}
+    
+    def __init__(self, exe_path):
+        self.file = open(exe_path, 'rb')
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        end = len(self.data)
+        magic, self.data_start, index_len, config_len = TRAILER.unpack(self.data[end - TRAILER.size:end])
+        if magic != MAGIC:
+            raise RuntimeError('No project payload found in ' + exe_path)
+        index_start = end - TRAILER.size - config_len - index_len
+        self.index = json.loads(self.data[index_start:index_start + index_len])
+        self.config = json.loads(self.data[index_start + index_len:index_start + index_len + config_len])
+        self.inflated = {}
+        self.lock = threading.Lock()
+    
+    def lookup(self, path):
+        entry = self.index.get(path)
+        if entry is None and (path == '' or path.endswith('/')):
+            path = path + 'index.html'
+            entry = self.index.get(path)
+        return path, entry
+    
+    def read(self, entry, start, stop):
+        offset, length, size, method, etag = entry
+        if method == 'zlib':
+            # Compressed entries are small text files; inflate once and keep
+            with self.lock:
+                raw = self.inflated.get(etag)
+                if raw is None:
+                    raw = self.inflated[etag] = zlib.decompress(self.data[self.data_start + offset:self.data_start + offset + length])
+            return raw[start:stop]
+        base = self.data_start + offset
+        return self.data[base + start:base + stop]
+
+
+def trace(message):
+    trace_path = os.environ.get('HTML2EXE_TRACE')
+    if trace_path:
+        with open(trace_path, 'a', encoding='utf-8') as f:
+            f.write(f'{time.perf_counter() - STARTED:.4f} {message}\n')
+
+
+class AssetHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    payload = None
+    
+    def do_GET(self):
+        self.serve(send_body=True)
+    
+    def do_HEAD(self):
+        self.serve(send_body=False)
+    
+    def serve(self, send_body):
+        started = time.perf_counter()
+        path, entry = self.payload.lookup(unquote(urlsplit(self.path).path).lstrip('/'))
+        if entry is None:
+            self.send_empty(404)
+            return
+        
+        size, etag = entry[2], '"' + entry[4] + '"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_empty(304, etag)
+            return
+        
+        start, stop, status = 0, size, 200
+        byte_range = self.headers.get('Range')
+        if byte_range and self.headers.get('If-Range', etag) == etag:
+            parsed = self.parse_range(byte_range, size)
+            if parsed is None:
+                self.send_response(416)
+                self.send_header('Content-Range', f'bytes */{size}')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            start, stop = parsed
+            status = 206
+        
+        self.send_response(status)
+        self.send_header('Content-Type', mimetypes.guess_type(path)[0] or 'application/octet-stream')
+        self.send_header('Content-Length', str(stop - start))
+        self.send_header('ETag', etag)
+        self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('Cache-Control', 'no-cache')
+        if status == 206:
+            self.send_header('Content-Range', f'bytes {start}-{stop - 1}/{size}')
+        self.end_headers()
+        
+        if send_body:
+            # Stream large media in chunks straight from the mapping
+            for chunk_start in range(start, stop, CHUNK_SIZE):
+                self.wfile.write(self.payload.read(entry, chunk_start, min(chunk_start + CHUNK_SIZE, stop)))
+        trace(f'{status} {path} {stop - start}B {(time.perf_counter() - started) * 1000:.2f}ms')
+    
+    @staticmethod
+    def parse_range(header, size):
+        # Single byte ranges only: bytes=a-b, bytes=a-, bytes=-n
+        units, _, spec = header.partition('=')
+        if units.strip() != 'bytes' or ',' in spec:
+            return None
+        first, _, last = spec.strip().partition('-')
+        try:
+            if first:
+                start = int(first)
+                stop = min(int(last) + 1, size) if last else size
+            else:
+                start, stop = max(size - int(last), 0), size
+        except ValueError:
+            return None
+        if start >= stop:
+            return None
+        return start, stop
+    
+    def send_empty(self, status, etag=None):
+        self.send_response(status)
+        if etag:
+            self.send_header('ETag', etag)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+    
+    def log_message(self, format, *args):
+        pass
+
+
+def self_test(exe_path, report_path):
+    # HTML2EXE_SELFTEST: load what a real launch loads (payload, asset server,
+    # GUI backend) without opening a window, and write a JSON report for the builder
+    import http.client
+    import logging
+    
+    missing = []
+    
+    class MissingModules(logging.Handler):
+        # pywebview logs, rather than raises, backends that fail to import
+        def emit(self, record):
+            error = record.exc_info[1] if record.exc_info else None
+            if isinstance(error, ModuleNotFoundError) and error.name:
+                missing.append(error.name)
+    
+    report = {'ok': False}
+    try:
+        if WEBVIEW_ERROR is not None:
+            raise WEBVIEW_ERROR
+        logging.getLogger('pywebview').addHandler(MissingModules())
+        try:
+            payload = Payload(exe_path)
+        except RuntimeError:
+            payload = None  # bare runtime stub, no project appended yet
+        if payload:
+            AssetHandler.payload = payload
+            server = ThreadingHTTPServer(('127.0.0.1', 0), AssetHandler)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            conn = http.client.HTTPConnection('127.0.0.1', server.server_port, timeout=10)
+            conn.request('GET', '/' + payload.config['entry'])
+            report['entryStatus'] = conn.getresponse().status
+            server.shutdown()
+        from webview.guilib import initialize
+        report['gui'] = getattr(initialize(), '__name__', None)
+        report['ok'] = report.get('entryStatus', 200) == 200
+    except Exception as e:
+        report['error'] = f'{type(e).__name__}: {e}'
+        if isinstance(e, ModuleNotFoundError) and e.name:
+            missing.append(e.name)
+    report['missing'] = sorted(set(missing))
+    report['modules'] = len(sys.modules)
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f)
+    return 0 if report['ok'] else 1
+
+
+def main():
+    exe_path = sys.executable if getattr(sys, 'frozen', False) else sys.argv[1]
+    if os.environ.get('HTML2EXE_SELFTEST'):
+        sys.exit(self_test(exe_path, os.environ['HTML2EXE_SELFTEST']))
+    if WEBVIEW_ERROR is not None:
+        raise WEBVIEW_ERROR
+    AssetHandler.payload = payload = Payload(exe_path)
+    config = payload.config
+    trace(f'payload mapped: {len(payload.index)} files')
+    
+    server = ThreadingHTTPServer(('127.0.0.1', 0), AssetHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    
+    webview.create_window(
+        title=config['title'],
+        url=f'http://127.0.0.1:{server.server_port}/{config["entry"]}',
+        width=config.get('width', 1024),
+        height=config.get('height', 768),
+        resizable=config.get('resizable', True),
+        background_color=config.get('backgroundColor', '#ffffff')
+    )
+    webview.start(debug=False, http_server=False)
+    server.shutdown()
+
+
+STARTED = time.perf_counter()
+
+if __name__ == '__main__':
+    main()
+"""
+
+
+# Bootstrap for layered Python builds. It is frozen with the app's dependencies
+# into a cached dependency layer (see DependencyLayerCache); the project's own
+# compiled modules and data files form the application layer (PythonAppLayer),
+# appended to onefile exes and unpacked into sys._MEIPASS at startup, or written
+# into the onedir folder at build time. The entry module then runs as __main__.
+PYTHON_BOOTSTRAP_SOURCE = r"""
+import io
+import json
+import os
+import runpy
+import struct
+import sys
+import zipfile
+
+MAGIC = b'H2EPYL01'
+TRAILER = struct.Struct('<8sQQ')
+CONFIG_NAME = '__html2exe_app__.json'
+
+
+def unpack_app_layer():
+    with open(sys.executable, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() < TRAILER.size:
+            return
+        f.seek(-TRAILER.size, os.SEEK_END)
+        magic, start, length = TRAILER.unpack(f.read(TRAILER.size))
+        if magic != MAGIC:
+            return
+        f.seek(start)
+        layer = f.read(length)
+    zipfile.ZipFile(io.BytesIO(layer)).extractall(sys._MEIPASS)
+
+
+def main():
+    config_path = os.path.join(sys._MEIPASS, CONFIG_NAME)
+    if not os.path.exists(config_path):
+        unpack_app_layer()
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    runpy.run_module(config['entry'], run_name='__main__', alter_sys=True)
+
+
+if __name__ == '__main__':
+    main()
+"""
 
 
 class BuilderHTTPHandler(SimpleHTTPRequestHandler):
     """HTTP handler for serving builder UI and API"""
     
+    # Keep-alive connections; idle ones are dropped after `timeout` seconds
+    # so they do not pin a worker thread
+    protocol_version = 'HTTP/1.1'
+    timeout = 15
+    # Headers and body go out as separate writes; without TCP_NODELAY the body
+    # waits on the client's delayed ACK (~40 ms per keep-alive response)
+    disable_nagle_algorithm = True
+    # Seconds between keep-alive comments on an idle build event stream
+    STREAM_KEEPALIVE = 10
+    
     builder_root = None
+    builder = None
+    job_queue = None
+    static_cache = None
     
     def do_GET(self):
         """Handle GET requests"""
@@ -47,6 +358,7 @@ class BuilderHTTPHandler(SimpleHTTPRequestHandler):
         
         # API endpoints
         if path.startswith('/api/'):
+            self.query = parse_qs(parsed.query)
             self.handle_api_request(path[5:], 'GET')
             return
         
@@ -79,6 +391,11 @@ class BuilderHTTPHandler(SimpleHTTPRequestHandler):
         parsed = urlparse(self.path)
         path = parsed.path
         
+        if path == '/api/icons':
+            # Raw icon bytes, streamed to disk rather than read into a JSON body
+            self.upload_icon()
+            return
+        
         if path.startswith('/api/'):
             content_length = int(self.headers.get('Content-Length', 0))
             body = self.rfile.read(content_length).decode('utf-8')
@@ -117,60 +434,41 @@ class BuilderHTTPHandler(SimpleHTTPRequestHandler):
         """Handle API requests"""
         try:
             if endpoint == 'projects' and method == 'GET':
-                # List all existing projects from Documents/HTML2EXE folder
+                # List projects from the SQLite index (reconciled with Documents/HTML2EXE lazily)
                 try:
-                    projects = []
-                    user_home = os.path.expanduser('~')
-                    projects_dir = os.path.join(user_home, 'Documents', 'HTML2EXE')
-                    
-                    print(f"\n📂 Searching for projects in: {projects_dir}")
+                    query = self.query
                     
-                    if os.path.exists(projects_dir):
-                        project_list = os.listdir(projects_dir)
-                        print(f"Found {len(project_list)} project folder(s)")
-                        
-                        for project_name in project_list:
-                            project_path = os.path.join(projects_dir, project_name)
-                            if os.path.isdir(project_path):
-                                # Check if it has project.json
-                                project_json_path = os.path.join(project_path, 'project.json')
-                                project_meta = {}
-                                
-                                print(f"  ✓ Loading: {project_name}")
-                                
-                                if os.path.exists(project_json_path):
-                                    try:
-                                        with open(project_json_path, 'r', encoding='utf-8') as f:
-                                            project_meta = json.load(f)
-                                    except Exception as e:
-                                        print(f"    ⚠️  Error reading metadata: {e}")
-                                
-                                project_info = {
-                                    'id': project_name,
-                                    'name': project_meta.get('name', project_name),
-                                    'path': project_path,
-                                    'downloadFolder': project_meta.get('downloadFolder', ''),
-                                    'description': project_meta.get('description', ''),
-                                    'version': project_meta.get('version', 'unknown'),
-                                    'author': project_meta.get('author', ''),
-                                    'created': project_meta.get('created', ''),
-                                    'analysis': project_meta.get('analysis', {
-                                        'projectType': 'Unknown',
-                                        'frameworks': [],
-                                        'technologies': []
-                                    })
-                                }
-                                projects.append(project_info)
-                    else:
-                        print(f"  Projects directory does not exist yet")
+                    def param(name, default=None):
+                        return query.get(name, [default])[0]
                     
-                    print(f"Returning {len(projects)} project(s)\n")
-                    self.send_json({'success': True, 'projects': projects})
+                    built = param('built')
+                    projects, total = self.builder.project_index.query(
+                        framework=param('framework'),
+                        project_type=param('projectType'),
+                        created_after=param('createdAfter'),
+                        created_before=param('createdBefore'),
+                        built=None if built is None else built.lower() in ('1', 'true', 'yes'),
+                        search=param('q'),
+                        sort=param('sort', 'created'),
+                        order=param('order', 'desc'),
+                        page=int(param('page', 1)),
+                        page_size=int(param('pageSize', 0)),
+                    )
+                    self.send_json({
+                        'success': True,
+                        'projects': projects,
+                        'total': total,
+                        'page': int(param('page', 1)),
+                        'pageSize': int(param('pageSize', 0))
+                    })
+                except ValueError as e:
+                    self.send_json({'error': f'Invalid query: {e}'}, 400)
                 except Exception as e:
                     print(f"❌ Error listing projects: {e}")
                     self.send_json({'error': str(e)}, 500)
             
             elif endpoint == 'system-info' and method == 'GET':
+                import webview
                 info = {
                     'python_version': f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
                     'platform': sys.platform,
@@ -192,9 +490,7 @@ class BuilderHTTPHandler(SimpleHTTPRequestHandler):
                     data = json.loads(body)
                     folder_path = data.get('folderPath', '')
                     
-                    # Create builder instance to scan folder
-                    builder = HTMLToEXEBuilder()
-                    result = builder.scan_folder(folder_path)
+                    result = self.builder.scan_folder(folder_path)
                     self.send_json(result)
                 else:
                     self.send_json({'error': 'No folder path provided'}, 400)
@@ -207,13 +503,16 @@ class BuilderHTTPHandler(SimpleHTTPRequestHandler):
                     
                     analyzer = ProjectAnalyzer(folder_path)
                     analysis = analyzer.analyze()
-                    self.send_json({'success': True, 'analysis': analysis})
+                    self.send_json({'success': True, 'analysis': analysis, 'analysisCache': analyzer.cache_stats})
                 else:
                     self.send_json({'error': 'No folder path provided'}, 400)
             
             elif endpoint == 'browse-folder' and method == 'POST':
                 # Open Windows folder browser dialog
                 try:
+                    import tkinter as tk
+                    from tkinter import filedialog
+                    
                     # Hide the root window
                     root = tk.Tk()
                     root.withdraw()
@@ -234,247 +533,62 @@ class BuilderHTTPHandler(SimpleHTTPRequestHandler):
                 except Exception as e:
                     self.send_json({'error': f'Failed to open folder dialog: {str(e)}'}, 500)
             
+            elif endpoint == 'jobs' and method == 'GET':
+                # List queued, running and finished build jobs
+                self.send_json({
+                    'success': True,
+                    'workers': self.job_queue.max_workers,
+                    'jobs': [job.to_dict() for job in self.job_queue.list()]
+                })
+            
+            elif endpoint.startswith('jobs/') and endpoint.endswith('/events') and method == 'GET':
+                # Stream PyInstaller output and phase progress of a build job (Server-Sent Events)
+                job = self.job_queue.get(endpoint[5:-len('/events')])
+                if job:
+                    self.stream_job_events(job)
+                else:
+                    self.send_json({'error': 'Job not found'}, 404)
+            
+            elif endpoint.startswith('jobs/') and method == 'GET':
+                # Report state, timings and result of one build job
+                job = self.job_queue.get(endpoint[5:])
+                if job:
+                    self.send_json({'success': True, 'job': job.to_dict()})
+                else:
+                    self.send_json({'error': 'Job not found'}, 404)
+            
+            elif endpoint == 'builds/history' and method == 'GET':
+                # Past builds with phase timings, peak memory and exe size, plus per-project trends
+                try:
+                    limit = int(self.query.get('limit', ['200'])[0])
+                except ValueError:
+                    self.send_json({'error': 'limit must be an integer'}, 400)
+                    return
+                builds = self.builder.build_history.query(
+                    project=self.query.get('project', [None])[0],
+                    kind=self.query.get('kind', [None])[0],
+                    limit=limit,
+                )
+                self.send_json({
+                    'success': True,
+                    'builds': builds,
+                    'trends': self.builder.build_history.trends(builds),
+                })
+            
+            elif endpoint == 'build-cache' and method == 'GET':
+                # Build cache size and hit/miss counters
+                self.send_json({'success': True, 'cache': self.builder.build_cache.stats()})
+            
+            elif endpoint == 'build-cache' and method == 'DELETE':
+                self.builder.build_cache.clear()
+                self.send_json({'success': True, 'message': 'Build cache cleared'})
+            
             elif endpoint == 'build-project' and method == 'POST':
-                # Build project to EXE using PyInstaller
+                # Build project to EXE using PyInstaller (runs on the job queue)
                 if body:
-                    try:
-                        data = json.loads(body)
-                        project_name = data.get('projectName', '')
-                        project_id = data.get('projectId', '')
-                        icon_path = data.get('iconPath', '')
-                        
-                        print(f"\n{'='*60}")
-                        print(f"🔨 BUILDING EXE: {project_name}")
-                        print(f"{'='*60}")
-                        print(f"Project ID: {project_id}")
-                        if icon_path:
-                            print(f"Icon: {icon_path}")
-                        
-                        if not project_name or not project_id:
-                            self.send_json({'error': 'Project name and ID required'}, 400)
-                            return
-                        
-                        user_home = os.path.expanduser('~')
-                        metadata_dir = os.path.join(user_home, 'Documents', 'HTML2EXE', project_id)
-                        project_json_path = os.path.join(metadata_dir, 'project.json')
-                        
-                        print(f"\n📂 Looking for metadata: {project_json_path}")
-                        
-                        # Read project metadata
-                        if not os.path.exists(project_json_path):
-                            print(f"❌ Metadata not found!")
-                            self.send_json({'error': f'Project metadata not found'}, 404)
-                            return
-                        
-                        print(f"✅ Metadata found")
-                        
-                        with open(project_json_path, 'r') as f:
-                            project_meta = json.load(f)
-                        
-                        project_folder = project_meta.get('downloadFolder', '')
-                        print(f"📦 Project folder: {project_folder}")
-                        
-                        if not os.path.isdir(project_folder):
-                            print(f"❌ Project folder not found!")
-                            self.send_json({'error': f'Project folder not found: {project_folder}'}, 404)
-                            return
-                        
-                        print(f"✅ Project folder exists")
-                        
-                        # Create build directory
-                        build_dir = os.path.join(metadata_dir, 'build')
-                        os.makedirs(build_dir, exist_ok=True)
-                        
-                        print(f"\n🔧 Creating build script...")
-                        
-                        # Create a Python script that serves the HTML project
-                        build_script = f'''
-import os
-import sys
-import webview
-from pathlib import Path
-
-# Project directory
-PROJECT_DIR = r"{project_folder}"
-
-class API:
-    def __init__(self):
-        pass
-
-if __name__ == "__main__":
-    # Create window with project
-    window = webview.create_window(
-        title="{project_name}",
-        url=f"file://" + os.path.join(PROJECT_DIR, "index.html"),
-        width=1024,
-        height=768,
-        resizable=True,
-        background_color="#ffffff"
-    )
-    
-    webview.start(debug=False, http_server=False)
-'''
-                        
-                        build_script_path = os.path.join(build_dir, 'main.py')
-                        with open(build_script_path, 'w') as f:
-                            f.write(build_script)
-                        
-                        print(f"✅ Build script created: {build_script_path}")
-                        
-                        # Build EXE using PyInstaller
-                        output_dir = os.path.join(user_home, 'Downloads')
-                        exe_name = project_name.replace(' ', '_')
-                        
-                        print(f"\n⚙️  Running PyInstaller...")
-                        print(f"Output directory: {output_dir}")
-                        print(f"EXE name: {exe_name}.exe")
-                        
-                        # Handle icon if provided (from base64 encoded file data)
-                        final_icon_path = None
-                        if data.get('iconData'):
-                            try:
-                                icon_data_uri = data.get('iconData', '')
-                                # Parse data URI to get base64 content
-                                if icon_data_uri.startswith('data:'):
-                                    # Extract base64 content from data URI
-                                    base64_content = icon_data_uri.split(',')[1]
-                                    icon_binary = base64.b64decode(base64_content)
-                                    
-                                    # Determine file extension from data URI
-                                    mime_type = icon_data_uri.split(';')[0].split(':')[1]
-                                    if 'png' in mime_type:
-                                        icon_ext = 'png'
-                                    elif 'x-icon' in mime_type or 'vnd.microsoft.icon' in mime_type or 'ico' in mime_type:
-                                        icon_ext = 'ico'
-                                    else:
-                                        icon_ext = 'ico'  # Default to ICO
-                                    
-                                    # Save temporary icon file with explicit binary mode
-                                    temp_icon_path = os.path.join(build_dir, f'temp_icon.{icon_ext}')
-                                    with open(temp_icon_path, 'wb') as f:
-                                        bytes_written = f.write(icon_binary)
-                                        f.flush()  # Force flush to disk
-                                        os.fsync(f.fileno())  # Ensure sync to disk
-                                    
-                                    # Ensure file is written to disk
-                                    import time
-                                    time.sleep(0.2)  # Wait for disk write
-                                    
-                                    print(f"📥 Received icon file: {temp_icon_path} ({icon_ext.upper()})")
-                                    print(f"   File size: {os.path.getsize(temp_icon_path)} bytes (wrote {bytes_written} bytes)")
-                                    print(f"   MIME type detected: {mime_type}")
-                                    
-                                    # Convert PNG to ICO if necessary
-                                    if icon_ext == 'png' and HAS_PILLOW:
-                                        ico_path = os.path.join(build_dir, f'{exe_name}.ico')
-                                        try:
-                                            print(f"🎨 Converting PNG to ICO format...")
-                                            img = Image.open(temp_icon_path)
-                                            # Ensure image is at least 256x256 for better quality
-                                            if img.size[0] < 256 or img.size[1] < 256:
-                                                print(f"  Scaling icon to 256x256")
-                                                img = img.resize((256, 256), Image.Resampling.LANCZOS)
-                                            # Convert to RGB if needed (PNG may have alpha channel)
-                                            if img.mode in ('RGBA', 'LA', 'P'):
-                                                rgb_img = Image.new('RGB', img.size, (255, 255, 255))
-                                                if img.mode == 'RGBA':
-                                                    rgb_img.paste(img, mask=img.split()[-1])
-                                                else:
-                                                    rgb_img.paste(img)
-                                                rgb_img.save(ico_path, 'ICO')
-                                            else:
-                                                img.save(ico_path, 'ICO')
-                                            final_icon_path = ico_path
-                                            print(f"✅ ICO created from PNG: {ico_path}")
-                                            os.remove(temp_icon_path)  # Clean up temp PNG
-                                        except Exception as e:
-                                            print(f"Warning: Failed to convert PNG to ICO: {e}")
-                                            final_icon_path = temp_icon_path  # Use PNG as fallback
-                                    else:
-                                        # Already ICO or Pillow not available
-                                        final_icon_path = temp_icon_path
-                                        print(f"✅ Using icon file: {final_icon_path}")
-                            except Exception as e:
-                                print(f"Warning: Failed to process icon data: {e}")
-                        
-                        # Create build subdirectories
-                        os.makedirs(os.path.join(build_dir, 'build'), exist_ok=True)
-                        
-                        # PyInstaller command (use absolute Windows paths)
-                        cmd = [
-                            'pyinstaller',
-                            '--onefile',
-                            '--windowed',
-                            '--noupx',
-                            '-y',  # Overwrite without asking
-                            f'--name={exe_name}',
-                            f'--distpath={output_dir}',
-                            f'--workpath={os.path.join(build_dir, "build")}',
-                            f'--specpath={build_dir}',
-                            '--hidden-import=webview',
-                            '--hidden-import=webview.js',
-                        ]
-                        
-                        # Add icon if available - use absolute path for Windows
-                        if final_icon_path and os.path.exists(final_icon_path):
-                            abs_icon_path = os.path.abspath(final_icon_path)
-                            print(f"📌 Icon file ready for PyInstaller:")
-                            print(f"   Path: {abs_icon_path}")
-                            print(f"   Exists: {os.path.exists(abs_icon_path)}")
-                            print(f"   Size: {os.path.getsize(abs_icon_path)} bytes")
-                            
-                            # PyInstaller handles Windows paths with backslashes correctly
-                            cmd.append(f'--icon={abs_icon_path}')
-                        
-                        cmd.append(build_script_path)
-                        
-                        print(f"Full PyInstaller command:")
-                        print(f"  {' '.join(cmd)}\n")
-                        
-                        # Run PyInstaller
-                        result = subprocess.run(cmd, capture_output=True, text=True, creationflags=subprocess.CREATE_NO_WINDOW)
-                        
-                        print(f"PyInstaller output:\n{result.stdout}")
-                        
-                        if result.stderr and result.stderr.strip():
-                            print(f"PyInstaller warnings/errors:\n{result.stderr}")
-                        
-                        if result.returncode != 0:
-                            print(f"\n❌ Build failed!")
-                            print(f"Error: {result.stderr}")
-                            self.send_json({
-                                'error': f'Build failed: {result.stderr}'
-                            }, 500)
-                            return
-                        
-                        exe_path = os.path.join(output_dir, f'{exe_name}.exe')
-                        
-                        print(f"\n✅ PyInstaller completed successfully")
-                        print(f"Checking for EXE at: {exe_path}")
-                        
-                        if os.path.exists(exe_path):
-                            print(f"✨ EXE CREATED SUCCESSFULLY!")
-                            print(f"Size: {os.path.getsize(exe_path) / (1024*1024):.2f} MB")
-                            print(f"Location: {exe_path}")
-                            print(f"{'='*60}\n")
-                            
-                            self.send_json({
-                                'success': True,
-                                'message': f'EXE created successfully!',
-                                'exePath': exe_path,
-                                'exeName': f'{exe_name}.exe'
-                            })
-                        else:
-                            print(f"❌ EXE was not created at expected location!")
-                            self.send_json({
-                                'error': 'EXE was not created'
-                            }, 500)
-                    
-                    except Exception as e:
-                        print(f"\n❌ BUILD ERROR: {str(e)}")
-                        import traceback
-                        traceback.print_exc()
-                        self.send_json({'error': f'Build error: {str(e)}'}, 500)
+                    data = json.loads(body)
+                    job = self.job_queue.submit('build-project', data.get('projectName', ''), data)
+                    self.send_json({'success': True, 'jobId': job.id, 'state': job.state}, 202)
                 else:
                     self.send_json({'error': 'No build data provided'}, 400)
             
@@ -506,6 +620,12 @@ if __name__ == "__main__":
                         documents_dir = os.path.join(user_home, 'Documents', 'HTML2EXE')
                         metadata_dir = os.path.join(documents_dir, project_name)
                         
+                        # Mirroring a folder into one that contains it (or vice versa) would delete the source
+                        if folder_path and os.path.isdir(folder_path) and ProjectSync.overlaps(folder_path, downloads_dir) \
+                                and os.path.realpath(folder_path) != os.path.realpath(downloads_dir):
+                            self.send_json({'error': f'Source folder overlaps the project folder {downloads_dir}'}, 400)
+                            return
+                        
                         print(f"\n📁 Creating directories...")
                         print(f"  Downloads path: {downloads_dir}")
                         print(f"  Metadata path: {metadata_dir}")
@@ -539,33 +659,21 @@ if __name__ == "__main__":
                             json.dump(project_meta, f, indent=2)
                         
                         print(f"✅ Metadata saved")
+                        self.builder.project_index.upsert(project_name)
                         
-                        # Copy all files to Downloads folder
+                        # Mirror source files into the Downloads folder (changed files only)
+                        sync_stats = None
                         if folder_path and os.path.isdir(folder_path):
-                            print(f"\n📋 Copying files from source...")
-                            file_count = 0
-                            for item in os.listdir(folder_path):
-                                src = os.path.join(folder_path, item)
-                                dst = os.path.join(downloads_dir, item)
-                                
-                                # Skip if destination already exists
-                                if os.path.exists(dst):
-                                    if os.path.isdir(dst):
-                                        shutil.rmtree(dst)
-                                    else:
-                                        os.remove(dst)
-                                
-                                if os.path.isdir(src):
-                                    if item not in ['node_modules', '.git', 'dist', 'build', '.vscode', '__pycache__']:
-                                        print(f"  📂 Copying folder: {item}")
-                                        shutil.copytree(src, dst, ignore=shutil.ignore_patterns('node_modules', '.git', 'dist', 'build', '.vscode', '__pycache__'))
-                                        file_count += 1
-                                else:
-                                    print(f"  📄 Copying file: {item}")
-                                    shutil.copy2(src, dst)
-                                    file_count += 1
-                            
-                            print(f"✅ Copied {file_count} items")
+                            print(f"\n📋 Syncing files from source...")
+                            sync = ProjectSync(folder_path, downloads_dir,
+                                               link_mode=data.get('linkMode', 'reflink'),
+                                               hash_check=bool(data.get('hashCheck', False)))
+                            sync_stats = sync.run()
+                            print(f"✅ Copied {sync_stats['filesCopied'] + sync_stats['filesLinked']} files "
+                                  f"({(sync_stats['bytesCopied'] + sync_stats['bytesLinked']) / (1024*1024):.1f} MB), "
+                                  f"skipped {sync_stats['filesSkipped']} unchanged "
+                                  f"({sync_stats['bytesSkipped'] / (1024*1024):.1f} MB), "
+                                  f"removed {sync_stats['filesRemoved']} stale")
                         
                         print(f"\n{'='*60}")
                         print(f"✨ PROJECT CREATED SUCCESSFULLY!")
@@ -575,7 +683,8 @@ if __name__ == "__main__":
                             'success': True, 
                             'message': f'Project "{project_name}" created successfully!', 
                             'downloadFolder': downloads_dir,
-                            'metadataFolder': metadata_dir
+                            'metadataFolder': metadata_dir,
+                            'sync': sync_stats
                         })
                     except Exception as e:
                         print(f"\n❌ ERROR: {str(e)}")
@@ -624,310 +733,11 @@ if __name__ == "__main__":
                     self.send_json({'error': f'Window close error: {str(e)}'}, 500)
             
             elif endpoint == 'convert-python-to-exe' and method == 'POST':
-                """Convert Python script/project to EXE"""
+                """Convert Python script/project to EXE (runs on the job queue)"""
                 if body:
-                    try:
-                        data = json.loads(body)
-                        python_path = data.get('pythonPath', '')
-                        exe_name = data.get('exeName', 'MyApp')
-                        hide_console = data.get('hideConsole', True)
-                        single_file = data.get('singleFile', True)
-                        optimize = data.get('optimize', False)
-                        icon_data = data.get('iconData', '')
-                        
-                        print(f"\n{'='*60}")
-                        print(f"🔨 PYTHON TO EXE CONVERSION")
-                        print(f"{'='*60}")
-                        print(f"Python Project: {python_path}")
-                        print(f"EXE Name: {exe_name}")
-                        print(f"Hide Console: {hide_console}")
-                        print(f"Single File: {single_file}")
-                        
-                        # Validate Python project path
-                        if not os.path.exists(python_path):
-                            self.send_json({'error': f'Python project path not found: {python_path}'}, 404)
-                            return
-                        
-                        python_path = os.path.abspath(python_path)
-                        
-                        # Find entry point (main.py, app.py, or first .py file)
-                        entry_point = None
-                        py_files = []
-                        
-                        for file in os.listdir(python_path):
-                            if file.endswith('.py'):
-                                py_files.append(file)
-                                if file in ['main.py', 'app.py', 'run.py']:
-                                    entry_point = file
-                        
-                        # If no standard entry point found, use first Python file
-                        if not entry_point and py_files:
-                            entry_point = py_files[0]
-                        
-                        if not entry_point:
-                            self.send_json({
-                                'error': 'No Python (.py) files found in the project folder. Please ensure your project has a main.py, app.py, or other Python file.'
-                            }, 400)
-                            return
-                        
-                        entry_point_path = os.path.join(python_path, entry_point)
-                        print(f"✓ Entry point: {entry_point}")
-                        
-                        # Check for requirements.txt
-                        requirements_path = os.path.join(python_path, 'requirements.txt')
-                        has_requirements = os.path.exists(requirements_path)
-                        if has_requirements:
-                            print(f"✓ Dependencies file found: requirements.txt")
-                        
-                        # Analyze project for data files and dependencies
-                        print(f"\n📊 Analyzing project structure...")
-                        datas_list = []
-                        binaries_list = []
-                        hidden_imports = []
-                        
-                        # Scan Python files for imports to auto-detect hidden imports
-                        import_keywords = {
-                            'webview': 'webview',
-                            'flask': 'flask',
-                            'django': 'django',
-                            'requests': 'requests',
-                            'numpy': 'numpy',
-                            'pandas': 'pandas',
-                            'PIL': 'PIL',
-                            'cv2': 'cv2',
-                            'tkinter': 'tkinter',
-                            'PyQt5': 'PyQt5',
-                            'PyQt6': 'PyQt6',
-                            'PySide6': 'PySide6',
-                            'pygame': 'pygame',
-                            'sqlalchemy': 'sqlalchemy',
-                            'sqlite3': 'sqlite3',
-                            'cryptography': 'cryptography',
-                            'matplotlib': 'matplotlib',
-                            'scipy': 'scipy',
-                            'sklearn': 'sklearn',
-                        }
-                        
-                        for py_file in py_files:
-                            try:
-                                with open(os.path.join(python_path, py_file), 'r', encoding='utf-8', errors='ignore') as f:
-                                    content = f.read()
-                                for keyword, module in import_keywords.items():
-                                    if keyword in content and module not in hidden_imports:
-                                        hidden_imports.append(module)
-                                        print(f"  🔍 Detected import: {module}")
-                            except Exception:
-                                pass
-                        
-                        # Find all data files (json, yaml, txt, config, etc.)
-                        data_extensions = {'.json', '.yaml', '.yml', '.txt', '.config', '.conf', '.cfg', '.ini', '.xml', '.csv', '.db'}
-                        non_python_files = {}
-                        
-                        for root, dirs, files in os.walk(python_path):
-                            # Skip virtual envs and build folders
-                            dirs[:] = [d for d in dirs if d not in {'venv', '.venv', 'env', '__pycache__', '.git', 'build', 'dist', 'node_modules'}]
-                            
-                            for file in files:
-                                file_path = os.path.join(root, file)
-                                rel_path = os.path.relpath(file_path, python_path)
-                                
-                                # Check if it's a data file
-                                _, ext = os.path.splitext(file)
-                                if ext.lower() in data_extensions or (not file.endswith('.py') and not file.endswith('.pyc')):
-                                    folder = os.path.dirname(rel_path)
-                                    if folder and folder not in {'__pycache__'}:
-                                        if folder not in non_python_files:
-                                            non_python_files[folder] = []
-                                        non_python_files[folder].append(file)
-                        
-                        # Create datas entries for PyInstaller
-                        for folder, files in non_python_files.items():
-                            folder_path_full = os.path.join(python_path, folder)
-                            # Format: (source_folder, destination_folder(relative to exe))
-                            datas_list.append((folder_path_full, folder))
-                            print(f"  📦 Data folder: {folder}")
-                        
-                        # Create build directory
-                        user_home = os.path.expanduser('~')
-                        build_base_dir = os.path.join(user_home, 'Documents', 'HTMLToExe_PythonBuilds')
-                        build_dir = os.path.join(build_base_dir, exe_name)
-                        output_dir = os.path.join(user_home, 'Downloads')
-                        
-                        os.makedirs(build_dir, exist_ok=True)
-                        os.makedirs(os.path.join(build_dir, 'build'), exist_ok=True)
-                        
-                        print(f"\n📁 Build directory: {build_dir}")
-                        
-                        # Handle icon if provided
-                        final_icon_path = None
-                        if data.get('iconData'):
-                            try:
-                                icon_data_uri = data.get('iconData', '')
-                                if icon_data_uri.startswith('data:'):
-                                    base64_content = icon_data_uri.split(',')[1]
-                                    icon_binary = base64.b64decode(base64_content)
-                                    
-                                    mime_type = icon_data_uri.split(';')[0].split(':')[1]
-                                    if 'png' in mime_type:
-                                        icon_ext = 'png'
-                                    else:
-                                        icon_ext = 'ico'
-                                    
-                                    temp_icon_path = os.path.join(build_dir, f'temp_icon.{icon_ext}')
-                                    with open(temp_icon_path, 'wb') as f:
-                                        f.write(icon_binary)
-                                        f.flush()
-                                        os.fsync(f.fileno())
-                                    
-                                    print(f"📥 Icon file received: {icon_ext.upper()}")
-                                    
-                                    # Convert PNG to ICO if necessary
-                                    if icon_ext == 'png' and HAS_PILLOW:
-                                        ico_path = os.path.join(build_dir, f'{exe_name}.ico')
-                                        try:
-                                            print(f"🎨 Converting PNG to ICO format...")
-                                            img = Image.open(temp_icon_path)
-                                            if img.size[0] < 256 or img.size[1] < 256:
-                                                img = img.resize((256, 256), Image.Resampling.LANCZOS)
-                                            if img.mode in ('RGBA', 'LA', 'P'):
-                                                rgb_img = Image.new('RGB', img.size, (255, 255, 255))
-                                                if img.mode == 'RGBA':
-                                                    rgb_img.paste(img, mask=img.split()[-1])
-                                                else:
-                                                    rgb_img.paste(img)
-                                                rgb_img.save(ico_path, 'ICO')
-                                            else:
-                                                img.save(ico_path, 'ICO')
-                                            final_icon_path = ico_path
-                                            print(f"✅ ICO created: {ico_path}")
-                                            os.remove(temp_icon_path)
-                                        except Exception as e:
-                                            print(f"⚠️  Icon conversion failed: {e}")
-                                            final_icon_path = temp_icon_path
-                                    else:
-                                        final_icon_path = temp_icon_path
-                            except Exception as e:
-                                print(f"⚠️  Icon processing failed: {e}")
-                        
-                        # Generate PyInstaller spec file
-                        print(f"\n📝 Generating PyInstaller spec file...")
-                        spec_path = os.path.join(build_dir, f'{exe_name}.spec')
-                        
-                        # Create datas string for spec file
-                        datas_string = "[]"
-                        if datas_list:
-                            # Use forward slashes to avoid escape character issues
-                            datas_entries = [f"(r'{src}', '{dest.replace(chr(92), '/')}')" for src, dest in datas_list]
-                            datas_string = "[" + ", ".join(datas_entries) + "]"
-                        
-                        # Create hidden imports string
-                        hidden_imports_string = str(hidden_imports)
-                        
-                        icon_statement = ""
-                        if final_icon_path and os.path.exists(final_icon_path):
-                            icon_path_escaped = final_icon_path.replace('\\', '\\\\')
-                            icon_statement = f",\n    icon=r'{icon_path_escaped}'"
-                        
-                        console_value = 'False' if hide_console else 'True'
-                        spec_content = f"""# -*- mode: python ; coding: utf-8 -*-
-
-a = Analysis(
-    [r'{entry_point_path}'],
-    pathex=[r'{python_path}'],
-    binaries=[],
-    datas={datas_string},
-    hiddenimports={hidden_imports_string},
-    hookspath=[],
-    hooksconfig={{}},
-    runtime_hooks=[],
-    excludes=[],
-    noarchive=False,
-)
-pyz = PYZ(a.pure)
-
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.datas,
-    [],
-    name=r'{exe_name}',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=False,
-    upx_exclude=[],
-    runtime_tmpdir=None,
-    console={console_value}{icon_statement}
-)
-"""
-                        
-                        with open(spec_path, 'w') as f:
-                            f.write(spec_content)
-                        
-                        print(f"✅ Spec file created: {spec_path}")
-                        
-                        # Create PyInstaller command using spec file
-                        cmd = [
-                            'pyinstaller',
-                            f'--distpath={output_dir}',
-                            f'--workpath={os.path.join(build_dir, "build")}',
-                            '--noconfirm',
-                            '-y',
-                            spec_path
-                        ]
-                        
-                        print(f"\n⚙️  Running PyInstaller with spec file...")
-                        print(f"Spec file: {spec_path}\n")
-                        
-                        # Run PyInstaller
-                        result = subprocess.run(cmd, capture_output=True, text=True, cwd=build_dir, creationflags=subprocess.CREATE_NO_WINDOW)
-                        
-                        print(f"PyInstaller output:\n{result.stdout}")
-                        
-                        if result.stderr and result.stderr.strip():
-                            print(f"PyInstaller warnings:\n{result.stderr}")
-                        
-                        if result.returncode != 0:
-                            print(f"\n❌ Build failed!")
-                            # Extract the actual error from the output (last few lines)
-                            error_output = result.stderr.strip() if result.stderr else result.stdout.strip()
-                            error_lines = error_output.split('\n')
-                            # Get only the last 10 lines which contain the actual error
-                            actual_error = '\n'.join(error_lines[-10:]) if len(error_lines) > 10 else error_output
-                            self.send_json({
-                                'error': f'PyInstaller build failed: {actual_error}'
-                            }, 500)
-                            return
-                        
-                        exe_path = os.path.join(output_dir, f'{exe_name}.exe')
-                        
-                        if os.path.exists(exe_path):
-                            exe_size = os.path.getsize(exe_path) / (1024*1024)
-                            print(f"\n✨ BUILD SUCCESSFUL!")
-                            print(f"EXE File: {exe_path}")
-                            print(f"Size: {exe_size:.2f} MB")
-                            print(f"{'='*60}\n")
-                            
-                            self.send_json({
-                                'success': True,
-                                'message': f'Python to EXE conversion successful! EXE is in Downloads/',
-                                'exePath': exe_path,
-                                'exeName': f'{exe_name}.exe',
-                                'size': f'{exe_size:.2f} MB'
-                            })
-                        else:
-                            print(f"❌ EXE was not created at expected location!")
-                            print(f"Checked: {exe_path}")
-                            self.send_json({
-                                'error': 'EXE was not created. Check the build output above for errors.'
-                            }, 500)
-                    
-                    except Exception as e:
-                        print(f"\n❌ BUILD ERROR: {str(e)}")
-                        import traceback
-                        traceback.print_exc()
-                        self.send_json({'error': f'Build error: {str(e)}'}, 500)
+                    data = json.loads(body)
+                    job = self.job_queue.submit('convert-python-to-exe', data.get('exeName', 'MyApp'), data)
+                    self.send_json({'success': True, 'jobId': job.id, 'state': job.state}, 202)
                 else:
                     self.send_json({'error': 'No project data provided'}, 400)
             
@@ -938,26 +748,98 @@ exe = EXE(
             self.send_json({'error': str(e)}, 500)
     
     def serve_file(self, file_path):
-        """Serve a static file"""
-        full_path = os.path.join(self.builder_root, file_path)
+        """Serve a builder_ui file from the in-memory static cache
         
-        if not os.path.exists(full_path):
+        Handles If-None-Match / If-Modified-Since (304) and picks a precompressed
+        variant from Accept-Encoding. `?v=<hash>` URLs (see StaticFileCache) are
+        cached for a year; everything else is revalidated on each load.
+        """
+        entry = self.static_cache.get(os.path.relpath(file_path, 'builder_ui'))
+        if entry is None:
             self.send_error(404, "File Not Found")
             return
         
-        try:
-            with open(full_path, 'rb') as f:
-                content = f.read()
-            
-            # Set content type
-            content_type = self.guess_type(file_path)
-            self.send_response(200)
-            self.send_header('Content-type', content_type)
-            self.send_header('Content-Length', len(content))
+        versioned = parse_qs(urlparse(self.path).query).get('v', [None])[0] == entry['version']
+        encoding = self.choose_encoding(entry['variants'])
+        
+        def send_validators():
+            # Each encoding is a distinct representation, so it gets its own strong ETag
+            self.send_header('ETag', f'"{entry["version"]}-{encoding}"' if encoding else entry['etag'])
+            self.send_header('Last-Modified', entry['lastModified'])
+            self.send_header('Cache-Control', 'public, max-age=31536000, immutable' if versioned else 'no-cache')
+            self.send_header('Vary', 'Accept-Encoding')
+        
+        if self.not_modified(entry):
+            self.send_response(304)
+            send_validators()
             self.end_headers()
-            self.wfile.write(content)
-        except Exception as e:
-            self.send_error(500, str(e))
+            return
+        
+        content = entry['variants'][encoding] if encoding else entry['content']
+        self.send_response(200)
+        self.send_header('Content-Type', entry['contentType'])
+        self.send_header('Content-Length', len(content))
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        send_validators()
+        self.end_headers()
+        self.wfile.write(content)
+    
+    def not_modified(self, entry):
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match:
+            # Any encoding of the current version is still valid
+            tags = [tag.strip().removeprefix('W/').strip('"') for tag in if_none_match.split(',')]
+            return any(tag == '*' or tag.split('-')[0] == entry['version'] for tag in tags)
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                return int(entry['mtime']) <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+    
+    def choose_encoding(self, variants):
+        """Best precompressed variant the client accepts (br over gzip), or None"""
+        accepted = {}
+        for token in self.headers.get('Accept-Encoding', '').split(','):
+            name, _, params = token.strip().partition(';')
+            quality = 1.0
+            if params.strip().startswith('q='):
+                try:
+                    quality = float(params.strip()[2:])
+                except ValueError:
+                    quality = 0.0
+            accepted[name.strip().lower()] = quality
+        for encoding in ('br', 'gzip'):
+            if encoding in variants and accepted.get(encoding, accepted.get('*', 0)) > 0:
+                return encoding
+        return None
+    
+    def upload_icon(self):
+        """Store a PNG/ICO request body in the icon store and return its id"""
+        length = self.headers.get('Content-Length')
+        if length is None or not length.isdigit():
+            self.close_connection = True
+            self.send_json({'error': 'Content-Length required'}, 411)
+            return
+        
+        length = int(length)
+        if length > IconStore.MAX_BYTES:
+            # The body is left unread, so this connection cannot be reused
+            self.close_connection = True
+            self.send_json({'error': f'Icon larger than {IconStore.MAX_BYTES // (1024 * 1024)} MB'}, 413)
+            return
+        
+        try:
+            icon_id, size = self.builder.icon_store.save_stream(self.rfile, length)
+        except ValueError as e:
+            self.close_connection = True
+            self.send_json({'error': f'Invalid icon: {e}'}, 400)
+            return
+        
+        print(f"📥 Icon uploaded: {icon_id} ({size} bytes)")
+        self.send_json({'success': True, 'iconId': icon_id, 'size': size})
     
     def send_json(self, data, status=200):
         """Send JSON response"""
@@ -970,33 +852,365 @@ exe = EXE(
         self.end_headers()
         self.wfile.write(response)
     
-    def guess_type(self, path):
-        """Guess MIME type"""
-        if path.endswith('.css'):
-            return 'text/css'
-        elif path.endswith('.js'):
-            return 'application/javascript'
-        elif path.endswith('.json'):
-            return 'application/json'
-        elif path.endswith('.html'):
-            return 'text/html'
-        else:
-            return 'application/octet-stream'
+    def stream_job_events(self, job):
+        """Send a job's events as text/event-stream until the job finishes
+        
+        Events already sent are skipped when the browser reconnects with Last-Event-ID.
+        The response has no length, so the connection is closed when the stream ends.
+        """
+        try:
+            last_id = int(self.headers.get('Last-Event-ID') or self.query.get('after', ['0'])[0])
+        except ValueError:
+            last_id = 0
+        
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'close')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        self.close_connection = True
+        
+        try:
+            while True:
+                events, finished = job.events_after(last_id, timeout=self.STREAM_KEEPALIVE)
+                if events:
+                    chunk = ''.join(f'id: {event_id}\nevent: {name}\ndata: {json.dumps(data)}\n\n'
+                                    for event_id, name, data in events)
+                    self.wfile.write(chunk.encode('utf-8'))
+                    last_id = events[-1][0]
+                elif not finished:
+                    self.wfile.write(b': keep-alive\n\n')
+                self.wfile.flush()
+                if finished:
+                    break
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Client went away; the job keeps running
+    
+    def guess_type(self, path):
+        """Guess MIME type"""
+        return StaticFileCache.content_type(path)
     
     def log_message(self, format, *args):
         """Suppress server logging"""
         pass
 
 
+class BuilderHTTPServer(HTTPServer):
+    """HTTP server that handles connections on a bounded pool of worker threads"""
+    
+    allow_reuse_address = True
+    request_queue_size = 64
+    
+    def __init__(self, server_address, handler_class, max_threads=32):
+        super().__init__(server_address, handler_class)
+        self.max_threads = max_threads
+        self.pool = ThreadPoolExecutor(max_workers=max_threads, thread_name_prefix='http-worker')
+    
+    def process_request(self, request, client_address):
+        """Hand the connection to a worker instead of serving it inline"""
+        self.pool.submit(self._process_request_worker, request, client_address)
+    
+    def _process_request_worker(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+    
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+class StaticFileCache:
+    """builder_ui files held in memory with precompressed variants and validators
+    
+    An entry is rebuilt when its file (or, for HTML, a file it references) changes
+    on disk, so editing the UI still shows up on reload. HTML pages get their local
+    href/src references rewritten to `?v=<hash>`; those URLs change whenever the
+    file does and are served as immutable.
+    """
+    
+    # Explicit types: mimetypes reads the Windows registry, which often maps .js to text/plain
+    MIME_TYPES = {
+        '.html': 'text/html; charset=utf-8',
+        '.css': 'text/css; charset=utf-8',
+        '.js': 'application/javascript; charset=utf-8',
+        '.json': 'application/json',
+        '.svg': 'image/svg+xml',
+        '.png': 'image/png',
+        '.jpg': 'image/jpeg',
+        '.jpeg': 'image/jpeg',
+        '.gif': 'image/gif',
+        '.webp': 'image/webp',
+        '.ico': 'image/x-icon',
+        '.woff': 'font/woff',
+        '.woff2': 'font/woff2',
+        '.ttf': 'font/ttf',
+    }
+    COMPRESSIBLE = {'.html', '.css', '.js', '.json', '.svg'}
+    MIN_COMPRESS_BYTES = 512
+    REFERENCE_PATTERN = re.compile(r'((?:href|src)=")(\./)?([^"?#:]+)(")')
+    
+    def __init__(self, root):
+        self.root = os.path.realpath(root)
+        self.entries = {}
+        # HTML pages being loaded, so pages that link to each other don't recurse forever
+        self.loading = set()
+        self.lock = threading.Lock()
+    
+    @classmethod
+    def content_type(cls, path):
+        ext = os.path.splitext(path)[1].lower()
+        if ext in cls.MIME_TYPES:
+            return cls.MIME_TYPES[ext]
+        import mimetypes
+        return mimetypes.guess_type(path)[0] or 'application/octet-stream'
+    
+    def get(self, rel_path):
+        """Cache entry for a file under root, or None if it does not exist"""
+        full_path = os.path.realpath(os.path.join(self.root, rel_path))
+        if not full_path.startswith(self.root + os.sep) or not os.path.isfile(full_path):
+            return None
+        
+        with self.lock:
+            entry = self.entries.get(full_path)
+            if entry is None or not self._fresh(entry):
+                entry = self.entries[full_path] = self._load(full_path)
+            return entry
+    
+    def _fresh(self, entry):
+        for path, signature in entry['deps'].items():
+            try:
+                st = os.stat(path)
+            except OSError:
+                return False
+            if (st.st_mtime_ns, st.st_size) != signature:
+                return False
+        return True
+    
+    def _load(self, full_path):
+        import gzip
+        st = os.stat(full_path)
+        with open(full_path, 'rb') as f:
+            content = f.read()
+        deps = {full_path: (st.st_mtime_ns, st.st_size)}
+        mtime = st.st_mtime
+        
+        ext = os.path.splitext(full_path)[1].lower()
+        if ext == '.html':
+            self.loading.add(full_path)
+            try:
+                content, referenced = self._version_references(full_path, content)
+            finally:
+                self.loading.discard(full_path)
+            for entry in referenced.values():
+                deps.update(entry['deps'])
+                mtime = max(mtime, entry['mtime'])
+        
+        digest = hashlib.sha1(content).hexdigest()[:16]
+        variants = {}
+        if ext in self.COMPRESSIBLE and len(content) >= self.MIN_COMPRESS_BYTES:
+            variants['gzip'] = gzip.compress(content, compresslevel=9, mtime=0)
+            if HAS_BROTLI:
+                import brotli
+                variants['br'] = brotli.compress(content, quality=11)
+            # Keep only variants that are actually smaller
+            variants = {name: data for name, data in variants.items() if len(data) < len(content)}
+        
+        return {
+            'content': content,
+            'variants': variants,
+            'version': digest,
+            'etag': f'"{digest}"',
+            'mtime': mtime,
+            'lastModified': formatdate(mtime, usegmt=True),
+            'contentType': self.content_type(full_path),
+            'deps': deps,
+        }
+    
+    def _version_references(self, html_path, content):
+        """Append ?v=<hash> to href/src attributes that point at files in this cache"""
+        referenced = {}
+        base_dir = os.path.dirname(html_path)
+        
+        def replace(match):
+            target = os.path.realpath(os.path.join(base_dir, match.group(3)))
+            if target == html_path or not target.startswith(self.root + os.sep) or not os.path.isfile(target):
+                return match.group(0)
+            if target in self.loading:
+                # A page that links back to one being loaded: its content hash is not known
+                # yet, so version it by file stat, which still changes whenever it does
+                st = os.stat(target)
+                signature = (st.st_mtime_ns, st.st_size)
+                entry = {'version': hashlib.sha1(repr(signature).encode('utf-8')).hexdigest()[:16],
+                         'mtime': st.st_mtime, 'deps': {target: signature}}
+            else:
+                entry = self.entries.get(target)
+                if entry is None or not self._fresh(entry):
+                    entry = self.entries[target] = self._load(target)
+            referenced[target] = entry
+            return f'{match.group(1)}{match.group(2) or ""}{match.group(3)}?v={entry["version"]}{match.group(4)}'
+        
+        text = self.REFERENCE_PATTERN.sub(replace, content.decode('utf-8'))
+        return text.encode('utf-8'), referenced
+
+
+# Framework and technology signatures used by ProjectAnalyzer, in detection order.
+#   scope 'package': patterns are dependency names ('dev:' = devDependencies only);
+#                    with 'version' the matched dependency's version is recorded
+#   scope 'html'/'js': patterns are literal substrings of file contents,
+#                    or regular expressions when prefixed with 're:'
+FRAMEWORK_SIGNATURES = [
+    {'scope': 'package', 'name': 'React', 'buckets': ['frameworks', 'technologies'], 'version': True, 'patterns': ['react']},
+    {'scope': 'package', 'name': 'Vue.js', 'buckets': ['frameworks', 'technologies'], 'version': True, 'patterns': ['vue']},
+    {'scope': 'package', 'name': 'Angular', 'buckets': ['frameworks', 'technologies'], 'version': True, 'patterns': ['@angular/core']},
+    {'scope': 'package', 'name': 'Svelte', 'buckets': ['frameworks', 'technologies'], 'version': True, 'patterns': ['svelte']},
+    {'scope': 'package', 'name': 'Next.js', 'buckets': ['frameworks', 'technologies'], 'version': True, 'patterns': ['next']},
+    {'scope': 'package', 'name': 'Nuxt.js', 'buckets': ['frameworks', 'technologies'], 'version': True, 'patterns': ['nuxt']},
+    {'scope': 'package', 'name': 'jQuery', 'buckets': ['frameworks', 'technologies'], 'version': True, 'patterns': ['jquery']},
+    {'scope': 'package', 'name': 'Bootstrap', 'buckets': ['technologies'], 'patterns': ['bootstrap']},
+    {'scope': 'package', 'name': 'Tailwind CSS', 'buckets': ['technologies'], 'patterns': ['tailwindcss', 'tailwind']},
+    {'scope': 'package', 'name': 'TypeScript', 'buckets': ['technologies'], 'version': True, 'patterns': ['dev:typescript']},
+    {'scope': 'package', 'name': 'Webpack', 'buckets': ['technologies'], 'patterns': ['dev:webpack']},
+    {'scope': 'package', 'name': 'Babel', 'buckets': ['technologies'], 'patterns': ['babel', 'dev:@babel/core']},
+    
+    {'scope': 'html', 'name': 'React', 'buckets': ['frameworks'], 'patterns': ['unpkg.com/react', 'cdnjs.cloudflare.com/ajax/libs/react']},
+    {'scope': 'html', 'name': 'Vue.js', 'buckets': ['frameworks'], 'patterns': ['unpkg.com/vue', 'cdnjs.cloudflare.com/ajax/libs/vue']},
+    {'scope': 'html', 'name': 'Angular', 'buckets': ['frameworks'], 'patterns': ['unpkg.com/@angular', 'cdnjs.cloudflare.com/ajax/libs/angular']},
+    {'scope': 'html', 'name': 'jQuery', 'buckets': ['frameworks'], 'patterns': ['code.jquery.com', 'cdnjs.cloudflare.com/ajax/libs/jquery']},
+    {'scope': 'html', 'name': 'Svelte', 'buckets': ['frameworks'], 'patterns': ['unpkg.com/svelte', '@sveltejs']},
+    {'scope': 'html', 'name': 'Bootstrap', 'buckets': ['technologies'], 'patterns': ['bootstrap.min.css', 'bootstrap.css']},
+    {'scope': 'html', 'name': 'Tailwind CSS', 'buckets': ['technologies'], 'patterns': ['tailwindcss']},
+    
+    {'scope': 'js', 'name': 'React', 'buckets': ['frameworks'],
+     'patterns': ['import react', 'from "react"', "from 'react'", 'require("react")', 'JSX', 'ReactDOM']},
+    {'scope': 'js', 'name': 'Vue.js', 'buckets': ['frameworks'],
+     'patterns': ['import vue', 'from "vue"', "from 'vue'", 'Vue.component', 'new Vue({']},
+    {'scope': 'js', 'name': 'Angular', 'buckets': ['frameworks'],
+     'patterns': ['@angular/', "from '@angular", 're:import\\s[^\\n]*from\\s*[\'"]@angular', 'NgModule']},
+    {'scope': 'js', 'name': 'jQuery', 'buckets': ['frameworks'],
+     'patterns': ['jQuery(', 'require("jquery")', 're:import\\s[^\\n]*[\'"]jquery[\'"]']},
+    {'scope': 'js', 'name': 'Svelte', 'buckets': ['frameworks'],
+     'patterns': ['svelte/', '@sveltejs', 're:import\\s[^\\n]*[\'"]svelte']},
+]
+
+
+class SignatureMatcher:
+    """Find every content signature of one scope in a single pass over a file
+    
+    Literal patterns go into one Aho-Corasick automaton when pyahocorasick is
+    installed and the table is large enough for a single pass to beat repeated
+    substring searches (each `in` is a fast C scan, so small tables stay on those;
+    `builder.py bench-signatures` measures the crossover); 're:' patterns are
+    compiled regular expressions.
+    """
+    
+    AUTOMATON_MIN_PATTERNS = 32
+    
+    def __init__(self, signatures, automaton=None):
+        """automaton: True/False to force either literal search, None to pick by table size"""
+        self.signatures = signatures
+        self.literals = []
+        self.regexes = []
+        for index, signature in enumerate(signatures):
+            for pattern in signature['patterns']:
+                if pattern.startswith('re:'):
+                    self.regexes.append((re.compile(pattern[3:]), index))
+                else:
+                    self.literals.append((pattern, index))
+        
+        if automaton is None:
+            automaton = HAS_AHOCORASICK and len(self.literals) >= self.AUTOMATON_MIN_PATTERNS
+        self.automaton = None
+        if automaton:
+            import ahocorasick
+            self.automaton = ahocorasick.Automaton()
+            for pattern, index in self.literals:
+                # Several signatures may share a literal
+                indexes = self.automaton.get(pattern, ())
+                self.automaton.add_word(pattern, indexes + (index,))
+            self.automaton.make_automaton()
+    
+    def scan(self, text):
+        """Signatures present in text, in table order"""
+        found = set()
+        total = len(self.signatures)
+        
+        if self.automaton is not None:
+            for _, indexes in self.automaton.iter(text):
+                found.update(indexes)
+                if len(found) == total:
+                    break
+        else:
+            for pattern, index in self.literals:
+                if index not in found and pattern in text:
+                    found.add(index)
+        
+        for regex, index in self.regexes:
+            if index not in found and regex.search(text):
+                found.add(index)
+        
+        return [self.signatures[index] for index in sorted(found)]
+
+
 class ProjectAnalyzer:
     """Analyze project to detect framework, version, and technology stack"""
     
-    def __init__(self, folder_path):
+    SKIP_DIRS = {'node_modules', '.git', '.vscode', '__pycache__', 'dist', 'build'}
+    
+    # Extension -> detector that inspects the file contents
+    CONTENT_DETECTORS = {
+        '.html': '_detect_html',
+        '.js': '_detect_js',
+        '.jsx': '_detect_js',
+        '.ts': '_detect_js',
+        '.tsx': '_detect_js',
+    }
+    
+    # Extension -> technology implied by the file type alone
+    EXTENSION_TECHNOLOGIES = {
+        '.ts': 'TypeScript',
+        '.tsx': 'TypeScript',
+        '.scss': 'SASS',
+        '.sass': 'SASS',
+        '.less': 'Less',
+    }
+    
+    # Compiled SignatureMatcher per scope, shared by all analyzers
+    _matchers = {}
+    
+    DEFAULT_CACHE = object()
+    
+    ASSET_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.ico')
+    
+    def __init__(self, folder_path, max_workers=None, cache_path=DEFAULT_CACHE):
         self.folder_path = os.path.abspath(folder_path)
+        self.max_workers = max_workers
+        # Per-file results from earlier runs; re-analysis only opens changed files
+        if cache_path is ProjectAnalyzer.DEFAULT_CACHE:
+            cache_path = self.default_cache_path(self.folder_path)
+        self.cache_path = cache_path
+        self.cache_entries = {}
+        self.cache_stats = {}
         self.frameworks = []
         self.versions = {}
         self.dependencies = {}
         self.project_type = 'Unknown'
+        # File listing gathered during the analysis walk (used by scan_folder)
+        self.files = {'html': [], 'css': [], 'js': [], 'assets': [], 'total': 0}
+    
+    @staticmethod
+    def default_cache_path(folder_path):
+        """Analysis cache for a source folder, kept beside the project metadata folders
+        
+        Keyed by folder rather than project: scan-folder and analyze-project run
+        before a project.json exists, and create-project analyzes the same folder.
+        """
+        folder_key = hashlib.sha1(os.path.normcase(folder_path).encode('utf-8')).hexdigest()[:16]
+        return os.path.join(os.path.expanduser('~'), 'Documents', 'HTML2EXE', '.analysis-cache', f'{folder_key}.json')
     
     def analyze(self):
         """Run comprehensive analysis on project"""
@@ -1011,14 +1225,8 @@ class ProjectAnalyzer:
         # Check package.json first
         self._analyze_package_json(analysis)
         
-        # Check HTML files for framework indicators
-        self._analyze_html_files(analysis)
-        
-        # Check JS files for imports and framework usage
-        self._analyze_js_files(analysis)
-        
-        # Analyze CSS files
-        self._analyze_css_files(analysis)
+        # One walk over the tree: list files and run per-type detectors
+        self._analyze_files(analysis)
         
         # Determine project type
         self._determine_project_type(analysis)
@@ -1041,151 +1249,191 @@ class ProjectAnalyzer:
                 analysis['dependencies'] = all_deps
                 
                 # Detect frameworks from dependencies
-                if 'react' in all_deps:
-                    analysis['frameworks'].append('React')
-                    analysis['versions']['React'] = all_deps.get('react', 'unknown')
-                    analysis['technologies'].append('React')
-                
-                if 'vue' in all_deps:
-                    analysis['frameworks'].append('Vue.js')
-                    analysis['versions']['Vue.js'] = all_deps.get('vue', 'unknown')
-                    analysis['technologies'].append('Vue.js')
-                
-                if '@angular/core' in all_deps:
-                    analysis['frameworks'].append('Angular')
-                    analysis['versions']['Angular'] = all_deps.get('@angular/core', 'unknown')
-                    analysis['technologies'].append('Angular')
-                
-                if 'svelte' in all_deps:
-                    analysis['frameworks'].append('Svelte')
-                    analysis['versions']['Svelte'] = all_deps.get('svelte', 'unknown')
-                    analysis['technologies'].append('Svelte')
-                
-                if 'next' in all_deps:
-                    analysis['frameworks'].append('Next.js')
-                    analysis['versions']['Next.js'] = all_deps.get('next', 'unknown')
-                    analysis['technologies'].append('Next.js')
-                
-                if 'nuxt' in all_deps:
-                    analysis['frameworks'].append('Nuxt.js')
-                    analysis['versions']['Nuxt.js'] = all_deps.get('nuxt', 'unknown')
-                    analysis['technologies'].append('Nuxt.js')
-                
-                if 'jquery' in all_deps:
-                    analysis['frameworks'].append('jQuery')
-                    analysis['versions']['jQuery'] = all_deps.get('jquery', 'unknown')
-                    analysis['technologies'].append('jQuery')
-                
-                if 'bootstrap' in all_deps:
-                    analysis['technologies'].append('Bootstrap')
-                
-                if 'tailwindcss' in all_deps or 'tailwind' in all_deps:
-                    analysis['technologies'].append('Tailwind CSS')
-                
-                if 'typescript' in dev_dependencies:
-                    analysis['technologies'].append('TypeScript')
-                    analysis['versions']['TypeScript'] = dev_dependencies.get('typescript', 'unknown')
-                
-                if 'webpack' in dev_dependencies:
-                    analysis['technologies'].append('Webpack')
-                
-                if 'babel' in all_deps or '@babel/core' in dev_dependencies:
-                    analysis['technologies'].append('Babel')
+                for signature in FRAMEWORK_SIGNATURES:
+                    if signature['scope'] != 'package':
+                        continue
+                    for pattern in signature['patterns']:
+                        deps = dev_dependencies if pattern.startswith('dev:') else all_deps
+                        dep_name = pattern[4:] if pattern.startswith('dev:') else pattern
+                        if dep_name in deps:
+                            for bucket in signature['buckets']:
+                                analysis[bucket].append(signature['name'])
+                            if signature.get('version'):
+                                analysis['versions'][signature['name']] = deps.get(dep_name, 'unknown')
+                            break
             
             except json.JSONDecodeError:
                 pass
     
-    def _analyze_html_files(self, analysis):
-        """Analyze HTML files for framework indicators"""
-        for root, dirs, files in os.walk(self.folder_path):
-            dirs[:] = [d for d in dirs if d not in ['node_modules', '.git', 'dist', 'build']]
-            
-            for file in files:
-                if file.endswith('.html'):
-                    file_path = os.path.join(root, file)
-                    try:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            content = f.read()
-                        
-                        # Check for framework CDN/imports (look for specific CDN URLs or import statements)
-                        if 'unpkg.com/react' in content or 'cdnjs.cloudflare.com/ajax/libs/react' in content:
-                            if 'React' not in analysis['frameworks']:
-                                analysis['frameworks'].append('React')
-                        
-                        if 'unpkg.com/vue' in content or 'cdnjs.cloudflare.com/ajax/libs/vue' in content:
-                            if 'Vue.js' not in analysis['frameworks']:
-                                analysis['frameworks'].append('Vue.js')
-                        
-                        if 'unpkg.com/@angular' in content or 'cdnjs.cloudflare.com/ajax/libs/angular' in content:
-                            if 'Angular' not in analysis['frameworks']:
-                                analysis['frameworks'].append('Angular')
-                        
-                        if 'code.jquery.com' in content or 'cdnjs.cloudflare.com/ajax/libs/jquery' in content:
-                            if 'jQuery' not in analysis['frameworks']:
-                                analysis['frameworks'].append('jQuery')
-                        
-                        if 'unpkg.com/svelte' in content or '@sveltejs' in content:
-                            if 'Svelte' not in analysis['frameworks']:
-                                analysis['frameworks'].append('Svelte')
-                        
-                        if 'bootstrap.min.css' in content or 'bootstrap.css' in content:
-                            if 'Bootstrap' not in analysis['technologies']:
-                                analysis['technologies'].append('Bootstrap')
-                        
-                        if 'tailwindcss' in content:
-                            if 'Tailwind CSS' not in analysis['technologies']:
-                                analysis['technologies'].append('Tailwind CSS')
-                    
-                    except Exception:
-                        pass
-    
-    def _analyze_js_files(self, analysis):
-        """Analyze JS files for imports and framework usage"""
-        js_patterns = {
-            'React': ['import react', 'from "react"', 'from \'react\'', 'require("react")', 'JSX', 'ReactDOM'],
-            'Vue.js': ['import vue', 'from "vue"', 'from \'vue\'', 'Vue.component', 'new Vue({'],
-            'Angular': ['@angular/', 'from \'@angular', 'import.*from \'@angular', 'NgModule'],
-            'jQuery': ['jQuery(', 'require("jquery")', 'import.*jquery'],
-            'Svelte': ['svelte/', '@sveltejs', 'import.*svelte'],
-            'TypeScript': ['.ts', '.tsx'],
-        }
+    def _walk(self):
+        """Single traversal: record the file listing and pick files to inspect
+        
+        Uses scandir directly (same top-down order as os.walk) so the size/mtime
+        needed by the analysis cache come from the directory listing.
+        """
+        to_read = []
+        extension_techs = []
+        stack = [(self.folder_path, '')]
         
-        for root, dirs, files in os.walk(self.folder_path):
-            dirs[:] = [d for d in dirs if d not in ['node_modules', '.git', 'dist', 'build']]
+        while stack:
+            root, rel_root = stack.pop()
+            try:
+                entries = list(os.scandir(root))
+            except OSError:
+                continue
             
-            for file in files:
-                if file.endswith(('.js', '.jsx', '.ts', '.tsx')):
-                    file_path = os.path.join(root, file)
+            subdirs = []
+            for entry in entries:
+                try:
+                    # Like os.walk: symlinked folders are listed, not followed (they may loop)
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in self.SKIP_DIRS:
+                            subdirs.append((entry.path, os.path.join(rel_root, entry.name) if rel_root else entry.name))
+                        continue
+                    if entry.is_dir():
+                        continue
+                except OSError:
+                    continue
+                
+                file = entry.name
+                self.files['total'] += 1
+                rel_path = os.path.join(rel_root, file) if rel_root else file
+                ext = os.path.splitext(file)[1].lower()
+                
+                if ext == '.html':
+                    self.files['html'].append(rel_path)
+                elif ext in ('.css', '.scss', '.sass'):
+                    self.files['css'].append(rel_path)
+                elif ext == '.js':
+                    self.files['js'].append(rel_path)
+                elif ext in self.ASSET_EXTENSIONS:
+                    self.files['assets'].append(rel_path)
+                
+                if ext in self.CONTENT_DETECTORS:
                     try:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            content = f.read()
-                        
-                        # Check for framework imports (case-sensitive for accuracy)
-                        for framework, patterns in js_patterns.items():
-                            for pattern in patterns:
-                                if pattern in content:  # Case-sensitive matching
-                                    if framework not in analysis['frameworks'] and framework not in analysis['technologies']:
-                                        if framework in ['React', 'Vue.js', 'Angular', 'jQuery', 'Svelte']:
-                                            if framework not in analysis['frameworks']:
-                                                analysis['frameworks'].append(framework)
-                                        else:
-                                            if framework not in analysis['technologies']:
-                                                analysis['technologies'].append(framework)
-                    
-                    except Exception:
-                        pass
-    
-    def _analyze_css_files(self, analysis):
-        """Analyze CSS files for preprocessors and frameworks"""
-        for root, dirs, files in os.walk(self.folder_path):
-            dirs[:] = [d for d in dirs if d not in ['node_modules', '.git', 'dist', 'build']]
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    to_read.append((entry.path, rel_path.replace(os.sep, '/'), self.CONTENT_DETECTORS[ext],
+                                    stat.st_size, stat.st_mtime_ns))
+                if ext in self.EXTENSION_TECHNOLOGIES:
+                    extension_techs.append(self.EXTENSION_TECHNOLOGIES[ext])
             
-            for file in files:
-                if file.endswith(('.scss', '.sass', '.less')):
-                    ext = file.split('.')[-1]
-                    tech_name = 'SASS' if ext in ['scss', 'sass'] else 'Less'
-                    if tech_name not in analysis['technologies']:
-                        analysis['technologies'].append(tech_name)
+            # Depth-first, first subdirectory on top of the stack
+            stack.extend(reversed(subdirs))
+        
+        return to_read, extension_techs
+    
+    def _scan_files(self, batch):
+        """Read a batch of files and return a cache entry (markers, hash, ...) for each"""
+        results = []
+        for file_path, rel_path, detector, size, mtime_ns in batch:
+            entry = {'detector': detector, 'size': size, 'mtime': mtime_ns, 'hash': None, 'markers': []}
+            try:
+                with open(file_path, 'rb') as f:
+                    raw = f.read()
+            except Exception:
+                results.append(entry)
+                continue
+            entry['hash'] = hashlib.sha1(raw).hexdigest()
+            cached = self.cache_entries.get(rel_path)
+            if cached and cached.get('hash') == entry['hash'] and cached.get('detector') == detector:
+                # Touched but not modified: keep the previous markers
+                entry['markers'] = cached['markers']
+            else:
+                content = raw.decode('utf-8', errors='ignore')
+                entry['markers'] = [list(marker) for marker in getattr(self, detector)(content)]
+            results.append(entry)
+        return results
+    
+    def _analyze_files(self, analysis, batch_size=128):
+        """Dispatch files to detectors, reusing cached results for unchanged files"""
+        to_read, extension_techs = self._walk()
+        self._load_cache()
+        
+        entries = {}
+        changed = []
+        for item in to_read:
+            file_path, rel_path, detector, size, mtime_ns = item
+            cached = self.cache_entries.get(rel_path)
+            if cached and cached['size'] == size and cached['mtime'] == mtime_ns and cached['detector'] == detector:
+                entries[rel_path] = cached
+            else:
+                changed.append(item)
+        
+        # Batches keep per-task overhead low on trees with tens of thousands of files
+        if changed:
+            batches = [changed[i:i + batch_size] for i in range(0, len(changed), batch_size)]
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                for batch, results in zip(batches, pool.map(self._scan_files, batches)):
+                    for item, entry in zip(batch, results):
+                        entries[item[1]] = entry
+        
+        self.cache_stats = {'files': len(to_read), 'reused': len(to_read) - len(changed), 'read': len(changed)}
+        if changed or len(entries) != len(self.cache_entries):
+            self._save_cache(entries)
+        
+        # Merge HTML findings before JS ones so list order matches file type priority
+        for detector in ('_detect_html', '_detect_js'):
+            for file_path, rel_path, file_detector, size, mtime_ns in to_read:
+                if file_detector != detector:
+                    continue
+                for bucket, name in entries[rel_path]['markers']:
+                    if name not in analysis[bucket]:
+                        analysis[bucket].append(name)
+        
+        for tech_name in extension_techs:
+            if tech_name not in analysis['technologies']:
+                analysis['technologies'].append(tech_name)
+    
+    @staticmethod
+    def _signature_version():
+        """Cached markers are only valid for the signature table that produced them"""
+        return hashlib.sha1(json.dumps(FRAMEWORK_SIGNATURES, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+    
+    def _load_cache(self):
+        self.cache_entries = {}
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if cache.get('signatures') == self._signature_version() and cache.get('folder') == self.folder_path:
+            self.cache_entries = cache.get('files', {})
+    
+    def _save_cache(self, entries):
+        if not self.cache_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp_path = f'{self.cache_path}.{uuid.uuid4().hex}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'signatures': self._signature_version(), 'folder': self.folder_path, 'files': entries},
+                          f, separators=(',', ':'))
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"⚠️  Could not save analysis cache: {e}")
+    
+    @classmethod
+    def _matcher(cls, scope):
+        if scope not in cls._matchers:
+            cls._matchers[scope] = SignatureMatcher([s for s in FRAMEWORK_SIGNATURES if s['scope'] == scope])
+        return cls._matchers[scope]
+    
+    def _detect(self, scope, content):
+        return [(bucket, signature['name'])
+                for signature in self._matcher(scope).scan(content)
+                for bucket in signature['buckets']]
+    
+    def _detect_html(self, content):
+        """Framework indicators in HTML (CDN URLs or import statements)"""
+        return self._detect('html', content)
+    
+    def _detect_js(self, content):
+        """Framework imports and usage in JS/TS files"""
+        return self._detect('js', content)
     
     def _determine_project_type(self, analysis):
         """Determine overall project type"""
@@ -1211,185 +1459,4522 @@ class ProjectAnalyzer:
             analysis['projectType'] = 'jQuery Application'
 
 
-class HTMLToEXEBuilder:
-    """Main builder application"""
+class PythonImportScanner:
+    """Import graph of a Python project, parsed with ast, for PyInstaller's hidden imports and excludes
     
-    def __init__(self, projects_dir='projects', port=8000):
-        self.projects_dir = os.path.abspath(projects_dir)
-        self.port = port
-        self.server_url = f"http://localhost:{port}"
+    Every module under the project root is parsed (changed files on a process pool)
+    and its imports resolved, relative ones against the module's own package.
+    Walking the graph from the entry point gives the modules the app can load:
+    string imports among them (importlib.import_module, __import__) become
+    hiddenimports, third-party imports are mapped to installed distributions, and
+    heavy optional packages outside those distributions' dependencies become
+    excludes. The same pass records the data files the reachable modules refer to
+    (open(), pathlib/os.path joins, importlib.resources, pkgutil.get_data) so only
+    those are bundled. Per-file results are cached by size/mtime and content hash.
+    """
+    
+    SKIP_DIRS = {'venv', '.venv', 'env', '__pycache__', '.git', 'build', 'dist', 'node_modules'}
+    
+    # Bump when the cached per-file format changes
+    FORMAT_VERSION = 2
+    
+    # Below this many changed files a process pool costs more than it saves
+    PARALLEL_MIN_FILES = 64
+    BATCH_SIZE = 32
+    
+    # Stdlib packages that only ship when something imports them
+    OPTIONAL_STDLIB = ('tkinter', 'test', 'idlelib', 'turtledemo', 'lib2to3', 'pydoc_data', 'ensurepip')
+    # Large packages that libraries import opportunistically (try/except ImportError)
+    OPTIONAL_PACKAGES = ('matplotlib', 'IPython', 'PyQt5', 'PyQt6', 'PySide2', 'PySide6',
+                         'numpy', 'pandas', 'scipy', 'notebook', 'jedi')
+    
+    # Import strength, strongest last: a module imported both ways counts as 'import'
+    KINDS = ('typing', 'optional', 'import')
+    
+    # Optional include/exclude globs for data files, at the project root
+    MANIFEST_NAME = 'html2exe.json'
+    CODE_EXTENSIONS = ('.py', '.pyc', '.pyo')
+    # Module-level helpers that take (package, resource name)
+    RESOURCE_MODULES = {'resources', 'importlib.resources', 'importlib_resources', 'pkgutil', 'pkg_resources'}
+    RESOURCE_FUNCTIONS = {'read_text', 'read_binary', 'open_text', 'open_binary', 'path', 'is_resource',
+                          'get_data', 'resource_filename', 'resource_string', 'resource_stream'}
+    
+    DEFAULT_CACHE = object()
+    
+    _packages_distributions = None
+    
+    def __init__(self, project_path, max_workers=None, cache_path=DEFAULT_CACHE):
+        self.project_path = os.path.abspath(project_path)
+        self.max_workers = max_workers
+        if cache_path is PythonImportScanner.DEFAULT_CACHE:
+            cache_path = self.default_cache_path(self.project_path)
+        self.cache_path = cache_path
+        self.cache_entries = {}
+        self.cache_stats = {}
+    
+    @staticmethod
+    def default_cache_path(project_path):
+        folder_key = hashlib.sha1(os.path.normcase(project_path).encode('utf-8')).hexdigest()[:16]
+        return os.path.join(os.path.expanduser('~'), 'Documents', 'HTML2EXE', '.analysis-cache',
+                            f'{folder_key}-imports.json')
+    
+    def scan(self, entry_point, include=(), exclude=()):
+        """Hidden imports, excludes, distributions, missing modules and data files for the app started by entry_point
         
-        # Create projects directory if it doesn't exist
-        os.makedirs(self.projects_dir, exist_ok=True)
+        include/exclude are data file globs relative to the project root (see load_manifest).
+        """
+        import importlib.metadata
+        modules = self._walk()
+        entries = self._parse(modules)
+        
+        entry_module = self.module_name(entry_point)[0]
+        project_tops = {module.split('.')[0] for module in modules}
+        reachable, external, hidden = set(), {}, set()
+        imported_names, candidates = set(), set()
+        references = []
+        queue = [entry_module]
+        while queue:
+            module = queue.pop()
+            if module in reachable or module not in modules:
+                continue
+            reachable.add(module)
+            # Importing a.b.c runs a/__init__ and a/b/__init__ first
+            parts = module.split('.')
+            queue.extend('.'.join(parts[:i]) for i in range(1, len(parts)))
+            
+            entry = entries[modules[module][0]]
+            for name, kind, exact in entry['imports']:
+                if name in modules:
+                    queue.append(name)
+                elif exact and name.split('.')[0] not in project_tops:
+                    top = name.split('.')[0]
+                    if self.KINDS.index(kind) >= self.KINDS.index(external.get(top, 'typing')):
+                        external[top] = kind
+                    if kind != 'typing':
+                        imported_names.add(name)
+                elif kind != 'typing' and name.split('.')[0] not in project_tops:
+                    candidates.add(name)
+            for name in entry['dynamic']:
+                hidden.add(name)
+                if name in modules:
+                    queue.append(name)
+            references.extend((modules[module][0], reference) for reference in entry['data'])
+        
+        stdlib = getattr(sys, 'stdlib_module_names', set())
+        top_distributions = self.packages_distributions()
+        used, missing = set(), set()
+        for top, kind in external.items():
+            if top in stdlib or top in sys.builtin_module_names:
+                continue
+            if top in top_distributions:
+                if kind != 'typing':
+                    used.update(top_distributions[top])
+            elif kind == 'import' and importlib.util.find_spec(top) is None:
+                missing.add(top)
+        for name in hidden:
+            top = name.split('.')[0]
+            if top in project_tops or top in stdlib:
+                continue
+            if top in top_distributions:
+                used.update(top_distributions[top])
+            elif importlib.util.find_spec(top) is None:
+                missing.add(name)
+        
+        closure = self.requirement_closure(used)
+        imported = {top for top, kind in external.items() if kind != 'typing'} | {name.split('.')[0] for name in hidden}
+        excludes = {name for name in self.OPTIONAL_STDLIB if name not in imported}
+        if closure:
+            # Only the project's own imports are scanned, and installed packages
+            # (customtkinter, PySimpleGUI, ttkbootstrap, ...) may import tkinter themselves
+            excludes.discard('tkinter')
+        for name in self.OPTIONAL_PACKAGES:
+            if name not in imported and name in top_distributions \
+                    and not {self.normalize(dist) for dist in top_distributions[name]} & closure:
+                excludes.add(name)
+        # Imported only under `if TYPE_CHECKING:` never runs, but PyInstaller would still follow it
+        for top, kind in external.items():
+            if kind == 'typing' and not {self.normalize(d) for d in top_distributions.get(top, [])} & closure:
+                excludes.add(top)
+        excludes -= project_tops
+        
+        # Everything outside the project the reachable code imports: a layered build
+        # freezes exactly this set into its dependency layer
+        imports = imported_names | {name for name in hidden if name.split('.')[0] not in project_tops}
+        imports |= {name for name in candidates if self.module_exists(name)}
+        available = {}
+        for top in {name.split('.')[0] for name in imports}:
+            available[top] = top not in excludes and (top in stdlib or top in sys.builtin_module_names
+                                                      or importlib.util.find_spec(top) is not None)
+        imports = sorted(name for name in imports if available[name.split('.')[0]])
+        
+        distributions = {}
+        for dist in sorted(used):
+            try:
+                distributions[dist] = importlib.metadata.version(dist)
+            except importlib.metadata.PackageNotFoundError:
+                pass
+        
+        return {
+            'entry': entry_module,
+            'modules': len(modules),
+            'reachable': len(reachable),
+            'parsed': self.cache_stats.get('parsed', 0),
+            'reused': self.cache_stats.get('reused', 0),
+            'hiddenimports': sorted(hidden),
+            'excludes': sorted(excludes),
+            'distributions': distributions,
+            'missing': sorted(missing),
+            'imports': imports,
+            'projectModules': sorted(modules[module][0] for module in reachable),
+            'dataReferences': len(references),
+            'dataFiles': self.data_files(references, modules, include, exclude),
+            'errors': {modules[m][0]: entries[modules[m][0]]['error']
+                       for m in sorted(reachable) if entries[modules[m][0]]['error']},
+        }
     
-    def start_server(self):
-        """Start HTTP server"""
-        # Handle both frozen (PyInstaller) and normal Python execution
-        if getattr(sys, 'frozen', False):
-            # Running as PyInstaller executable
-            builder_root = sys._MEIPASS
+    @classmethod
+    def load_manifest(cls, project_path, options=None):
+        """(include, exclude) data file globs from html2exe.json's "data" key plus request options
+        
+        Both take the same shape: {"include": [...], "exclude": [...]}. Raises ValueError
+        when the manifest is not valid JSON or the globs are not lists of strings.
+        """
+        include, exclude = [], []
+        sources = []
+        manifest_path = os.path.join(project_path, cls.MANIFEST_NAME)
+        if os.path.isfile(manifest_path):
+            try:
+                with open(manifest_path, 'r', encoding='utf-8') as f:
+                    sources.append((cls.MANIFEST_NAME, json.load(f).get('data') or {}))
+            except (OSError, ValueError, AttributeError) as e:
+                raise ValueError(f'{cls.MANIFEST_NAME}: {e}')
+        if options:
+            sources.append(('dataFiles', options))
+        for source, section in sources:
+            if not isinstance(section, dict):
+                raise ValueError(f'{source}: expected an object with "include" and "exclude" lists')
+            for key, target in (('include', include), ('exclude', exclude)):
+                patterns = section.get(key) or []
+                if not isinstance(patterns, list) or not all(isinstance(p, str) for p in patterns):
+                    raise ValueError(f'{source}: "{key}" must be a list of glob strings')
+                target.extend(p.replace('\\', '/') for p in patterns)
+        return include, exclude
+    
+    @staticmethod
+    def _matches(rel_path, patterns):
+        """True if rel_path is matched by a glob or lies under a matched folder"""
+        import fnmatch
+        for pattern in patterns:
+            pattern = pattern.strip('/') if pattern.endswith('/') else pattern.lstrip('/')
+            if rel_path == pattern or rel_path.startswith(pattern + '/'):
+                return True
+            candidates = (pattern, pattern[3:]) if pattern.startswith('**/') else (pattern,)
+            if any(fnmatch.fnmatchcase(rel_path, p) or fnmatch.fnmatchcase(rel_path, p + '/*') for p in candidates):
+                return True
+        return False
+    
+    def _project_files(self, folder=''):
+        """Relative paths of the non-code files under a project folder"""
+        files = []
+        for root, dirs, names in os.walk(os.path.join(self.project_path, folder)):
+            dirs[:] = [d for d in dirs if d not in self.SKIP_DIRS]
+            for name in names:
+                if not name.endswith(self.CODE_EXTENSIONS):
+                    files.append(os.path.relpath(os.path.join(root, name), self.project_path).replace(os.sep, '/'))
+        return files
+    
+    def data_files(self, references, modules, include=(), exclude=()):
+        """Project files the references point at, plus manifest includes, minus manifest excludes
+        
+        references are (module path, [base, argument, path, is glob]) pairs from the
+        scan; paths outside the project and folders holding the module itself are ignored.
+        """
+        import glob
+        import posixpath
+        found = set()
+        for module_path, (base, argument, rel, is_glob) in references:
+            if base == 'root':
+                base_dir = ''
+            elif base == 'module':
+                base_dir = posixpath.dirname(module_path)
+            else:
+                package = modules.get(argument)
+                if not package or not package[2]:
+                    # Resources of installed packages are collected by PyInstaller's hooks
+                    continue
+                base_dir = posixpath.dirname(package[0])
+            rel = rel.replace('\\', '/')
+            if posixpath.isabs(rel) or re.match(r'^[A-Za-z]:', rel):
+                continue
+            path = posixpath.normpath(posixpath.join(base_dir, rel))
+            module_dir = posixpath.dirname(module_path)
+            if path == '.' or path == '..' or path.startswith('../') \
+                    or path == module_dir or module_dir.startswith(path + '/'):
+                continue
+            full_path = os.path.join(self.project_path, *path.split('/'))
+            candidates = glob.glob(full_path, recursive=True) if is_glob else [full_path]
+            for candidate in candidates:
+                candidate_rel = os.path.relpath(candidate, self.project_path).replace(os.sep, '/')
+                if os.path.isfile(candidate):
+                    if not candidate.endswith(self.CODE_EXTENSIONS) \
+                            and not set(candidate_rel.split('/')[:-1]) & self.SKIP_DIRS:
+                        found.add(candidate_rel)
+                elif os.path.isdir(candidate):
+                    found.update(self._project_files(candidate_rel))
+        
+        if include:
+            found.update(rel for rel in self._project_files() if self._matches(rel, include))
+        exclude = list(exclude)
+        if self.MANIFEST_NAME not in include:
+            exclude.append(self.MANIFEST_NAME)
+        return sorted(rel for rel in found if not self._matches(rel, exclude))
+    
+    @staticmethod
+    def module_exists(name):
+        """True if name is an installed module; parent packages are located, not imported"""
+        import importlib.machinery
+        parts = name.split('.')
+        try:
+            spec = importlib.util.find_spec(parts[0])
+        except (ImportError, ValueError):
+            return False
+        for i in range(1, len(parts)):
+            if spec is None or not spec.submodule_search_locations:
+                return False
+            spec = importlib.machinery.PathFinder.find_spec('.'.join(parts[:i + 1]),
+                                                            list(spec.submodule_search_locations))
+        return spec is not None
+    
+    @staticmethod
+    def module_name(rel_path):
+        """(dotted module name, is package) for a .py file relative to the project root"""
+        parts = rel_path.replace(os.sep, '/')[:-3].split('/')
+        if parts[-1] == '__init__' and len(parts) > 1:
+            return '.'.join(parts[:-1]), True
+        return '.'.join(parts), False
+    
+    def _walk(self):
+        """{module name: (relative path, absolute path, is package, size, mtime)} for every .py file"""
+        modules = {}
+        for root, dirs, files in os.walk(self.project_path):
+            dirs[:] = [d for d in dirs if d not in self.SKIP_DIRS]
+            for file in files:
+                if not file.endswith('.py'):
+                    continue
+                file_path = os.path.join(root, file)
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    continue
+                rel_path = os.path.relpath(file_path, self.project_path).replace(os.sep, '/')
+                module, is_package = self.module_name(rel_path)
+                modules[module] = (rel_path, file_path, is_package, stat.st_size, stat.st_mtime_ns)
+        return modules
+    
+    def _parse(self, modules):
+        """Cache entry per relative path: parse new or changed files, reuse the rest"""
+        self._load_cache()
+        entries = {}
+        changed = []
+        for module, (rel_path, file_path, is_package, size, mtime_ns) in modules.items():
+            cached = self.cache_entries.get(rel_path)
+            if cached and cached['size'] == size and cached['mtime'] == mtime_ns:
+                entries[rel_path] = cached
+            else:
+                changed.append((rel_path, file_path, module, is_package, size, mtime_ns,
+                                cached['hash'] if cached else None))
+        
+        workers = self.max_workers or os.cpu_count() or 1
+        if len(changed) >= self.PARALLEL_MIN_FILES and workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            batches = [changed[i:i + self.BATCH_SIZE] for i in range(0, len(changed), self.BATCH_SIZE)]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = [entry for batch in pool.map(PythonImportScanner._parse_batch, batches) for entry in batch]
         else:
-            # Running as normal Python script
-            builder_root = os.path.dirname(os.path.abspath(__file__))
+            results = PythonImportScanner._parse_batch(changed)
         
-        BuilderHTTPHandler.builder_root = builder_root
+        for item, entry in zip(changed, results):
+            rel_path = item[0]
+            if entry.pop('unchanged', False):
+                # Touched but not modified: keep the previous imports
+                entry.update(imports=self.cache_entries[rel_path]['imports'],
+                             dynamic=self.cache_entries[rel_path]['dynamic'],
+                             data=self.cache_entries[rel_path]['data'],
+                             error=self.cache_entries[rel_path]['error'])
+            entries[rel_path] = entry
         
-        server = HTTPServer(('localhost', self.port), BuilderHTTPHandler)
-        thread = threading.Thread(target=server.serve_forever, daemon=True)
-        thread.start()
+        self.cache_stats = {'files': len(modules), 'reused': len(modules) - len(changed), 'parsed': len(changed)}
+        if changed or len(entries) != len(self.cache_entries):
+            self._save_cache(entries)
+        return entries
+    
+    @staticmethod
+    def _parse_batch(batch):
+        """Worker: hash and parse a batch of files (runs in a pool process for large projects)"""
+        import ast
+        results = []
+        for rel_path, file_path, module, is_package, size, mtime_ns, cached_hash in batch:
+            entry = {'size': size, 'mtime': mtime_ns, 'hash': None, 'imports': [], 'dynamic': [], 'data': [],
+                     'error': None}
+            try:
+                with open(file_path, 'rb') as f:
+                    raw = f.read()
+            except OSError as e:
+                entry['error'] = str(e)
+                results.append(entry)
+                continue
+            entry['hash'] = hashlib.sha1(raw).hexdigest()
+            if entry['hash'] == cached_hash:
+                entry['unchanged'] = True
+            else:
+                try:
+                    tree = ast.parse(raw, filename=file_path)
+                    entry['imports'], entry['dynamic'] = PythonImportScanner._collect(tree, module, is_package)
+                    entry['data'] = PythonImportScanner._data_references(tree, module, is_package)
+                except (SyntaxError, ValueError, RecursionError) as e:
+                    entry['error'] = f'{e.__class__.__name__}: {e}'
+            results.append(entry)
+        return results
+    
+    @staticmethod
+    def _collect(tree, module, is_package):
+        """Imports of one parsed module
         
-        return server
+        Returns ([name, kind, exact] ..., [dynamic name ...]). kind is 'import',
+        'optional' (inside try/except ImportError) or 'typing' (under if TYPE_CHECKING).
+        exact is False for `from pkg import name` candidates that may be attributes.
+        """
+        import ast
+        package = module if is_package else module.rpartition('.')[0]
+        imports, dynamic = [], []
+        
+        def resolve(level, name):
+            if not level:
+                return name
+            parts = package.split('.') if package else []
+            if level - 1 > len(parts):
+                return None
+            base = '.'.join(parts[:len(parts) - (level - 1)])
+            return '.'.join(part for part in (base, name) if part) or None
+        
+        def catches_import_error(node):
+            for handler in node.handlers:
+                names = handler.type.elts if isinstance(handler.type, ast.Tuple) else [handler.type]
+                for name in names:
+                    if name is None or getattr(name, 'id', getattr(name, 'attr', None)) in (
+                            'ImportError', 'ModuleNotFoundError', 'Exception', 'BaseException'):
+                        return True
+            return False
+        
+        def is_type_checking(test):
+            return getattr(test, 'id', getattr(test, 'attr', None)) == 'TYPE_CHECKING'
+        
+        def dynamic_import(call):
+            func = call.func
+            func_name = getattr(func, 'id', getattr(func, 'attr', None))
+            if func_name not in ('import_module', '__import__') or not call.args:
+                return None
+            arg = call.args[0]
+            if not isinstance(arg, ast.Constant) or not isinstance(arg.value, str) or not arg.value.strip('.'):
+                return None
+            name = arg.value.lstrip('.')
+            return resolve(len(arg.value) - len(name), name)
+        
+        def visit(node, kind):
+            if isinstance(node, ast.Import):
+                imports.extend([alias.name, kind, True] for alias in node.names)
+            elif isinstance(node, ast.ImportFrom):
+                base = resolve(node.level, node.module)
+                if base:
+                    imports.append([base, kind, bool(node.module)])
+                    imports.extend([f'{base}.{alias.name}', kind, False] for alias in node.names if alias.name != '*')
+            elif isinstance(node, ast.Call):
+                name = dynamic_import(node)
+                if name:
+                    dynamic.append(name)
+            
+            if isinstance(node, ast.Try) or type(node).__name__ == 'TryStar':
+                if catches_import_error(node):
+                    for child in node.body:
+                        visit(child, 'optional' if kind == 'import' else kind)
+                    for child in node.handlers + node.orelse + node.finalbody:
+                        visit(child, kind)
+                    return
+            elif isinstance(node, ast.If) and is_type_checking(node.test):
+                for child in node.body:
+                    visit(child, 'typing')
+                for child in node.orelse:
+                    visit(child, kind)
+                return
+            for child in ast.iter_child_nodes(node):
+                visit(child, kind)
+        
+        visit(tree, 'import')
+        return imports, sorted(set(dynamic))
     
-    def launch_ui(self):
-        """Launch the builder UI in PyWebView"""
-        server = self.start_server()
+    @staticmethod
+    def _data_references(tree, module, is_package):
+        """Data file paths one parsed module refers to with string literals
         
-        # Get screen dimensions to center the window
+        Returns [base, argument, path, is glob] lists. base is 'root' (relative to the
+        working directory, taken as the project root), 'module' (relative to the
+        module's folder via __file__) or 'package' (argument is the dotted package name).
+        Simple `NAME = <path>` assignments are followed so later joins resolve.
+        """
+        import ast
+        file_name = '__init__.py' if is_package else module.rpartition('.')[2] + '.py'
+        names = {}
+        references = set()
+        
+        def text(node):
+            return node.value if isinstance(node, ast.Constant) and isinstance(node.value, str) else None
+        
+        def func_name(func):
+            return getattr(func, 'id', getattr(func, 'attr', None))
+        
+        def owner(func):
+            return ast.unparse(func.value) if isinstance(func, ast.Attribute) else None
+        
+        def package_base(node):
+            # __name__ / __package__ name the module's own folder
+            if isinstance(node, ast.Name) and node.id in ('__name__', '__package__'):
+                return ('module', '', '')
+            value = text(node)
+            return ('package', value, '') if value and not value.startswith('.') else None
+        
+        def join(base, parts):
+            if base is None or any(part is None for part in parts):
+                return None
+            return (base[0], base[1], '/'.join(part for part in (base[2], *parts) if part))
+        
+        def parent(base):
+            if base is None:
+                return None
+            parts = base[2].split('/') if base[2] else []
+            if parts and parts[-1] not in ('.', '..'):
+                parts.pop()
+            else:
+                parts.append('..')
+            return (base[0], base[1], '/'.join(parts))
+        
+        def path_of(node):
+            """(base, argument, path) for a path-valued expression, else None"""
+            value = text(node)
+            if value is not None:
+                return ('root', '', value)
+            if isinstance(node, ast.Name):
+                if node.id == '__file__':
+                    return ('module', '', file_name)
+                return names.get(node.id)
+            if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Div):
+                return join(path_of(node.left), [text(node.right)])
+            if isinstance(node, ast.Attribute) and node.attr == 'parent':
+                return parent(path_of(node.value))
+            if not isinstance(node, ast.Call) or node.keywords:
+                return None
+            name = func_name(node.func)
+            if name in ('Path', 'PurePath', 'PosixPath', 'WindowsPath') and node.args:
+                return join(path_of(node.args[0]), [text(arg) for arg in node.args[1:]])
+            if name == 'join' and node.args and owner(node.func) in ('os.path', 'path', 'posixpath', 'ntpath'):
+                return join(path_of(node.args[0]), [text(arg) for arg in node.args[1:]])
+            if name == 'joinpath' and isinstance(node.func, ast.Attribute):
+                return join(path_of(node.func.value), [text(arg) for arg in node.args])
+            if name == 'dirname' and len(node.args) == 1:
+                return parent(path_of(node.args[0]))
+            if name in ('abspath', 'realpath', 'normpath') and len(node.args) == 1:
+                return path_of(node.args[0])
+            if name in ('resolve', 'absolute') and not node.args and isinstance(node.func, ast.Attribute):
+                return path_of(node.func.value)
+            if name == 'files' and len(node.args) == 1:
+                return package_base(node.args[0])
+            return None
+        
+        def add(path, is_glob=False):
+            if path is not None and path[2]:
+                references.add((*path, is_glob))
+        
+        def visit(node):
+            if isinstance(node, (ast.Assign, ast.AnnAssign)) and node.value is not None:
+                targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+                if len(targets) == 1 and isinstance(targets[0], ast.Name):
+                    path = path_of(node.value)
+                    if path is not None:
+                        names[targets[0].id] = path
+                        return
+                    names.pop(targets[0].id, None)
+            elif isinstance(node, ast.Call):
+                name = func_name(node.func)
+                if name == 'open' and node.args and owner(node.func) in (None, 'io', 'codecs', 'builtins'):
+                    add(path_of(node.args[0]))
+                elif name in ('glob', 'iglob') and node.args and owner(node.func) in ('glob', None):
+                    add(path_of(node.args[0]), True)
+                elif name in ('glob', 'rglob') and len(node.args) == 1 and isinstance(node.func, ast.Attribute):
+                    pattern = text(node.args[0])
+                    if pattern is not None:
+                        add(join(path_of(node.func.value), ['**/' + pattern if name == 'rglob' else pattern]), True)
+                elif name in PythonImportScanner.RESOURCE_FUNCTIONS and len(node.args) >= 2 \
+                        and (owner(node.func) in PythonImportScanner.RESOURCE_MODULES
+                             or (owner(node.func) is None and name != 'path')):
+                    add(join(package_base(node.args[0]), [text(node.args[1])]))
+                elif name == 'Flask' and node.args:
+                    # Flask looks for templates/ and static/ beside the app's module
+                    references.add(('module', '', 'templates', False))
+                    references.add(('module', '', 'static', False))
+                elif path_of(node) is not None:
+                    add(path_of(node))
+                    return
+            elif isinstance(node, (ast.BinOp, ast.Attribute)) and path_of(node) is not None:
+                add(path_of(node))
+                return
+            elif isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load) and node.id in names \
+                    and names[node.id][0] != 'root':
+                add(names[node.id])
+            for child in ast.iter_child_nodes(node):
+                visit(child)
+        
+        visit(tree)
+        return sorted(list(reference) for reference in references)
+    
+    @staticmethod
+    def normalize(dist):
+        return re.sub(r'[-_.]+', '-', dist).lower()
+    
+    @classmethod
+    def packages_distributions(cls):
+        """Top-level import name -> distributions providing it, for the builder's environment"""
+        if cls._packages_distributions is None:
+            import importlib.metadata
+            mapping = getattr(importlib.metadata, 'packages_distributions', None)
+            cls._packages_distributions = mapping() if mapping else {}
+        return cls._packages_distributions
+    
+    @classmethod
+    def requirement_closure(cls, dists):
+        """Normalized names of dists and everything they require (extras excluded)"""
+        import importlib.metadata
+        closure = set()
+        pending = list(dists)
+        while pending:
+            dist = pending.pop()
+            if cls.normalize(dist) in closure:
+                continue
+            closure.add(cls.normalize(dist))
+            try:
+                requirements = importlib.metadata.requires(dist) or []
+            except importlib.metadata.PackageNotFoundError:
+                continue
+            for requirement in requirements:
+                spec, _, marker = requirement.partition(';')
+                if 'extra' in marker:
+                    continue
+                match = re.match(r'\s*([A-Za-z0-9][A-Za-z0-9._-]*)', spec)
+                if match:
+                    pending.append(match.group(1))
+        return closure
+    
+    def _load_cache(self):
+        self.cache_entries = {}
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
         try:
-            # Get monitor dimensions using tkinter
-            root = tk.Tk()
-            root.withdraw()  # Hide the window
-            screen_width = root.winfo_screenwidth()
-            screen_height = root.winfo_screenheight()
-            root.destroy()
-            
-            # Calculate center position
-            window_width = 1800
-            window_height = 1200
-            x_position = (screen_width - window_width) // 2
-            y_position = (screen_height - window_height) // 2
-            
-            print(f"Monitor resolution: {screen_width}x{screen_height}")
-            print(f"Window position: ({x_position}, {y_position})")
-        except Exception as e:
-            print(f"Warning: Could not get screen dimensions: {e}")
-            x_position = 100
-            y_position = 100
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if cache.get('format') == self.FORMAT_VERSION and cache.get('folder') == self.project_path:
+            self.cache_entries = cache.get('files', {})
+    
+    def _save_cache(self, entries):
+        if not self.cache_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp_path = f'{self.cache_path}.{uuid.uuid4().hex}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'format': self.FORMAT_VERSION, 'folder': self.project_path, 'files': entries},
+                          f, separators=(',', ':'))
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"⚠️  Could not save import cache: {e}")
+
+
+class BuildJob:
+    """A single queued build with its state, timings and result"""
+    
+    MAX_EVENTS = 5000  # Oldest log lines are dropped past this; late subscribers miss them
+    
+    def __init__(self, kind, name, data):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.name = name
+        self.data = data
+        self.state = 'queued'
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.result = None
+        self.error = None
+        # Streamed to /api/jobs/<id>/events: (event id, event name, data)
+        self.events = []
+        self.next_event_id = 1
+        self.condition = threading.Condition()
+    
+    @property
+    def finished(self):
+        return self.state in ('succeeded', 'failed')
+    
+    def emit(self, event, data):
+        """Record an event (log line, phase progress, state change) and wake stream readers"""
+        with self.condition:
+            self.events.append((self.next_event_id, event, data))
+            self.next_event_id += 1
+            if len(self.events) > self.MAX_EVENTS:
+                del self.events[:len(self.events) - self.MAX_EVENTS]
+            self.condition.notify_all()
+    
+    def log(self, line):
+        self.emit('log', {'line': line})
+    
+    def set_state(self, state):
+        self.state = state
+        self.emit('state', self.to_dict())
+    
+    def events_after(self, last_id, timeout=None):
+        """Events newer than last_id, waiting up to timeout for one while the job is active
         
-        # Create window with frameless style and custom controls
-        window = webview.create_window(
-            title='HTML to EXE Builder',
-            url=self.server_url,
-            width=1800,
-            height=1200,
-            x=x_position,
-            y=y_position,
-            resizable=True,
-            min_size=(1024, 600),
-            frameless=True,
-            background_color='#E8EBF7'
-        )
+        Returns (events, finished); finished is read under the same lock, so once it is
+        True the returned events are the last the job will produce.
+        """
+        with self.condition:
+            if not self.finished and (not self.events or self.events[-1][0] <= last_id):
+                self.condition.wait(timeout)
+            return [e for e in self.events if e[0] > last_id], self.finished
+    
+    def to_dict(self):
+        """Serialize job for the jobs API (request data is left out, it may hold icon bytes)"""
+        def iso(ts):
+            return datetime.fromtimestamp(ts).isoformat() if ts else None
+        
+        now = time.time()
+        queued_seconds = (self.started_at or now) - self.submitted_at
+        run_seconds = None
+        if self.started_at:
+            run_seconds = (self.finished_at or now) - self.started_at
+        
+        return {
+            'id': self.id,
+            'kind': self.kind,
+            'name': self.name,
+            'state': self.state,
+            'submittedAt': iso(self.submitted_at),
+            'startedAt': iso(self.started_at),
+            'finishedAt': iso(self.finished_at),
+            'queuedSeconds': round(queued_seconds, 3),
+            'runSeconds': round(run_seconds, 3) if run_seconds is not None else None,
+            'result': self.result,
+            'error': self.error,
+        }
+
+
+class BuildJobQueue:
+    """Run builds on a pool of worker threads so API requests return immediately"""
+    
+    # Job kind -> HTMLToEXEBuilder method that performs the build
+    handlers = {
+        'build-project': 'build_project',
+        'convert-python-to-exe': 'convert_python_to_exe',
+    }
+    
+    def __init__(self, builder, max_workers=None, max_history=200):
+        self.builder = builder
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_history = max_history
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='build-worker')
+        self.jobs = {}
+        self.lock = threading.Lock()
+        # Builds that share an output exe or a build folder must not overlap
+        self.target_locks = {}
+    
+    def submit(self, kind, name, data):
+        """Queue a build and return its job"""
+        if kind not in self.handlers:
+            raise ValueError(f'Unknown job kind: {kind}')
+        
+        job = BuildJob(kind, name, data)
+        with self.lock:
+            self.jobs[job.id] = job
+            self._trim_history()
+        
+        self.executor.submit(self._run, job)
+        print(f"📥 Queued {kind} job {job.id} ({name})")
+        return job
+    
+    def get(self, job_id):
+        with self.lock:
+            return self.jobs.get(job_id)
+    
+    def list(self):
+        with self.lock:
+            return list(self.jobs.values())
+    
+    def shutdown(self, wait=False):
+        self.executor.shutdown(wait=wait, cancel_futures=True)
+    
+    def _target_keys(self, job):
+        """Resources a job writes to: its build folder and its output exe"""
+        if job.kind == 'build-project':
+            keys = [f"project:{job.data.get('projectId', '')}",
+                    f"exe:{job.data.get('projectName', '').replace(' ', '_')}"]
+        else:
+            keys = [f"exe:{job.data.get('exeName', 'MyApp')}"]
+        return sorted(set(keys))
+    
+    def _run(self, job):
+        with self.lock:
+            locks = [self.target_locks.setdefault(key, threading.Lock()) for key in self._target_keys(job)]
+        
+        for target_lock in locks:
+            target_lock.acquire()
+        try:
+            job.started_at = time.time()
+            job.set_state('running')
+            try:
+                result = getattr(self.builder, self.handlers[job.kind])(job.data, job=job)
+            except Exception as e:
+                result = {'error': f'Build error: {str(e)}'}
+            
+            job.result = result
+            job.error = result.get('error')
+            job.finished_at = time.time()
+            try:
+                self.builder.build_history.record(job.kind, job.name, result, job.started_at,
+                                                  job.finished_at, job_id=job.id)
+            except Exception as e:
+                print(f"⚠️  Could not record build history: {e}")
+            job.set_state('failed' if job.error else 'succeeded')
+            # Drop request payload (may contain icon data) once the job is done
+            job.data = {}
+            print(f"🏁 Job {job.id} {job.state} in {job.finished_at - job.started_at:.1f}s")
+        finally:
+            for target_lock in reversed(locks):
+                target_lock.release()
+    
+    def _trim_history(self):
+        """Forget the oldest finished jobs beyond max_history"""
+        finished = [j for j in self.jobs.values() if j.state in ('succeeded', 'failed')]
+        for job in finished[:max(0, len(finished) - self.max_history)]:
+            del self.jobs[job.id]
+
+
+class PyInstallerProcess:
+    """Run PyInstaller and stream its output, line by line, to a build job
+    
+    PyInstaller logs to stderr; it is merged into stdout and read as it is produced,
+    split into phases (Analysis, PYZ, PKG, EXE, COLLECT) and turned into percent
+    estimates that /api/jobs/<id>/events forwards to the UI while the build runs.
+    """
+    
+    # Phase name, log markers that start it, and the share of the build it covers (percent)
+    PHASES = [
+        ('Analysis', ('Initializing module dependency graph', 'Running Analysis'), 2, 60),
+        ('PYZ', ('Building PYZ',), 60, 72),
+        ('PKG', ('Building PKG',), 72, 90),
+        ('EXE', ('Building EXE',), 90, 98),
+        ('COLLECT', ('Building COLLECT',), 98, 100),
+    ]
+    PROGRESS_EVERY = 25     # log lines between percent updates inside a phase
+    PHASE_HALF_LIFE = 150   # log lines after which a phase is estimated half done
+    TAIL_LINES = 200
+    
+    # PyInstallerDaemon that `pyinstaller` commands go to when set (server and batch builds)
+    daemon = None
+    
+    def __init__(self, cmd, cwd=None, job=None):
+        self.cmd = cmd
+        self.cwd = cwd
+        self.job = job
+        self.returncode = None
+        self.tail_lines = deque(maxlen=self.TAIL_LINES)
+        self.phase = None
+        self.phase_index = -1
+        self.phase_started = None
+        self.phase_lines = 0
+        self.phase_times = {}
+        self.started = None
+        self.peak_rss = None
+    
+    def run(self):
+        """Run to completion and return the exit code"""
+        import subprocess
+        self.started = time.time()
+        self._emit_progress('Starting', 0)
+        if self.daemon and self.cmd[0] == 'pyinstaller':
+            result = self.daemon.run(self.cmd[1:], self.cwd, self.feed)
+            if result is not None:
+                self.returncode, self.peak_rss = result
+                self._end_phase()
+                self._emit_progress('Done' if self.returncode == 0 else 'Failed',
+                                    100 if self.returncode == 0 else None)
+                return self.returncode
+        process = subprocess.Popen(
+            self.cmd, cwd=self.cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, encoding='utf-8', errors='replace', bufsize=1,
+            creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0),
+        )
+        with process.stdout:
+            for line in process.stdout:
+                self.feed(line.rstrip('\r\n'))
+        self.returncode = self._wait(process)
+        
+        self._end_phase()
+        self._emit_progress('Done' if self.returncode == 0 else 'Failed', 100 if self.returncode == 0 else None)
+        return self.returncode
+    
+    def feed(self, line):
+        """Record one line of output and update the phase estimate"""
+        self.tail_lines.append(line)
+        if self.job:
+            self.job.log(line)
+        
+        for index in range(self.phase_index + 1, len(self.PHASES)):
+            name, markers, start, end = self.PHASES[index]
+            if any(marker in line for marker in markers):
+                self._end_phase()
+                self.phase, self.phase_index = name, index
+                self.phase_started, self.phase_lines = time.time(), 0
+                print(f"   ⏱️  {name} phase started ({self.phase_started - self.started:.1f}s)")
+                self._emit_progress(name, start)
+                return
+        
+        if self.phase:
+            self.phase_lines += 1
+            if self.phase_lines % self.PROGRESS_EVERY == 0:
+                _, _, start, end = self.PHASES[self.phase_index]
+                done = 1 - 0.5 ** (self.phase_lines / self.PHASE_HALF_LIFE)
+                self._emit_progress(self.phase, start + (end - start) * done)
+    
+    def tail(self, count=10):
+        return '\n'.join(list(self.tail_lines)[-count:]).strip()
+    
+    def _wait(self, process):
+        """Wait for exit and record the child's peak resident set size in bytes"""
+        if os.name == 'nt':
+            returncode = process.wait()
+            self.peak_rss = self._windows_peak_rss(process)
+        elif hasattr(os, 'wait4'):
+            _, status, usage = os.wait4(process.pid, 0)
+            returncode = process.returncode = os.waitstatus_to_exitcode(status)
+            # ru_maxrss is in KiB on Linux and bytes on macOS
+            self.peak_rss = usage.ru_maxrss * (1 if sys.platform == 'darwin' else 1024)
+        else:
+            returncode = process.wait()
+        return returncode
+    
+    @staticmethod
+    def _windows_peak_rss(process):
+        # The process handle stays open after exit until the Popen object is collected
+        counters = PyInstallerProcess._windows_memory_counters(int(process._handle))
+        return counters.PeakWorkingSetSize if counters else None
+    
+    @staticmethod
+    def _windows_memory_counters(handle):
+        import ctypes
+        from ctypes import wintypes
+        
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD)] + [
+                (name, ctypes.c_size_t) for name in (
+                    'PeakWorkingSetSize', 'WorkingSetSize', 'QuotaPeakPagedPoolUsage',
+                    'QuotaPagedPoolUsage', 'QuotaPeakNonPagedPoolUsage', 'QuotaNonPagedPoolUsage',
+                    'PagefileUsage', 'PeakPagefileUsage')]
+        
+        try:
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            if ctypes.windll.psapi.GetProcessMemoryInfo(wintypes.HANDLE(handle), ctypes.byref(counters), counters.cb):
+                return counters
+        except Exception:
+            pass
+        return None
+    
+    def _end_phase(self):
+        if self.phase and self.phase not in self.phase_times:
+            self.phase_times[self.phase] = round(time.time() - self.phase_started, 3)
+    
+    def _emit_progress(self, phase, percent):
+        if not self.job:
+            return
+        now = time.time()
+        self.job.emit('phase', {
+            'phase': phase,
+            'percent': round(percent, 1) if percent is not None else None,
+            'elapsed': round(now - self.started, 3),
+            'phaseElapsed': round(now - self.phase_started, 3) if self.phase_started else 0,
+            'phaseTimes': dict(self.phase_times),
+        })
+
+
+class PyInstallerDaemon:
+    """Long-lived PyInstaller worker that takes build jobs over a local socket
+    
+    A fresh `pyinstaller` process pays for interpreter startup, importing PyInstaller
+    and building the module graph of the standard library (base_library.zip) on every
+    build. The worker does that once and also keeps a graph with pywebview already
+    analysed for HTML builds. Each job gets a copy of the matching graph, the way
+    PyInstaller's own test suite reuses it. Only the graphs asked for are warmed,
+    and jobs that arrive while they are being built are turned away, so clients run
+    them as plain subprocesses instead of waiting behind the warm-up.
+    
+    On POSIX every job runs in a forked child, so jobs are isolated and run in
+    parallel. Elsewhere they run one at a time in the worker. The worker exits
+    after MAX_JOBS jobs or once it uses more than MAX_RSS, and the owning client
+    starts a new one on the same port. Clients fall back to a plain subprocess
+    when the worker is unavailable.
+    """
+    
+    MAX_JOBS = 50
+    MAX_RSS = 1536 * 1024 * 1024
+    RESTART_EXIT = 75
+    # Retry window while the worker restarts between jobs
+    CONNECT_WAIT = 30
+    EXIT_MARKER = '\0html2exe-exit '
+    TOKEN_ENV = 'HTML2EXE_DAEMON_TOKEN'
+    # Module graphs the worker can warm: the standard library (Python builds) and
+    # pywebview with the HTML runtime's excludes (HTML builds and runtime stubs)
+    GRAPHS = ('stdlib', 'webview')
+    # Graphs each build job kind starts from
+    KIND_GRAPHS = {'build-project': ('webview',), 'convert-python-to-exe': ('stdlib',)}
+    
+    def __init__(self, max_jobs=MAX_JOBS, max_rss=MAX_RSS, port=0, token=None, graphs=GRAPHS):
+        self.max_jobs = max_jobs
+        self.max_rss = max_rss
+        self.graphs = tuple(graphs)
+        self.port = port
+        self.token = token
+        self.process = None
+        self.owner = token is None
+        self.stopping = False
+        self.lock = threading.Lock()
+    
+    @classmethod
+    def attach(cls, address):
+        """Client for a worker started by another process ({'port': ..., 'token': ...})"""
+        return cls(port=address['port'], token=address['token'])
+    
+    @staticmethod
+    def supported():
+        # A frozen builder has no interpreter to run PyInstaller in
+        return not getattr(sys, 'frozen', False) and importlib.util.find_spec('PyInstaller') is not None
+    
+    def address(self):
+        return {'port': self.port, 'token': self.token}
+    
+    def start(self):
+        """Spawn the worker; returns once it listens (jobs fall back to subprocesses while it warms up)"""
+        import subprocess
+        with self.lock:
+            if self.process and self.process.poll() is None:
+                return
+            self.token = self.token or uuid.uuid4().hex
+            env = {**os.environ, self.TOKEN_ENV: self.token}
+            if self.process is None:
+                atexit.register(self.stop)
+            # The worker watches its stdin: the pipe closes when this process exits, however it dies
+            self.process = subprocess.Popen(
+                [sys.executable, os.path.abspath(__file__), 'pyinstaller-daemon', f'--daemon-port={self.port}',
+                 f'--max-jobs={self.max_jobs}', f'--max-rss-mb={self.max_rss // (1024 * 1024)}',
+                 f'--graphs={",".join(self.graphs)}'],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=env, text=True,
+                creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0),
+            )
+            ready = self.process.stdout.readline()
+            self.process.stdout.close()
+            try:
+                self.port = json.loads(ready)['port']
+            except (ValueError, KeyError):
+                self.process.wait()
+                raise RuntimeError(f'PyInstaller worker did not start (exit code {self.process.returncode})')
+            print(f"🔧 PyInstaller worker listening on 127.0.0.1:{self.port} (pid {self.process.pid})")
+            process = self.process
+        threading.Thread(target=self._supervise, args=(process,), daemon=True).start()
+    
+    def _supervise(self, process):
+        """Start a warm replacement as soon as the worker retires itself"""
+        returncode = process.wait()
+        with contextlib.suppress(OSError):
+            process.stdin.close()
+        if returncode == self.RESTART_EXIT and not self.stopping:
+            try:
+                self.start()
+            except (OSError, RuntimeError) as e:
+                print(f"⚠️  PyInstaller worker restart failed: {e}")
+    
+    def stop(self):
+        import subprocess
+        self.stopping = True
+        with self.lock:
+            if self.process and self.process.poll() is None:
+                self.process.terminate()
+                try:
+                    self.process.wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    self.process.kill()
+    
+    def run(self, args, cwd, on_line):
+        """Run `pyinstaller <args>` in the worker, feeding output lines to on_line
+        
+        Returns (exit code, peak RSS in bytes or None), or None when no worker could
+        be reached and the caller should run PyInstaller itself.
+        """
+        import socket
+        deadline = time.time() + self.CONNECT_WAIT
+        while True:
+            if self.owner and not self.stopping and (self.process is None or self.process.poll() is not None):
+                try:
+                    self.start()
+                except (OSError, RuntimeError) as e:
+                    print(f"⚠️  {e}")
+                    return None
+            try:
+                conn = socket.create_connection(('127.0.0.1', self.port), timeout=10)
+                break
+            except OSError:
+                if self.stopping or time.time() > deadline:
+                    return None
+                time.sleep(0.2)
+        
+        started = False
+        try:
+            with conn:
+                conn.settimeout(None)
+                conn.sendall((json.dumps({'token': self.token, 'args': list(args),
+                                          'cwd': os.path.abspath(cwd or os.getcwd())}) + '\n').encode('utf-8'))
+                with conn.makefile('r', encoding='utf-8', errors='replace', newline='\n') as stream:
+                    for line in stream:
+                        if line.startswith(self.EXIT_MARKER):
+                            status = json.loads(line[len(self.EXIT_MARKER):])
+                            return status['returncode'], status.get('peakRss')
+                        started = True
+                        on_line(line.rstrip('\r\n'))
+        except OSError:
+            pass
+        # Dropped before the job began (worker warming up or retiring): run it locally instead
+        if not started:
+            return None
+        on_line('PyInstaller worker exited during the build')
+        return 1, None
+    
+    # -- Worker process side --
+    
+    @classmethod
+    def serve(cls, port=0, max_jobs=MAX_JOBS, max_rss=MAX_RSS, graphs=GRAPHS):
+        """Worker main loop (`builder.py pyinstaller-daemon`); exits with RESTART_EXIT when it retires"""
+        import hmac
+        import socket
+        token = os.environ.get(cls.TOKEN_ENV, '')
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        if os.name != 'nt':
+            # The replacement worker takes over the port straight away
+            listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        listener.bind(('127.0.0.1', port))
+        listener.listen(16)
+        print(json.dumps({'port': listener.getsockname()[1]}), flush=True)
+        # From here on, output goes to the console alongside the builder's
+        os.dup2(2, 1)
+        
+        # Exit with the builder: its end of our stdin closes when it exits or is killed,
+        # and the parent pid changes when we get re-parented
+        parent = os.getppid()
+        
+        def orphaned():
+            print("🛑 PyInstaller worker exiting: the builder that started it is gone")
+            sys.stdout.flush()
+            # Jobs run in forked children, which finish on their own
+            os._exit(0)
+        
+        def watch_stdin():
+            try:
+                while sys.stdin.buffer.read(4096):
+                    pass
+            except (OSError, ValueError, AttributeError):
+                pass
+            orphaned()
+        
+        threading.Thread(target=watch_stdin, daemon=True).start()
+        
+        # Like the pyinstaller script: the worker's own folder is not an import root
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        sys.path[:] = [p for p in sys.path if os.path.abspath(p or '.') != script_dir]
+        
+        # Jobs that come in during the warm-up are dropped unread; the client runs them itself
+        listener.settimeout(1.0)
+        warming = threading.Event()
+        warming.set()
+        
+        def turn_away():
+            while warming.is_set():
+                try:
+                    conn, _ = listener.accept()
+                except socket.timeout:
+                    continue
+                except OSError:
+                    return
+                conn.close()
+        
+        turner = threading.Thread(target=turn_away, daemon=True)
+        turner.start()
+        graphs = cls._warm(graphs)
+        warming.clear()
+        turner.join()
+        forking = hasattr(os, 'fork')
+        
+        jobs, children = 0, set()
+        while jobs < max_jobs and cls._rss() < max_rss:
+            if os.getppid() != parent:
+                orphaned()
+            for pid in list(children):
+                if os.waitpid(pid, os.WNOHANG)[0]:
+                    children.discard(pid)
+            try:
+                conn, _ = listener.accept()
+            except socket.timeout:
+                continue
+            try:
+                conn.settimeout(10)
+                with conn.makefile('r', encoding='utf-8') as stream:
+                    job = json.loads(stream.readline())
+                conn.settimeout(None)
+            except (OSError, ValueError):
+                conn.close()
+                continue
+            if not hmac.compare_digest(str(job.get('token', '')), token):
+                conn.close()
+                continue
+            
+            jobs += 1
+            if forking:
+                pid = os.fork()
+                if pid == 0:
+                    listener.close()
+                    cls._run_forked(conn, job, graphs)
+                conn.close()
+                children.add(pid)
+            else:
+                cls._run_inline(conn, job, graphs)
+        
+        # Jobs in flight keep their own connections; the client starts a replacement
+        listener.close()
+        print(f"🔁 PyInstaller worker retiring after {jobs} jobs ({cls._rss() / (1024 * 1024):.0f} MB)")
+        sys.exit(cls.RESTART_EXIT)
+    
+    @classmethod
+    def _warm(cls, names=GRAPHS):
+        """Build the module graphs named in names (see GRAPHS) and make Analysis pick them up
+        
+        Returns [(preloaded modules, excludes, graph)]: the stdlib base graph, and/or
+        the stdlib plus pywebview with the HTML runtime's excludes.
+        """
+        import logging
+        try:
+            from PyInstaller.depend import analysis
+            from PyInstaller.building import build_main
+            logging.getLogger('PyInstaller').setLevel(logging.WARNING)
+            started = time.time()
+            base, graphs = None, []
+            if 'stdlib' in names:
+                analysis.initialize_modgraph()
+                base = analysis._cached_module_graph_
+                graphs.append(((), base._excludes, base))
+            
+            if 'webview' in names and importlib.util.find_spec('webview'):
+                # The stdlib graph already holds modules the runtime excludes (bz2, lzma),
+                # so this one is built with its excludes from the start
+                analysis._cached_module_graph_ = None
+                graph = analysis.initialize_modgraph(excludes=list(RuntimeExclusions.profile()))
+                webview_excludes = graph._excludes
+                analysis._cached_module_graph_ = base
+                for name in ('webview', 'webview.js'):
+                    graph._safe_import_hook(name, None, None)
+                graph._hooks = graph._hooks_pre_safe_import_module = graph._hooks_pre_find_module_path = None
+                graphs.insert(0, (('webview', 'webview.js'), webview_excludes, graph))
+            logging.getLogger('PyInstaller').setLevel(logging.INFO)
+            print(f"🔧 PyInstaller worker warmed {len(graphs)} module graphs in {time.time() - started:.1f}s")
+        except Exception as e:
+            # Unknown PyInstaller internals: jobs still run, just without the warm graphs
+            print(f"⚠️  PyInstaller worker could not warm module graphs: {e}")
+            return []
+        
+        original_assemble = build_main.Analysis.assemble
+        
+        def assemble(self):
+            analysis._cached_module_graph_ = cls._pick(graphs, self.excludes, self.hiddenimports)
+            return original_assemble(self)
+        
+        build_main.Analysis.assemble = assemble
+        return graphs
+    
+    @staticmethod
+    def _conflicts(graph, excludes):
+        """True if an excluded module is already in the graph, so it cannot be excluded after the fact"""
+        names = {node.identifier for node in graph.iter_graph() if isinstance(node.identifier, str)}
+        return any(name == m or name.startswith(m + '.') for m in excludes if m != '__main__' for name in names)
+    
+    @staticmethod
+    def _with_excludes(graph, excludes):
+        # initialize_modgraph reuses the cached graph only if _excludes compares equal
+        graph._excludes = excludes
+        for name in excludes:
+            graph.lazynodes[name] = None
+        return graph
+    
+    @classmethod
+    def _pick(cls, graphs, excludes, hiddenimports):
+        """Warm graph for an Analysis: same excludes and preloads it asked for, or the base graph"""
+        import copy
+        # Normalized exactly as initialize_modgraph does: a list stays a list
+        excludes = excludes or ()
+        if '__main__' not in excludes:
+            excludes = excludes + (['__main__'] if isinstance(excludes, list) else ('__main__',))
+        for preloaded, graph_excludes, graph in graphs:
+            if set(preloaded) <= set(hiddenimports or ()) and (
+                    set(graph_excludes) == set(excludes) or (not preloaded and not cls._conflicts(graph, excludes))):
+                # Forked children own their copy; inline jobs must not change the cached graph
+                graph = graph if hasattr(os, 'fork') else copy.deepcopy(graph)
+                return cls._with_excludes(graph, excludes)
+        return None
+    
+    @staticmethod
+    def _build(job):
+        import PyInstaller.__main__
+        os.chdir(job['cwd'])
+        try:
+            PyInstaller.__main__.run(job['args'])
+            return 0
+        except SystemExit as e:
+            return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except Exception:
+            import traceback
+            traceback.print_exc()
+            return 1
+    
+    @classmethod
+    def _run_forked(cls, conn, job, graphs):
+        """Child process: output goes straight to the client's socket"""
+        import resource
+        fd = conn.fileno()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(fd, 1)
+        os.dup2(fd, 2)
+        returncode = cls._build(job)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        # ru_maxrss is in KiB on Linux and bytes on macOS
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == 'darwin' else 1024)
+        os.write(fd, (cls.EXIT_MARKER + json.dumps({'returncode': returncode, 'peakRss': peak_rss}) + '\n').encode())
+        os._exit(0)
+    
+    @classmethod
+    def _run_inline(cls, conn, job, graphs):
+        """No fork (Windows): run in the worker with its output and log handlers pointed at the socket"""
+        import logging
+        cwd = os.getcwd()
+        with conn, conn.makefile('w', encoding='utf-8', errors='replace', newline='\n') as stream:
+            handlers = [h for h in logging.getLogger().handlers if isinstance(h, logging.StreamHandler)]
+            streams = [h.setStream(stream) for h in handlers]
+            try:
+                with contextlib.redirect_stdout(stream), contextlib.redirect_stderr(stream):
+                    returncode = cls._build(job)
+            finally:
+                for handler, previous in zip(handlers, streams):
+                    handler.setStream(previous)
+                os.chdir(cwd)
+            stream.write(cls.EXIT_MARKER + json.dumps({'returncode': returncode, 'peakRss': None}) + '\n')
+    
+    @staticmethod
+    def _rss():
+        """Current resident set size of this process in bytes (peak where current is unknown)"""
+        try:
+            with open('/proc/self/statm', 'r') as f:
+                return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+        except (OSError, ValueError, AttributeError):
+            pass
+        if os.name == 'nt':
+            import ctypes
+            counters = PyInstallerProcess._windows_memory_counters(ctypes.windll.kernel32.GetCurrentProcess())
+            return counters.WorkingSetSize if counters else 0
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == 'darwin' else 1024)
+
+
+class BuildTimings:
+    """Wall time per build phase, taken as laps: lap(name) closes the phase that just ran"""
+    
+    def __init__(self):
+        self.phases = {}
+        self.last = time.perf_counter()
+    
+    def lap(self, name):
+        now = time.perf_counter()
+        self.phases[name] = round(self.phases.get(name, 0) + now - self.last, 3)
+        self.last = now
+    
+    def pyinstaller(self, process):
+        """Close a PyInstaller run as a phase, keeping its Analysis/PYZ/PKG/EXE split"""
+        self.lap('pyinstaller')
+        for name, seconds in process.phase_times.items():
+            self.phases[f'pyinstaller.{name}'] = seconds
+
+
+class BuildCache:
+    """Content-addressed cache of built executables keyed by a fingerprint of the build inputs"""
+    
+    # Bump when the fingerprint recipe changes so old entries stop matching
+    FORMAT_VERSION = 1
+    
+    def __init__(self, cache_dir=None, max_bytes=2 * 1024 ** 3):
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.expanduser('~'), 'Documents', 'HTML2EXE', '.build-cache')
+        self.cache_dir = cache_dir
+        self.blobs_dir = os.path.join(cache_dir, 'blobs')
+        self.index_path = os.path.join(cache_dir, 'index.json')
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.index = None
+    
+    @staticmethod
+    def hash_file(path, chunk_size=1024 * 1024):
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    @classmethod
+    def hash_tree(cls, folder, skip_dirs=('node_modules', '.git', '.vscode', '__pycache__', 'dist', 'build')):
+        """Sorted (relative path, sha256) pairs for every file under folder"""
+        entries = []
+        for root, dirs, files in os.walk(folder):
+            dirs[:] = [d for d in dirs if d not in skip_dirs]
+            for file in files:
+                file_path = os.path.join(root, file)
+                rel_path = os.path.relpath(file_path, folder).replace(os.sep, '/')
+                entries.append((rel_path, cls.hash_file(file_path)))
+        return sorted(entries)
+    
+    @staticmethod
+    def tool_versions():
+        """Interpreter and PyInstaller versions that produced a build"""
+        import importlib.metadata
+        try:
+            pyinstaller_version = importlib.metadata.version('pyinstaller')
+        except importlib.metadata.PackageNotFoundError:
+            pyinstaller_version = 'missing'
+        return {
+            'python': sys.version,
+            'platform': sys.platform,
+            'pyinstaller': pyinstaller_version,
+        }
+    
+    def fingerprint(self, kind, texts=(), files=(), extra_files=()):
+        """Hash everything that determines the output exe
+        
+        texts: generated sources / spec / command line
+        files: (relative path, sha256) pairs from hash_tree
+        extra_files: standalone inputs such as the icon
+        """
+        digest = hashlib.sha256()
+        header = {'format': self.FORMAT_VERSION, 'kind': kind, 'tools': self.tool_versions()}
+        digest.update(json.dumps(header, sort_keys=True).encode('utf-8'))
+        for text in texts:
+            digest.update(b'\0text\0' + text.encode('utf-8'))
+        for rel_path, file_hash in files:
+            digest.update(f'\0file\0{rel_path}\0{file_hash}'.encode('utf-8'))
+        for path in extra_files:
+            if path and os.path.exists(path):
+                digest.update(f'\0extra\0{self.hash_file(path)}'.encode('utf-8'))
+        return digest.hexdigest()
+    
+    def restore(self, key, exe_path):
+        """Copy the cached exe (or onedir app folder) for key to exe_path; returns False on a miss"""
+        with self._locked() as index:
+            entry = index['entries'].get(key)
+            blob_path = self._blob_path(entry['blob']) if entry else None
+            if not entry or not os.path.exists(blob_path):
+                index['entries'].pop(key, None)
+                index['misses'] += 1
+                self._save_index()
+                return False
+            
+            if blob_path.endswith('.tar'):
+                self._unpack_tree(blob_path, exe_path)
+            else:
+                shutil.copy2(blob_path, exe_path)
+            entry['lastUsed'] = time.time()
+            index['hits'] += 1
+            self._save_index()
+            return True
+    
+    def store(self, key, exe_path, name='', meta=None):
+        """Add a freshly built exe or app folder to the cache and evict least recently used entries
+        
+        meta: JSON-able details of the build (e.g. its size report) returned by meta(key)
+        """
+        tar_path = None
+        if os.path.isdir(exe_path):
+            tar_path = self._pack_tree(exe_path, self.blobs_dir)
+            blob = f'{self.hash_file(tar_path)}.tar'
+        else:
+            blob = self.hash_file(exe_path)
+        blob_path = self._blob_path(blob)
+        
+        try:
+            with self._locked() as index:
+                if not os.path.exists(blob_path):
+                    os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+                    if tar_path:
+                        os.replace(tar_path, blob_path)
+                    else:
+                        tmp_path = f'{blob_path}.{uuid.uuid4().hex}.tmp'
+                        shutil.copy2(exe_path, tmp_path)
+                        os.replace(tmp_path, blob_path)
+                
+                index['entries'][key] = {
+                    'blob': blob,
+                    'name': name,
+                    'size': os.path.getsize(blob_path),
+                    'created': time.time(),
+                    'lastUsed': time.time(),
+                }
+                if meta:
+                    index['entries'][key]['meta'] = meta
+                self._evict()
+                self._save_index()
+        finally:
+            if tar_path and os.path.exists(tar_path):
+                os.remove(tar_path)
+    
+    def meta(self, key):
+        with self._locked() as index:
+            entry = index['entries'].get(key)
+            return entry.get('meta') if entry else None
+    
+    def stats(self):
+        with self._locked() as index:
+            return {
+                'entries': len(index['entries']),
+                'sizeBytes': self._total_size(index),
+                'maxBytes': self.max_bytes,
+                'hits': index['hits'],
+                'misses': index['misses'],
+                'path': self.cache_dir,
+            }
+    
+    def clear(self):
+        with self._locked() as index:
+            shutil.rmtree(self.blobs_dir, ignore_errors=True)
+            index.update(entries={}, hits=0, misses=0)
+            self._save_index()
+    
+    def _blob_path(self, blob):
+        # Onedir builds are stored as '<hash>.tar' blobs, single exes as '<hash>'
+        return os.path.join(self.blobs_dir, blob[:2], blob if blob.endswith('.tar') else f'{blob}.exe')
+    
+    @staticmethod
+    def _pack_tree(folder, tmp_dir):
+        """Uncompressed tar of an app folder (keeps file modes); returns the temp file path"""
+        import tarfile
+        os.makedirs(tmp_dir, exist_ok=True)
+        tar_path = os.path.join(tmp_dir, f'{uuid.uuid4().hex}.tar.tmp')
+        with tarfile.open(tar_path, 'w') as tar:
+            tar.add(folder, arcname='.')
+        return tar_path
+    
+    @staticmethod
+    def _unpack_tree(tar_path, folder):
+        """Extract beside folder, then swap it in so a failed restore leaves no half-written app"""
+        import tarfile
+        tmp_dir = f'{folder}.{uuid.uuid4().hex}.tmp'
+        with tarfile.open(tar_path, 'r') as tar:
+            if hasattr(tarfile, 'data_filter'):
+                tar.extractall(tmp_dir, filter='data')
+            else:
+                tar.extractall(tmp_dir)
+        if os.path.isdir(folder):
+            shutil.rmtree(folder)
+        elif os.path.exists(folder):
+            os.remove(folder)
+        os.replace(tmp_dir, folder)
+    
+    @staticmethod
+    def path_size(path):
+        """Bytes in a file, or in every file under a folder"""
+        if not os.path.isdir(path):
+            return os.path.getsize(path)
+        return sum(os.path.getsize(os.path.join(root, file))
+                   for root, _, files in os.walk(path) for file in files)
+    
+    @staticmethod
+    def _total_size(index):
+        # Entries can share a blob; count each blob once
+        blobs = {entry['blob']: entry['size'] for entry in index['entries'].values()}
+        return sum(blobs.values())
+    
+    def _evict(self):
+        """Drop least recently used entries until the cache fits in max_bytes"""
+        entries = self.index['entries']
+        by_age = sorted(entries.items(), key=lambda item: item[1]['lastUsed'])
+        while by_age and self._total_size(self.index) > self.max_bytes:
+            key, entry = by_age.pop(0)
+            del entries[key]
+            if not any(e['blob'] == entry['blob'] for e in entries.values()):
+                try:
+                    os.remove(self._blob_path(entry['blob']))
+                except OSError:
+                    pass
+            print(f"🧹 Evicted cached build: {entry.get('name') or key[:12]}")
+    
+    @contextlib.contextmanager
+    def _locked(self):
+        """Hold the thread lock and an index.lock file lock, and yield the index as on disk now
+        
+        Batch builds run a BuildCache in every worker process, so each
+        read-modify-write of index.json has to see the other processes' changes.
+        """
+        with self.lock:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(os.path.join(self.cache_dir, 'index.lock'), 'a+b') as lock_file:
+                if os.name == 'nt':
+                    import msvcrt
+                    lock_file.seek(0)
+                    while True:
+                        try:
+                            # LK_LOCK itself gives up after 10 attempts
+                            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                            break
+                        except OSError:
+                            continue
+                else:
+                    import fcntl
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    self.index = None
+                    yield self._load_index()
+                finally:
+                    if os.name == 'nt':
+                        lock_file.seek(0)
+                        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+                    else:
+                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    
+    def _load_index(self):
+        """Index from disk (call inside _locked)"""
+        if self.index is None:
+            self.index = {'entries': {}, 'hits': 0, 'misses': 0}
+            if os.path.exists(self.index_path):
+                try:
+                    with open(self.index_path, 'r', encoding='utf-8') as f:
+                        self.index.update(json.load(f))
+                except (OSError, json.JSONDecodeError) as e:
+                    print(f"⚠️  Build cache index unreadable, starting fresh: {e}")
+        return self.index
+    
+    def _save_index(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f'{self.index_path}.{uuid.uuid4().hex}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f)
+        os.replace(tmp_path, self.index_path)
+
+
+class FrontendBuildCache:
+    """Production builds of framework projects (React, Vue.js, Angular, Svelte), cached by their inputs
+    
+    The project's build script runs through the package manager its lockfile
+    belongs to, with the toolchain installed in its node_modules. The output
+    folder is cached under a key over the lockfile, the sources (node_modules
+    and build output excluded) and the command, and only that output is
+    packaged. "frontendBuild" in project.json turns it off (false), on for any
+    package.json (true), or sets {"script", "command", "output"}.
+    
+    Each output has a <key>.json beside it naming its source folder. A new output
+    replaces the folder's earlier ones, so MAX_ENTRIES counts projects, not edits.
+    """
+    
+    FRAMEWORKS = ('React', 'Vue.js', 'Angular', 'Svelte')
+    # First match wins: pnpm and yarn projects sometimes keep a stray package-lock.json
+    PACKAGE_MANAGERS = (('pnpm-lock.yaml', 'pnpm'), ('yarn.lock', 'yarn'), ('bun.lockb', 'bun'), ('bun.lock', 'bun'),
+                        ('package-lock.json', 'npm'))
+    OUTPUT_DIRS = ('dist', 'build', 'out')
+    SKIP_DIRS = ('node_modules', '.git', '.vscode', '__pycache__', 'dist', 'build', 'out', '.angular', '.svelte-kit',
+                 '.cache', 'coverage')
+    MAX_ENTRIES = 20
+    
+    _node_version = None
+    
+    def __init__(self, cache_dir=None):
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.expanduser('~'), 'Documents', 'HTML2EXE', '.frontend-builds')
+        self.cache_dir = cache_dir
+        self.lock = threading.Lock()
+        self.key_locks = {}
+    
+    @classmethod
+    def plan(cls, folder, settings, frameworks):
+        """{command, output, lockfile, packageManager, custom} for a project, or None to package it as-is
+        
+        Raises ValueError for invalid settings or a missing script that was asked for.
+        """
+        if settings is False:
+            return None
+        forced = settings is True
+        settings = {} if settings is None or forced else settings
+        if not isinstance(settings, dict) or set(settings) - {'script', 'command', 'output'}:
+            raise ValueError('expected true, false or an object with script, command, output')
+        
+        package = {}
+        package_path = os.path.join(folder, 'package.json')
+        if os.path.exists(package_path):
+            with open(package_path, 'r', encoding='utf-8') as f:
+                package = json.load(f)
+        lockfile, manager = next(((name, pm) for name, pm in cls.PACKAGE_MANAGERS
+                                  if os.path.exists(os.path.join(folder, name))), (None, 'npm'))
+        
+        command = settings.get('command')
+        if command is None:
+            if not forced and not settings and not set(frameworks) & set(cls.FRAMEWORKS):
+                return None
+            script = settings.get('script', 'build')
+            if script not in package.get('scripts', {}):
+                if forced or settings:
+                    raise ValueError(f'package.json has no "{script}" script')
+                # A framework loaded from a CDN or prebuilt sources: nothing to build
+                return None
+            command = [manager, 'run', script]
+        elif isinstance(command, str):
+            import shlex
+            command = shlex.split(command, posix=os.name != 'nt')
+        return {
+            'command': list(command),
+            'output': settings.get('output'),
+            'lockfile': lockfile,
+            'packageManager': manager,
+            'custom': 'command' in settings,
+        }
+    
+    @classmethod
+    def node_version(cls):
+        import subprocess
+        if cls._node_version is None:
+            try:
+                cls._node_version = subprocess.run(['node', '--version'], capture_output=True, text=True,
+                                                   timeout=30).stdout.strip() or 'unknown'
+            except (OSError, subprocess.SubprocessError):
+                cls._node_version = 'missing'
+        return cls._node_version
+    
+    def build_key(self, folder, plan):
+        """Hash of the command, the toolchain, the lockfile and every source file"""
+        digest = hashlib.sha256()
+        digest.update(json.dumps({'command': plan['command'], 'output': plan['output'], 'node': self.node_version(),
+                                  'platform': sys.platform}, sort_keys=True).encode('utf-8'))
+        skip_dirs = self.SKIP_DIRS
+        if plan['output']:
+            skip_dirs += (plan['output'].replace('\\', '/').split('/')[0],)
+        # The lockfile is part of the tree; it pins what node_modules holds
+        for rel_path, file_hash in BuildCache.hash_tree(folder, skip_dirs=skip_dirs):
+            digest.update(f'\0{rel_path}\0{file_hash}'.encode('utf-8'))
+        return digest.hexdigest()[:16]
+    
+    def get(self, folder, plan, job=None):
+        """(output folder, info, error); runs the build unless its output is cached"""
+        started = time.time()
+        key = self.build_key(folder, plan)
+        output_path = os.path.join(self.cache_dir, key)
+        
+        with self.lock:
+            key_lock = self.key_locks.setdefault(key, threading.Lock())
+        
+        with key_lock:
+            info = {'key': key, 'command': ' '.join(plan['command'])}
+            if os.path.isdir(output_path):
+                os.utime(output_path)
+                print(f"⚡ Using cached frontend build {key}")
+                return output_path, {**info, 'cache': 'hit', **self._stats(output_path)}, None
+            error = self._build(folder, plan, output_path, info, job)
+            if error:
+                return None, info, error
+            info['seconds'] = round(time.time() - started, 3)
+            return output_path, {**info, 'cache': 'miss', **self._stats(output_path)}, None
+    
+    def _build(self, folder, plan, output_path, info, job=None):
+        import subprocess
+        # The project's own toolchain first, as `npm run` would put it on PATH
+        env = dict(os.environ)
+        env['PATH'] = os.pathsep.join([os.path.join(folder, 'node_modules', '.bin'), env.get('PATH', '')])
+        executable = shutil.which(plan['command'][0], path=env['PATH'])
+        if not executable:
+            return f"Frontend build needs {plan['command'][0]}, which was not found on PATH"
+        if not plan['custom'] and not os.path.isdir(os.path.join(folder, 'node_modules')):
+            return f"Dependencies are not installed in {folder}: run `{plan['packageManager']} install` first"
+        
+        print(f"\n🧩 Running frontend build: {info['command']} (in {folder})")
+        started = time.time()
+        tail = deque(maxlen=20)
+        process = subprocess.Popen(
+            [executable] + plan['command'][1:], cwd=folder, env=env, stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT, text=True, encoding='utf-8', errors='replace', bufsize=1,
+            creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0),
+        )
+        with process.stdout:
+            for line in process.stdout:
+                line = line.rstrip('\r\n')
+                tail.append(line)
+                print(f"   {line}")
+                if job:
+                    job.log(line)
+        if process.wait() != 0:
+            tail_text = '\n'.join(tail).strip()
+            print(f"❌ Frontend build failed (exit code {process.returncode})")
+            return f'Frontend build failed (exit code {process.returncode}): {tail_text}'
+        
+        if plan['output']:
+            built_path = os.path.join(folder, plan['output'])
+            if not os.path.exists(os.path.join(built_path, 'index.html')):
+                return f"Frontend build output has no index.html: {built_path}"
+        else:
+            built_path = self.find_output(folder, since=started)
+            if not built_path:
+                return f"Frontend build wrote no index.html under {', '.join(self.OUTPUT_DIRS)}; set frontendBuild.output"
+        info['output'] = os.path.relpath(built_path, folder).replace(os.sep, '/')
+        
+        # Copied beside the entry and swapped in, so a half-copied output never looks cached
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f'{output_path}.{uuid.uuid4().hex}.tmp'
+        shutil.copytree(built_path, tmp_path)
+        source = self.source_id(folder)
+        try:
+            if not os.path.exists(output_path):
+                with open(f'{output_path}.json', 'w', encoding='utf-8') as f:
+                    json.dump({'folder': source}, f)
+                os.replace(tmp_path, output_path)
+        finally:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+        print(f"✅ Frontend build ready: {info['output']} ({time.time() - started:.1f}s)")
+        self._evict(os.path.basename(output_path), source)
+        return None
+    
+    @classmethod
+    def find_output(cls, folder, since=0):
+        """Shallowest folder under dist/build/out with an index.html written since the build started
+        
+        dist/ for Vite (React, Vue.js, Svelte), build/ for Create React App,
+        dist/<app>/browser/ for Angular.
+        """
+        for name in cls.OUTPUT_DIRS:
+            found = []
+            for root, dirs, files in os.walk(os.path.join(folder, name)):
+                dirs[:] = [d for d in dirs if d != 'node_modules']
+                index_path = os.path.join(root, 'index.html')
+                # Allow for coarse filesystem timestamps
+                if 'index.html' in files and os.path.getmtime(index_path) >= since - 2:
+                    found.append(root)
+            if found:
+                return min(found, key=lambda path: (path.count(os.sep), path))
+        return None
+    
+    @staticmethod
+    def _stats(output_path):
+        files = [os.path.join(root, name) for root, dirs, names in os.walk(output_path) for name in names]
+        return {'files': len(files), 'bytes': sum(os.path.getsize(path) for path in files)}
+    
+    @staticmethod
+    def source_id(folder):
+        return os.path.normcase(os.path.realpath(folder))
+    
+    @staticmethod
+    def _source(output_path):
+        """Source folder an output was built from, or None for outputs without a record"""
+        try:
+            with open(f'{output_path}.json', 'r', encoding='utf-8') as f:
+                return json.load(f).get('folder')
+        except (OSError, ValueError, AttributeError):
+            return None
+    
+    @staticmethod
+    def _remove(output_path):
+        shutil.rmtree(output_path, ignore_errors=True)
+        with contextlib.suppress(OSError):
+            os.remove(f'{output_path}.json')
+    
+    def _evict(self, key, source):
+        """Drop the source folder's outputs other than key, then keep the MAX_ENTRIES most recently used"""
+        with self.lock:
+            entries = sorted((entry for entry in os.scandir(self.cache_dir)
+                              if entry.is_dir() and not entry.name.endswith('.tmp')),
+                             key=lambda entry: entry.stat().st_mtime, reverse=True)
+            kept = []
+            for entry in entries:
+                if entry.name != key and self._source(entry.path) == source:
+                    self._remove(entry.path)
+                else:
+                    kept.append(entry)
+            for entry in kept[self.MAX_ENTRIES:]:
+                self._remove(entry.path)
+
+
+class AssetOptimizer:
+    """Optional pass over an HTML project's files before they are packaged
+    
+    Enabled per project with "optimizeAssets" in project.json: true, or
+    {"minify": bool, "images": bool, "sourceMaps": bool}. HTML/CSS/JS are minified,
+    .map files are left out (unless sourceMaps is true) and PNG/JPEG/WebP are
+    re-encoded by Pillow, keeping the result only when it is smaller and decodes to
+    the same pixels. Outputs are cached by a hash of the input, so a rebuild only
+    processes new or changed files; the optimized tree is staged for AssetArchive.
+    """
+    
+    # Bump when a minifier or encoder setting changes so cached outputs stop matching
+    FORMAT_VERSION = 1
+    DEFAULTS = {'minify': True, 'images': True, 'sourceMaps': False}
+    MINIFY_EXTENSIONS = {'.html': 'html', '.htm': 'html', '.css': 'css', '.js': 'js', '.mjs': 'js'}
+    IMAGE_EXTENSIONS = {'.png': 'PNG', '.jpg': 'JPEG', '.jpeg': 'JPEG', '.webp': 'WEBP'}
+    STAGES = ('sourceMaps', 'minify', 'images')
+    PARALLEL_MIN_FILES = 8
+    BATCH_SIZE = 16
+    
+    STRING = r'"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\''
+    CSS_COMMENTS = re.compile(rf'({STRING})|/\*(?!!).*?\*/', re.S)
+    CSS_SPACES = re.compile(rf'({STRING})|\s*;?\s*(}})\s*|\s*([{{;,>]|!important)\s*|(:)\s+|(\s+)', re.S)
+    HTML_TOKENS = re.compile(
+        r'(?P<comment><!--(?!\[if|<!\[endif).*?-->)'
+        r'|(?P<open><(?P<raw>script|style)\b[^>]*>)(?P<body>.*?)(?P<close></(?P=raw)\s*>)'
+        r'|<(?P<pre>pre|textarea)\b[^>]*>.*?</(?P=pre)\s*>'
+        r'|<[a-zA-Z/!?][^>"\']*(?:(?:"[^"]*"|\'[^\']*\')[^>"\']*)*>', re.S | re.I)
+    SCRIPT_TYPES = re.compile(r'\btype\s*=\s*["\']?(?!(?:text/javascript|application/javascript|module)["\'\s>])', re.I)
+    REGEX_KEYWORDS = {'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void', 'throw', 'case', 'do',
+                      'else', 'yield', 'await'}
+    
+    def __init__(self, cache_dir=None, max_bytes=512 * 1024 ** 2, max_workers=None):
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.expanduser('~'), 'Documents', 'HTML2EXE', '.asset-cache')
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_workers = max_workers
+        self.lock = threading.Lock()
+    
+    @classmethod
+    def settings(cls, value):
+        """Normalized settings for an optimizeAssets value, or None when it is off"""
+        if not value:
+            return None
+        if value is True:
+            return dict(cls.DEFAULTS)
+        if not isinstance(value, dict) or set(value) - set(cls.DEFAULTS):
+            raise ValueError(f"expected true or an object with {', '.join(cls.DEFAULTS)}")
+        return {**cls.DEFAULTS, **{key: bool(enabled) for key, enabled in value.items()}}
+    
+    def run(self, folder, staging_dir, settings):
+        """Stage the optimized copy of folder in staging_dir and return a per-stage report"""
+        started = time.time()
+        report = {stage: {'files': 0, 'cached': 0, 'bytesIn': 0, 'bytesOut': 0, 'seconds': 0.0}
+                  for stage in self.STAGES}
+        sources = {}
+        todo = []
+        for rel_path in AssetArchive.collect(folder):
+            src_path = os.path.join(folder, *rel_path.split('/'))
+            ext = os.path.splitext(rel_path)[1].lower()
+            if ext == '.map' and not settings['sourceMaps']:
+                stats = report['sourceMaps']
+                stats['files'] += 1
+                stats['bytesIn'] += os.path.getsize(src_path)
+                continue
+            
+            sources[rel_path] = src_path
+            if settings['minify'] and ext in self.MINIFY_EXTENSIONS:
+                stage, kind = 'minify', self.MINIFY_EXTENSIONS[ext]
+                # Minifying shifts every line and column, so files with a shipped map are left alone
+                if settings['sourceMaps'] and kind != 'html':
+                    kind += '+maps'
+            elif settings['images'] and HAS_PILLOW and ext in self.IMAGE_EXTENSIONS:
+                stage, kind = 'images', self.IMAGE_EXTENSIONS[ext]
+            else:
+                continue
+            
+            with open(src_path, 'rb') as f:
+                raw = f.read()
+            if not raw:
+                continue
+            key = hashlib.sha256(f'{self.FORMAT_VERSION}\0{kind}\0'.encode('utf-8') + raw).hexdigest()
+            object_path = self._object_path(key)
+            stats = report[stage]
+            stats['files'] += 1
+            stats['bytesIn'] += len(raw)
+            if os.path.exists(object_path):
+                stats['cached'] += 1
+                stats['bytesOut'] += os.path.getsize(object_path) or len(raw)
+                os.utime(object_path)
+            else:
+                todo.append((rel_path, stage, kind, src_path, object_path))
+            sources[rel_path] = (src_path, object_path)
+        
+        workers = self.max_workers or os.cpu_count() or 1
+        if len(todo) >= self.PARALLEL_MIN_FILES and workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            batches = [todo[i:i + self.BATCH_SIZE] for i in range(0, len(todo), self.BATCH_SIZE)]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = [result for batch in pool.map(AssetOptimizer._optimize_batch, batches) for result in batch]
+        else:
+            results = AssetOptimizer._optimize_batch(todo)
+        
+        errors = []
+        for (rel_path, stage, *_), (size, seconds, error) in zip(todo, results):
+            report[stage]['bytesOut'] += size
+            report[stage]['seconds'] += seconds
+            if error:
+                errors.append(f'{rel_path}: {error}')
+        
+        self._stage(sources, staging_dir)
+        if todo:
+            self._evict()
+        
+        for stats in report.values():
+            stats['seconds'] = round(stats['seconds'], 3)
+            stats['saved'] = stats['bytesIn'] - stats['bytesOut']
+        return {
+            'stages': report,
+            'bytesSaved': sum(stats['saved'] for stats in report.values()),
+            'errors': errors,
+            'seconds': round(time.time() - started, 3),
+        }
+    
+    @staticmethod
+    def print_report(report):
+        for stage, stats in report['stages'].items():
+            if stage == 'sourceMaps' and stats['files']:
+                print(f"🗜️  sourceMaps: left out {stats['files']} files ({stats['bytesIn'] / 1024:.0f} KB)")
+            elif stats['files']:
+                print(f"🗜️  {stage}: {stats['files']} files ({stats['cached']} cached), "
+                      f"{stats['bytesIn'] / 1024:.0f} KB -> {stats['bytesOut'] / 1024:.0f} KB "
+                      f"in {stats['seconds']:.2f}s")
+        for error in report['errors']:
+            print(f"⚠️  Kept as-is: {error}")
+        print(f"🗜️  Asset optimization saved {report['bytesSaved'] / 1024:.0f} KB in {report['seconds']:.2f}s")
+    
+    def _object_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key)
+    
+    @staticmethod
+    def _stage(sources, staging_dir):
+        """Rebuild staging_dir from hard links (or copies) of the originals and cached outputs"""
+        if os.path.isdir(staging_dir):
+            shutil.rmtree(staging_dir)
+        for rel_path, source in sources.items():
+            if isinstance(source, tuple):
+                # An empty cache object means the original was already as small as it gets
+                src_path, object_path = source
+                source = object_path if os.path.getsize(object_path) else src_path
+            dst_path = os.path.join(staging_dir, *rel_path.split('/'))
+            os.makedirs(os.path.dirname(dst_path), exist_ok=True)
+            try:
+                os.link(source, dst_path)
+            except OSError:
+                shutil.copyfile(source, dst_path)
+    
+    def _evict(self):
+        """Drop least recently used outputs once the cache is over max_bytes"""
+        with self.lock:
+            objects = []
+            for root, dirs, files in os.walk(self.cache_dir):
+                for name in files:
+                    path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    objects.append((stat.st_mtime, stat.st_size, path))
+            total = sum(size for _, size, _ in objects)
+            for _, size, path in sorted(objects):
+                if total <= self.max_bytes:
+                    break
+                with contextlib.suppress(OSError):
+                    os.remove(path)
+                total -= size
+    
+    @staticmethod
+    def _optimize_batch(batch):
+        """Worker: optimize each file and store the output, or an empty file when it did not shrink"""
+        results = []
+        for rel_path, stage, kind, src_path, object_path in batch:
+            started = time.time()
+            with open(src_path, 'rb') as f:
+                raw = f.read()
+            error = None
+            try:
+                if stage == 'images':
+                    output = AssetOptimizer.recompress_image(raw, kind)
+                else:
+                    output = AssetOptimizer.minify(raw.decode('utf-8'), kind).encode('utf-8')
+            except Exception as e:
+                output, error = None, f'{e.__class__.__name__}: {e}'
+            if not output or len(output) >= len(raw):
+                output = b''
+            
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            tmp_path = f'{object_path}.{uuid.uuid4().hex}.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(output)
+            os.replace(tmp_path, object_path)
+            results.append((len(output) or len(raw), time.time() - started, error))
+        return results
+    
+    @classmethod
+    def minify(cls, text, kind):
+        if kind.endswith('+maps'):
+            if 'sourceMappingURL=' in text:
+                return text
+            kind = kind[:-len('+maps')]
+        return {'html': cls.minify_html, 'css': cls.minify_css, 'js': cls.minify_js}[kind](text)
+    
+    @classmethod
+    def minify_css(cls, text):
+        """Drop comments (except /*! notices) and the whitespace around punctuation"""
+        text = cls.CSS_COMMENTS.sub(lambda m: m.group(1) or '', text)
+        
+        def spaces(m):
+            if m.group(1):
+                return m.group(1)
+            if m.group(2):
+                return '}'
+            return m.group(3) or m.group(4) or ' '
+        
+        return cls.CSS_SPACES.sub(spaces, text).strip()
+    
+    @classmethod
+    def minify_js(cls, text):
+        """Drop comments (except /*! notices), indentation and blank lines
+        
+        Line breaks are kept, so automatic semicolon insertion sees the same code;
+        strings, template literals and regex literals are copied untouched.
+        """
+        out = []
+        pending = ''  # whitespace seen since the last token: '', ' ' or '\n'
+        templates = []  # brace depth of each open ${ ... } inside a template literal
+        last = ''  # last significant token, to tell a regex literal from a division
+        i, n = 0, len(text)
+        
+        def is_word(ch):
+            return ch.isalnum() or ch in '_$\\' or ord(ch) > 127
+        
+        def emit(token):
+            nonlocal pending
+            if out and pending == '\n':
+                out.append('\n')
+            elif out and pending:
+                prev, nxt = out[-1][-1], token[0]
+                # Only where joining would change the tokens: a b, + +, - -, / /, 1 .x
+                if (is_word(prev) and is_word(nxt)) or (prev in '+-/' and nxt == prev) or \
+                        (prev == '/' and nxt == '*') or (prev.isdigit() and nxt == '.'):
+                    out.append(' ')
+            pending = ''
+            out.append(token)
+        
+        def template_chunk(j):
+            """(end, opened): end of the template text from j, at the closing ` or after a ${"""
+            while j < n:
+                if text[j] == '\\':
+                    j += 2
+                elif text[j] == '`':
+                    return j + 1, False
+                elif text.startswith('${', j):
+                    return j + 2, True
+                else:
+                    j += 1
+            return n, False
+        
+        while i < n:
+            c = text[i]
+            if c.isspace() or c == '\ufeff':
+                if c in '\n\r\u2028\u2029':
+                    pending = '\n'
+                elif not pending:
+                    pending = ' '
+                i += 1
+            elif text.startswith('//', i):
+                j = text.find('\n', i)
+                i = n if j < 0 else j
+            elif text.startswith('/*', i):
+                j = text.find('*/', i + 2)
+                j = n if j < 0 else j + 2
+                if text.startswith('/*!', i):
+                    emit(text[i:j])
+                elif '\n' in text[i:j]:
+                    # A comment spanning lines counts as a line break for semicolon insertion
+                    pending = '\n'
+                elif not pending:
+                    pending = ' '
+                i = j
+            elif c in '"\'':
+                j = i + 1
+                while j < n and text[j] != c and text[j] != '\n':
+                    j += 2 if text[j] == '\\' else 1
+                emit(text[i:j + 1])
+                i, last = j + 1, c
+            elif c == '`' or (c == '}' and templates and templates[-1] == 0):
+                if c == '}':
+                    templates.pop()
+                j, opened = template_chunk(i + 1)
+                if opened:
+                    templates.append(0)
+                emit(text[i:j])
+                i, last = j, ('{' if opened else '`')
+            elif c == '/' and (not last or last in '(,=:[!&|?{};+-*%<>~^' or last in cls.REGEX_KEYWORDS):
+                j, in_class = i + 1, False
+                while j < n and text[j] != '\n':
+                    if text[j] == '\\':
+                        j += 1
+                    elif text[j] == '[':
+                        in_class = True
+                    elif text[j] == ']':
+                        in_class = False
+                    elif text[j] == '/' and not in_class:
+                        break
+                    j += 1
+                j += 1
+                while j < n and is_word(text[j]):
+                    j += 1
+                emit(text[i:j])
+                i, last = j, ')'
+            elif is_word(c):
+                j = i + 1
+                while j < n and is_word(text[j]) and text[j] != '\ufeff':
+                    j += 1
+                last = text[i:j]
+                emit(last)
+                i = j
+            else:
+                if templates and c in '{}':
+                    templates[-1] += 1 if c == '{' else -1
+                emit(c)
+                i, last = i + 1, c
+        return ''.join(out)
+    
+    @classmethod
+    def minify_html(cls, text):
+        """Drop comments and collapse whitespace between tags
+        
+        Tags are kept byte for byte; pre/textarea are left alone and inline
+        script/style bodies go through the JS/CSS minifiers.
+        """
+        out = []
+        pos = 0
+        
+        def collapse(chunk):
+            return re.sub(r'\s+', lambda m: '\n' if '\n' in m.group(0) else ' ', chunk)
+        
+        for m in cls.HTML_TOKENS.finditer(text):
+            out.append(collapse(text[pos:m.start()]))
+            pos = m.end()
+            if m.group('comment'):
+                continue
+            if m.group('open') and not cls.SCRIPT_TYPES.search(m.group('open')):
+                minify = cls.minify_js if m.group('raw').lower() == 'script' else cls.minify_css
+                out.append(m.group('open') + minify(m.group('body')) + m.group('close'))
+            else:
+                out.append(m.group(0))
+        out.append(collapse(text[pos:]))
+        return ''.join(out).strip()
+    
+    @staticmethod
+    def strip_jpeg(raw):
+        """JPEG without comments and editor metadata (XMP, Photoshop, APP3-APP13, APP15)
+        
+        Pillow cannot re-encode a JPEG without decoding it, so JPEGs are only
+        trimmed at the marker level; JFIF, Exif (orientation), ICC and Adobe
+        segments are kept and the entropy-coded data is copied as-is.
+        """
+        if raw[:2] != b'\xff\xd8':
+            return None
+        out = [raw[:2]]
+        pos = 2
+        while pos + 4 <= len(raw) and raw[pos] == 0xFF:
+            marker = raw[pos + 1]
+            if marker == 0xDA:  # Start of scan: the rest is image data
+                break
+            length = struct.unpack('>H', raw[pos + 2:pos + 4])[0]
+            segment = raw[pos:pos + 2 + length]
+            drop = (marker == 0xFE or 0xE3 <= marker <= 0xED or marker == 0xEF or
+                    (marker == 0xE1 and not segment[4:10] == b'Exif\0\0'))
+            if not drop:
+                out.append(segment)
+            pos += 2 + length
+        out.append(raw[pos:])
+        return b''.join(out)
+    
+    @staticmethod
+    def webp_lossless(raw):
+        """True when the WebP's image chunk is VP8L (lossless)"""
+        pos = 12
+        while pos + 8 <= len(raw):
+            chunk, size = raw[pos:pos + 4], struct.unpack('<I', raw[pos + 4:pos + 8])[0]
+            if chunk in (b'VP8 ', b'VP8L'):
+                return chunk == b'VP8L'
+            pos += 8 + size + (size & 1)
+        return False
+    
+    @classmethod
+    def recompress_image(cls, raw, fmt):
+        """Smaller bytes for the same pixels, or None (animations, lossy WebP, mismatches)"""
+        from PIL import Image
+        if fmt == 'JPEG':
+            output = cls.strip_jpeg(raw)
+        elif fmt == 'WEBP' and not cls.webp_lossless(raw):
+            # Only a lossy encode would make it smaller
+            return None
+        else:
+            output = None
+        with Image.open(io.BytesIO(raw)) as image:
+            if getattr(image, 'n_frames', 1) > 1:
+                return None
+            image.load()
+            if output is None:
+                keep = ('icc_profile', 'exif', 'transparency', 'dpi') if fmt == 'PNG' else ('icc_profile', 'exif')
+                options = {key: image.info[key] for key in keep if key in image.info}
+                if fmt == 'PNG':
+                    if 'gamma' in image.info or 'chromaticity' in image.info:
+                        # Pillow does not write gAMA/cHRM back, which would change how it renders
+                        return None
+                    options.update(optimize=True)
+                else:
+                    options.update(lossless=True, quality=100, method=4)
+                buffer = io.BytesIO()
+                image.save(buffer, fmt, **options)
+                output = buffer.getvalue()
+            with Image.open(io.BytesIO(output)) as check:
+                check.load()
+                same = (check.mode == image.mode and check.size == image.size and
+                        check.tobytes() == image.tobytes() and check.getpalette() == image.getpalette())
+        return output if same else None
+
+
+class AssetArchive:
+    """Indexed archive of project assets appended to a runtime stub exe
+    
+    Layout after the stub: file data, JSON index {path: [offset, length, size, method, etag]},
+    JSON config, then a fixed trailer (magic, data start, index length, config length).
+    Must stay in sync with HTML_RUNTIME_SOURCE.
+    """
+    
+    MAGIC = b'H2EPAK01'
+    TRAILER = struct.Struct('<8sQQQ')
+    
+    # Text formats worth compressing; media is already compressed and stored as-is
+    COMPRESS_EXTENSIONS = {'.html', '.htm', '.css', '.js', '.mjs', '.json', '.svg', '.txt', '.xml', '.map', '.md', '.csv', '.wasm'}
+    SKIP_DIRS = ('node_modules', '.git', '.vscode', '__pycache__', 'dist', 'build')
+    
+    @classmethod
+    def collect(cls, folder):
+        """Relative paths of every file that goes into the archive"""
+        files = []
+        for root, dirs, names in os.walk(folder):
+            dirs[:] = [d for d in dirs if d not in cls.SKIP_DIRS]
+            for name in names:
+                files.append(os.path.relpath(os.path.join(root, name), folder).replace(os.sep, '/'))
+        return sorted(files)
+    
+    @classmethod
+    def _pack_file(cls, folder, rel_path):
+        with open(os.path.join(folder, *rel_path.split('/')), 'rb') as f:
+            raw = f.read()
+        etag = hashlib.sha1(raw).hexdigest()[:20]
+        if os.path.splitext(rel_path)[1].lower() in cls.COMPRESS_EXTENSIONS:
+            packed = zlib.compress(raw, 6)
+            if len(packed) < len(raw):
+                return packed, len(raw), 'zlib', etag
+        return raw, len(raw), 'stored', etag
+    
+    @classmethod
+    def append(cls, out, folder, config, max_workers=None):
+        """Append the archive for folder to the open binary file out
+        
+        Files are read and compressed on a thread pool (zlib releases the GIL)
+        and written in path order. Returns size statistics.
+        """
+        files = cls.collect(folder)
+        entry = config.get('entry')
+        if not entry:
+            html_files = [f for f in files if f.endswith('.html')]
+            entry = 'index.html' if 'index.html' in files else (html_files[0] if html_files else 'index.html')
+        
+        out.seek(0, os.SEEK_END)
+        data_start = out.tell()
+        offset = 0
+        index = {}
+        payload_hash = hashlib.sha256()
+        raw_total = 0
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            packed_files = pool.map(lambda rel_path: cls._pack_file(folder, rel_path), files)
+            for rel_path, (blob, size, method, etag) in zip(files, packed_files):
+                out.write(blob)
+                index[rel_path] = [offset, len(blob), size, method, etag]
+                payload_hash.update(rel_path.encode('utf-8') + b'\0' + blob)
+                offset += len(blob)
+                raw_total += size
+        
+        config = {**config, 'entry': entry, 'payloadId': payload_hash.hexdigest()[:16]}
+        index_bytes = json.dumps(index, separators=(',', ':')).encode('utf-8')
+        config_bytes = json.dumps(config).encode('utf-8')
+        out.write(index_bytes)
+        out.write(config_bytes)
+        out.write(cls.TRAILER.pack(cls.MAGIC, data_start, len(index_bytes), len(config_bytes)))
+        
+        return {
+            'files': len(files),
+            'rawBytes': raw_total,
+            'packedBytes': offset,
+            'entry': entry,
+        }
+
+
+class RuntimeExclusions:
+    """Modules left out of HTML runtime exes, checked by launching the built exe headlessly
+    
+    The runtime only needs pywebview, its GUI backend and a small asset server, but
+    PyInstaller follows every optional import around them. After each build the exe
+    runs with HTML2EXE_SELFTEST, which loads the payload, serves the entry page and
+    imports the GUI backend without opening a window. If that fails on an excluded
+    module, the build is redone without it.
+    """
+    
+    PROFILE = (
+        'tkinter', '_tkinter', 'turtle', 'turtledemo', 'idlelib',
+        'unittest', 'test', 'doctest', 'pydoc', 'pydoc_data', 'pdb',
+        'lib2to3', 'distutils', 'setuptools', 'pkg_resources', 'pip', 'ensurepip', 'venv',
+        'sqlite3', 'xmlrpc', 'ftplib', 'imaplib', 'poplib', 'smtplib', 'mailbox', 'curses', 'dbm',
+        'bz2', 'lzma',
+        'numpy', 'PIL', 'matplotlib', 'IPython', 'jedi',
+    )
+    # Backends the runtime can never pick on this platform
+    PLATFORM_PROFILE = {
+        'win32': ('gi', 'PyQt5', 'PyQt6', 'PySide2', 'PySide6', 'qtpy', 'AppKit', 'Foundation', 'WebKit'),
+        'darwin': ('gi', 'PyQt5', 'PyQt6', 'PySide2', 'PySide6', 'qtpy', 'clr', 'clr_loader'),
+    }
+    
+    SELF_TEST_TIMEOUT = 60
+    
+    @classmethod
+    def profile(cls):
+        return list(cls.PROFILE + cls.PLATFORM_PROFILE.get(sys.platform, ()))
+    
+    @staticmethod
+    def self_test(exe_path, timeout=SELF_TEST_TIMEOUT):
+        """Launch the exe in self-test mode; returns its report ({'ok', 'error', 'missing', ...})"""
+        import subprocess
+        report_path = f'{exe_path}.{uuid.uuid4().hex}.selftest.json'
+        try:
+            process = subprocess.run([exe_path], env={**os.environ, 'HTML2EXE_SELFTEST': report_path},
+                                     capture_output=True, text=True, errors='replace', timeout=timeout,
+                                     creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0))
+        except subprocess.TimeoutExpired:
+            return {'ok': False, 'error': f'no answer within {timeout}s', 'missing': []}
+        except OSError as e:
+            return {'ok': False, 'error': str(e), 'missing': []}
+        try:
+            with open(report_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            # Died before main(): the traceback names the module it could not import
+            missing = re.findall(r"No module named '([\w.]+)'", process.stderr)
+            tail = process.stderr.strip().splitlines()[-1:] or [f'exit code {process.returncode}']
+            return {'ok': False, 'error': tail[0], 'missing': missing}
+        finally:
+            if os.path.exists(report_path):
+                os.remove(report_path)
+    
+    @classmethod
+    def build(cls, cmd, exe_path, job=None, timings=None, prepare=None):
+        """Run PyInstaller (cmd ends with the script) under the profile, then self-test the exe
+        
+        prepare() runs between PyInstaller and the self-test (e.g. to append assets).
+        Returns (process, self-test report or None, excludes used).
+        """
+        excludes = cls.profile()
+        while True:
+            process = PyInstallerProcess(cmd[:-1] + [f'--exclude-module={m}' for m in excludes] + cmd[-1:], job=job)
+            process.run()
+            if timings:
+                timings.pyinstaller(process)
+            if process.returncode != 0 or not os.path.exists(exe_path):
+                return process, None, excludes
+            if prepare:
+                prepare()
+            
+            report = cls.self_test(exe_path)
+            if timings:
+                timings.lap('selfTest')
+            needed = [m for m in excludes
+                      if any(name == m or name.startswith(m + '.') for name in report.get('missing', []))]
+            if report.get('ok') or not needed:
+                if report.get('ok'):
+                    print(f"✅ Headless self-test passed ({len(excludes)} modules excluded, GUI: {report.get('gui')})")
+                else:
+                    print(f"⚠️  Headless self-test failed: {report.get('error')}")
+                return process, report, excludes
+            print(f"⚠️  Self-test needs excluded module(s) {', '.join(needed)}; rebuilding without them")
+            excludes = [m for m in excludes if m not in needed]
+
+
+class BuildSizeReport:
+    """What makes an exe big, read from the TOC files PyInstaller leaves in its workpath
+    
+    Modules are grouped by top-level package (pure Python from PYZ-00.toc plus
+    extension modules); data files and shared libraries are listed per file, or per
+    top folder for data trees. Sizes are of the collected files before compression,
+    so they rank contributors rather than add up to the exe size.
+    """
+    
+    TOP = 10
+    
+    @classmethod
+    def from_workpath(cls, work_dir, assets_folder=None, top=TOP):
+        modules, files, seen = {}, {}, set()
+        # Onedir builds list the same entries in PKG-00 and COLLECT-00
+        for toc_name in ('PYZ-00.toc', 'PKG-00.toc', 'COLLECT-00.toc'):
+            for dest, src, typecode in cls._read_toc(os.path.join(work_dir, toc_name)):
+                if (dest, typecode) in seen:
+                    continue
+                seen.add((dest, typecode))
+                try:
+                    size = os.path.getsize(src)
+                except OSError:
+                    continue
+                dest = dest.replace('\\', '/')
+                if typecode == 'PYMODULE':
+                    name = dest.split('.')[0]
+                    modules[name] = modules.get(name, 0) + size
+                elif typecode == 'EXTENSION':
+                    name = os.path.basename(dest).split('.')[0] if dest.startswith('lib-dynload/') else dest.split('/')[0].split('.')[0]
+                    modules[name] = modules.get(name, 0) + size
+                elif typecode in ('BINARY', 'DATA'):
+                    key = dest.split('/')[0] + '/' if '/' in dest and typecode == 'DATA' else dest
+                    files[key] = files.get(key, 0) + size
+        
+        if assets_folder:
+            for rel_path, size in cls.asset_sizes(assets_folder):
+                files[f'assets/{rel_path}'] = size
+        
+        return {
+            'modules': sorted(([name, size] for name, size in modules.items()), key=lambda item: -item[1])[:top],
+            'files': sorted(([name, size] for name, size in files.items()), key=lambda item: -item[1])[:top],
+        }
+    
+    @staticmethod
+    def _read_toc(toc_path):
+        """(dest, src, typecode) entries of a TOC file; they are Python literals"""
+        import ast
+        try:
+            with open(toc_path, 'r', encoding='utf-8') as f:
+                toc = ast.literal_eval(f.read())
+        except (OSError, ValueError, SyntaxError):
+            return []
+        for part in (toc if isinstance(toc, tuple) else (toc,)):
+            if isinstance(part, list) and part and isinstance(part[0], tuple) and len(part[0]) == 3:
+                return part
+        return []
+    
+    @staticmethod
+    def asset_sizes(folder):
+        """(relative path, size) of the project files the asset archive will carry"""
+        for root, dirs, files in os.walk(folder):
+            dirs[:] = [d for d in dirs if d not in AssetArchive.SKIP_DIRS]
+            for file in files:
+                file_path = os.path.join(root, file)
+                yield os.path.relpath(file_path, folder).replace(os.sep, '/'), os.path.getsize(file_path)
+    
+    @staticmethod
+    def print_report(report):
+        for key in ('modules', 'files'):
+            if report.get(key):
+                print(f"📏 Largest {key}: " +
+                      ', '.join(f"{name} {size / (1024*1024):.1f} MB" for name, size in report[key][:5]))
+    
+    @staticmethod
+    def check_budget(exe_size, budget):
+        """(status, message) for a sizeBudget: a number of MB or {"maxMB": n, "onExceed": "warn"|"fail"}"""
+        if not budget:
+            return None, None
+        if isinstance(budget, (int, float)):
+            budget = {'maxMB': budget}
+        max_mb = float(budget.get('maxMB') or 0)
+        if not max_mb or exe_size <= max_mb * 1024 * 1024:
+            return 'ok', None
+        message = f"EXE is {exe_size / (1024*1024):.1f} MB, over its {max_mb:g} MB size budget"
+        return ('fail' if budget.get('onExceed') == 'fail' else 'warn'), message
+
+
+class RuntimeStubCache:
+    """Prebuilt pywebview runtime executables, built once per toolchain and icon"""
+    
+    def __init__(self, cache_dir=None):
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.expanduser('~'), 'Documents', 'HTML2EXE', '.runtime-stubs')
+        self.cache_dir = cache_dir
+        self.lock = threading.Lock()
+        self.key_locks = {}
+    
+    def stub_key(self, icon_path=None):
+        """Anything that changes the stub binary: runtime source, tool versions, icon"""
+        import importlib.metadata
+        try:
+            webview_version = importlib.metadata.version('pywebview')
+        except importlib.metadata.PackageNotFoundError:
+            webview_version = 'missing'
+        digest = hashlib.sha256()
+        digest.update(HTML_RUNTIME_SOURCE.encode('utf-8'))
+        digest.update(json.dumps({**BuildCache.tool_versions(), 'pywebview': webview_version,
+                                  'excludes': RuntimeExclusions.profile()}, sort_keys=True).encode('utf-8'))
+        if icon_path and os.path.exists(icon_path):
+            digest.update(BuildCache.hash_file(icon_path).encode('utf-8'))
+        return digest.hexdigest()[:16]
+    
+    def get(self, icon_path=None, job=None):
+        """Path to the stub exe for this icon, building it with PyInstaller if needed"""
+        key = self.stub_key(icon_path)
+        stub_dir = os.path.join(self.cache_dir, key)
+        stub_path = os.path.join(stub_dir, f'HTML2EXE-Runtime{EXE_SUFFIX}')
+        
+        with self.lock:
+            key_lock = self.key_locks.setdefault(key, threading.Lock())
+        
+        # Concurrent jobs wanting the same stub wait for a single build
+        with key_lock:
+            if os.path.exists(stub_path):
+                print(f"⚡ Using cached runtime stub {key}")
+                return stub_path, None
+            return self._build(stub_dir, stub_path, icon_path, job)
+    
+    @staticmethod
+    def size_report(stub_path):
+        try:
+            with open(os.path.join(os.path.dirname(stub_path), 'size-report.json'), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {'modules': [], 'files': []}
+    
+    def _build(self, stub_dir, stub_path, icon_path, job=None):
+        print(f"\n🧱 Building runtime stub (one-time per toolchain/icon)...")
+        # Batch workers are separate processes; each builds in its own work dir
+        work_dir = os.path.join(stub_dir, f'work-{uuid.uuid4().hex[:8]}')
+        os.makedirs(work_dir, exist_ok=True)
+        
+        runtime_path = os.path.join(work_dir, 'html2exe_runtime.py')
+        with open(runtime_path, 'w', encoding='utf-8') as f:
+            f.write(HTML_RUNTIME_SOURCE)
+        
+        # Built in the work dir and moved into place, so a failed build never looks cached
+        dist_dir = os.path.join(work_dir, 'dist')
+        built_path = os.path.join(dist_dir, os.path.basename(stub_path))
+        cmd = [
+            'pyinstaller',
+            '--onefile',
+            '--windowed',
+            '--noupx',
+            '-y',
+            '--name=HTML2EXE-Runtime',
+            f'--distpath={dist_dir}',
+            f'--workpath={os.path.join(work_dir, "build")}',
+            f'--specpath={work_dir}',
+            '--hidden-import=webview',
+            '--hidden-import=webview.js',
+        ]
+        if icon_path and os.path.exists(icon_path):
+            cmd.append(f'--icon={os.path.abspath(icon_path)}')
+        cmd.append(runtime_path)
+        
+        process, _, _ = RuntimeExclusions.build(cmd, built_path, job=job)
+        if process.returncode != 0 or not os.path.exists(built_path):
+            print(f"❌ Runtime stub build failed:\n{process.tail()}")
+            shutil.rmtree(work_dir, ignore_errors=True)
+            return None, f'Runtime stub build failed: {process.tail()}'
+        
+        # Another process may have finished the same stub first; keep that one
+        if not os.path.exists(stub_path):
+            # Fast packages report the stub's contributors; in place before the stub is
+            report = BuildSizeReport.from_workpath(os.path.join(work_dir, 'build', 'HTML2EXE-Runtime'))
+            report_path = os.path.join(work_dir, 'size-report.json')
+            with open(report_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f)
+            os.replace(report_path, os.path.join(stub_dir, 'size-report.json'))
+            os.replace(built_path, stub_path)
+        shutil.rmtree(work_dir, ignore_errors=True)
+        print(f"✅ Runtime stub ready: {stub_path}")
+        return stub_path, None
+
+
+class PythonAppLayer:
+    """Application layer of a layered Python build: the project's compiled modules and data files
+    
+    A zip with fixed timestamps, so unchanged code gives identical bytes, holding
+    sourceless .pyc files at their project-relative paths, the data files and a
+    config naming the entry module. Onefile builds append it to the dependency
+    layer exe behind a trailer (magic, zip start, zip length); onedir builds unpack
+    it into the app folder. Must stay in sync with PYTHON_BOOTSTRAP_SOURCE.
+    """
+    
+    MAGIC = b'H2EPYL01'
+    TRAILER = struct.Struct('<8sQQ')
+    CONFIG_NAME = '__html2exe_app__.json'
+    DATE_TIME = (1980, 1, 1, 0, 0, 0)
+    
+    @staticmethod
+    def compile_module(source_path, rel_path, optimize=0):
+        """Sourceless .pyc bytes for a module; raises SyntaxError for broken sources"""
+        import marshal
+        with open(source_path, 'rb') as f:
+            code = compile(f.read(), rel_path, 'exec', dont_inherit=True, optimize=optimize)
+        # Header: magic, flags, mtime, source size; sourceless imports skip the mtime check
+        return importlib.util.MAGIC_NUMBER + struct.pack('<III', 0, 0, 0) + marshal.dumps(code)
+    
+    @classmethod
+    def build(cls, project_path, modules, data_files, entry, optimize=0):
+        """(zip bytes, stats) for the given module and data file paths relative to project_path"""
+        import zipfile
+        buffer = io.BytesIO()
+        raw_total = 0
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+            def write(name, blob):
+                archive.writestr(zipfile.ZipInfo(name, date_time=cls.DATE_TIME), blob,
+                                 compress_type=zipfile.ZIP_DEFLATED)
+            
+            for rel_path in modules:
+                source_path = os.path.join(project_path, *rel_path.split('/'))
+                raw_total += os.path.getsize(source_path)
+                write(rel_path[:-3] + '.pyc', cls.compile_module(source_path, rel_path, optimize))
+            for rel_path in data_files:
+                with open(os.path.join(project_path, *rel_path.split('/')), 'rb') as f:
+                    blob = f.read()
+                raw_total += len(blob)
+                write(rel_path, blob)
+            write(cls.CONFIG_NAME, json.dumps({'entry': entry}))
+        
+        layer = buffer.getvalue()
+        return layer, {
+            'modules': len(modules),
+            'dataFiles': len(data_files),
+            'rawBytes': raw_total,
+            'packedBytes': len(layer),
+            'hash': hashlib.sha256(layer).hexdigest()[:16],
+        }
+    
+    @classmethod
+    def append(cls, out, layer):
+        """Append the layer and its trailer to the open binary file out"""
+        out.seek(0, os.SEEK_END)
+        start = out.tell()
+        out.write(layer)
+        out.write(cls.TRAILER.pack(cls.MAGIC, start, len(layer)))
+    
+    @staticmethod
+    def extract(layer, folder):
+        import zipfile
+        zipfile.ZipFile(io.BytesIO(layer)).extractall(folder)
+
+
+class DependencyLayerCache:
+    """Prebuilt dependency layers for layered Python builds, keyed by what the app imports
+    
+    A layer is PYTHON_BOOTSTRAP_SOURCE frozen by PyInstaller with the app's resolved
+    external import set as hidden imports. The key covers that set, the installed
+    versions of the distributions it comes from, requirements.txt, the toolchain and
+    the exe options, so editing project code reuses the layer and only the
+    application layer is rebuilt.
+    """
+    
+    LAYER_NAME = 'HTML2EXE-App'
+    
+    def __init__(self, cache_dir=None):
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.expanduser('~'), 'Documents', 'HTML2EXE', '.dependency-layers')
+        self.cache_dir = cache_dir
+        self.lock = threading.Lock()
+        self.key_locks = {}
+    
+    def layer_key(self, settings, icon_path=None):
+        """settings: imports, excludes, distributions, requirements (hash), optimize, singleFile, console"""
+        digest = hashlib.sha256()
+        digest.update(PYTHON_BOOTSTRAP_SOURCE.encode('utf-8'))
+        digest.update(json.dumps({**BuildCache.tool_versions(), **settings}, sort_keys=True).encode('utf-8'))
+        if icon_path and os.path.exists(icon_path):
+            digest.update(BuildCache.hash_file(icon_path).encode('utf-8'))
+        return digest.hexdigest()[:16]
+    
+    def layer_path(self, key, single_file):
+        """The cached exe (onefile) or app folder (onedir) for a key"""
+        return os.path.join(self.cache_dir, key, f'{self.LAYER_NAME}{EXE_SUFFIX}' if single_file else self.LAYER_NAME)
+    
+    def get(self, settings, icon_path=None, job=None):
+        """(key, layer path, built process or None, error); builds the layer with PyInstaller if needed"""
+        key = self.layer_key(settings, icon_path)
+        layer_path = self.layer_path(key, settings['singleFile'])
+        
+        with self.lock:
+            key_lock = self.key_locks.setdefault(key, threading.Lock())
+        
+        # Concurrent builds of apps with the same imports wait for a single layer build
+        with key_lock:
+            if os.path.exists(layer_path):
+                print(f"⚡ Using cached dependency layer {key} ({len(settings['imports'])} imports)")
+                return key, layer_path, None, None
+            process, error = self._build(key, layer_path, settings, icon_path, job)
+            return key, layer_path, process, error
+    
+    def _build(self, key, layer_path, settings, icon_path, job=None):
+        print(f"\n🧱 Building dependency layer {key} ({len(settings['imports'])} imports, one-time until they change)...")
+        layer_dir = os.path.join(self.cache_dir, key)
+        # Batch workers are separate processes; each builds in its own work dir
+        work_dir = os.path.join(layer_dir, f'work-{uuid.uuid4().hex[:8]}')
+        os.makedirs(work_dir, exist_ok=True)
+        
+        bootstrap_path = os.path.join(work_dir, 'html2exe_bootstrap.py')
+        with open(bootstrap_path, 'w', encoding='utf-8') as f:
+            f.write(PYTHON_BOOTSTRAP_SOURCE)
+        spec_path = os.path.join(work_dir, f'{self.LAYER_NAME}.spec')
+        with open(spec_path, 'w', encoding='utf-8') as f:
+            f.write(HTMLToEXEBuilder.python_spec(
+                bootstrap_path, work_dir, [], settings['imports'], settings['excludes'], settings['optimize'],
+                settings['singleFile'], self.LAYER_NAME, settings['console'], icon_path))
+        
+        # Built in the work dir and moved into place, so a failed build never looks cached
+        dist_dir = os.path.join(work_dir, 'dist')
+        cmd = [
+            'pyinstaller',
+            f'--distpath={dist_dir}',
+            f'--workpath={os.path.join(work_dir, "build")}',
+            '--noconfirm',
+            spec_path,
+        ]
+        process = PyInstallerProcess(cmd, cwd=work_dir, job=job)
+        process.run()
+        built_path = os.path.join(dist_dir, os.path.basename(layer_path))
+        if process.returncode != 0 or not os.path.exists(built_path):
+            print(f"❌ Dependency layer build failed:\n{process.tail()}")
+            shutil.rmtree(work_dir, ignore_errors=True)
+            return process, f'Dependency layer build failed: {process.tail(10)}'
+        
+        # Another process may have finished the same layer first; keep that one
+        if not os.path.exists(layer_path):
+            os.replace(built_path, layer_path)
+        shutil.rmtree(work_dir, ignore_errors=True)
+        print(f"✅ Dependency layer ready: {layer_path}")
+        return process, None
+
+
+class IconStore:
+    """Uploaded icons, stored once by content hash and referenced from builds by id
+    
+    /api/icons streams the raw request body to disk in chunks; builds then send
+    {"iconId": ...} instead of a base64 data URI inside their JSON.
+    """
+    
+    MAX_BYTES = 10 * 1024 * 1024
+    CHUNK_SIZE = 64 * 1024
+    # Formats are taken from the file signature, not the client's Content-Type
+    SIGNATURES = {b'\x89PNG\r\n\x1a\n': 'png', b'\x00\x00\x01\x00': 'ico'}
+    ID_PATTERN = re.compile(r'^[0-9a-f]{16}\.(png|ico)$')
+    ICO_SIZES = (16, 24, 32, 48, 64, 128, 256)
+    
+    def __init__(self, icons_dir=None):
+        if icons_dir is None:
+            icons_dir = os.path.join(os.path.expanduser('~'), 'Documents', 'HTML2EXE', '.icons')
+        self.icons_dir = icons_dir
+        self.lock = threading.Lock()
+        self.key_locks = {}
+    
+    def save_stream(self, stream, length):
+        """Copy `length` bytes from stream into the store; returns (icon id, size)"""
+        if length <= 0:
+            raise ValueError('empty upload')
+        if length > self.MAX_BYTES:
+            raise ValueError(f'icon larger than {self.MAX_BYTES // (1024 * 1024)} MB')
+        
+        os.makedirs(self.icons_dir, exist_ok=True)
+        tmp_path = os.path.join(self.icons_dir, f'{uuid.uuid4().hex}.upload')
+        digest = hashlib.sha256()
+        head = b''
+        remaining = length
+        try:
+            with open(tmp_path, 'wb') as f:
+                while remaining:
+                    chunk = stream.read(min(self.CHUNK_SIZE, remaining))
+                    if not chunk:
+                        raise ValueError('upload ended early')
+                    if len(head) < 8:
+                        head += chunk[:8 - len(head)]
+                    digest.update(chunk)
+                    f.write(chunk)
+                    remaining -= len(chunk)
+            
+            icon_format = next((fmt for magic, fmt in self.SIGNATURES.items() if head.startswith(magic)), None)
+            if icon_format is None:
+                raise ValueError('not a PNG or ICO file')
+            
+            icon_id = f'{digest.hexdigest()[:16]}.{icon_format}'
+            # Named by content hash: re-uploading the same bytes atomically replaces an identical file
+            os.replace(tmp_path, os.path.join(self.icons_dir, icon_id))
+            return icon_id, length
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def path(self, icon_id):
+        """Stored file for an icon id, or None"""
+        if not icon_id or not self.ID_PATTERN.match(icon_id):
+            return None
+        icon_path = os.path.join(self.icons_dir, icon_id)
+        return icon_path if os.path.exists(icon_path) else None
+    
+    def from_request(self, data):
+        """Icon file for a build request: 'iconId', or a legacy 'iconData' data URI"""
+        if data.get('iconId'):
+            icon_path = self.path(data['iconId'])
+            if icon_path is None:
+                raise ValueError(f"unknown icon id {data['iconId']!r}, upload it to /api/icons first")
+            return icon_path
+        
+        icon_data_uri = data.get('iconData') or ''
+        if icon_data_uri.startswith('data:') and ',' in icon_data_uri:
+            icon_binary = base64.b64decode(icon_data_uri.split(',', 1)[1])
+            icon_id, _ = self.save_stream(io.BytesIO(icon_binary), len(icon_binary))
+            return self.path(icon_id)
+        return None
+    
+    def ico_for(self, icon_path):
+        """Multi-size ICO (16-256 px, alpha kept) for an icon, converted once per image
+        
+        Results are cached in .icons/ico under the source's content hash, so rebuilding
+        with the same icon, or a batch sharing one, does no image work after the first.
+        ICO sources are used as they are; PNGs pass through when Pillow is missing.
+        """
+        if not icon_path or not icon_path.endswith('.png') or not HAS_PILLOW:
+            return icon_path
+        
+        name = os.path.basename(icon_path)
+        key = name[:-4] if self.ID_PATTERN.match(name) else BuildCache.hash_file(icon_path)[:16]
+        ico_path = os.path.join(self.icons_dir, 'ico', f'{key}.ico')
+        
+        with self.lock:
+            key_lock = self.key_locks.setdefault(key, threading.Lock())
+        
+        with key_lock:
+            if os.path.exists(ico_path):
+                print(f"⚡ Using cached ICO {key}")
+                return ico_path
+            try:
+                self._convert(icon_path, ico_path)
+            except Exception as e:
+                print(f"⚠️  Icon conversion failed, using the PNG: {e}")
+                return icon_path
+            print(f"🎨 ICO created ({', '.join(str(size) for size in self.ICO_SIZES)} px): {ico_path}")
+            return ico_path
+    
+    def _convert(self, icon_path, ico_path):
+        from PIL import Image
+        
+        with Image.open(icon_path) as img:
+            img = img.convert('RGBA')
+        # Pad to a square on a transparent canvas instead of stretching
+        side = max(img.size)
+        if img.width != img.height:
+            square = Image.new('RGBA', (side, side), (0, 0, 0, 0))
+            square.paste(img, ((side - img.width) // 2, (side - img.height) // 2))
+            img = square
+        # Every frame is downscaled from the 256 px master
+        if side != 256:
+            img = img.resize((256, 256), Image.Resampling.LANCZOS)
+        
+        os.makedirs(os.path.dirname(ico_path), exist_ok=True)
+        # Written aside and renamed, so parallel builds never read a partial file
+        tmp_path = f'{ico_path}.{uuid.uuid4().hex}.tmp'
+        try:
+            img.save(tmp_path, format='ICO', sizes=[(size, size) for size in self.ICO_SIZES])
+            os.replace(tmp_path, ico_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+class ProjectSync:
+    """Mirror a source folder into a destination, copying only what changed
+    
+    Files are compared by size and mtime (and optionally content hash); unchanged
+    files are skipped, stale ones removed, and the rest copied on a thread pool.
+    link_mode 'reflink' clones blocks copy-on-write where the filesystem supports
+    it, 'hardlink' shares the inode (edits then affect both sides), 'copy' always
+    copies bytes. Reflink and hardlink fall back to a copy when unavailable.
+    """
+    
+    SKIP_NAMES = {'node_modules', '.git', 'dist', 'build', '.vscode', '__pycache__'}
+    FICLONE = 0x40049409  # Linux ioctl for reflink copies (btrfs, xfs)
+    
+    def __init__(self, src, dst, link_mode='reflink', hash_check=False, max_workers=None):
+        self.src = os.path.abspath(src)
+        self.dst = os.path.abspath(dst)
+        self.link_mode = link_mode
+        self.hash_check = hash_check
+        self.max_workers = max_workers
+        self.stats = {
+            'filesCopied': 0, 'bytesCopied': 0,
+            'filesLinked': 0, 'bytesLinked': 0,
+            'filesSkipped': 0, 'bytesSkipped': 0,
+            'filesRemoved': 0,
+        }
+        self.lock = threading.Lock()
+    
+    def _source_files(self):
+        """rel path -> stat for every file to mirror (same skip rules as the old copytree)"""
+        files = {}
+        for root, dirs, names in os.walk(self.src):
+            dirs[:] = [d for d in dirs if d not in self.SKIP_NAMES]
+            rel_root = os.path.relpath(root, self.src)
+            for name in names:
+                if rel_root != '.' and name in self.SKIP_NAMES:
+                    continue
+                rel_path = name if rel_root == '.' else os.path.join(rel_root, name)
+                try:
+                    files[rel_path] = os.stat(os.path.join(root, name))
+                except OSError:
+                    pass
+        return files
+    
+    def _is_unchanged(self, rel_path, src_stat):
+        dst_path = os.path.join(self.dst, rel_path)
+        try:
+            dst_stat = os.stat(dst_path)
+        except OSError:
+            return False
+        if dst_stat.st_size != src_stat.st_size:
+            return False
+        # copy2 preserves mtime; allow 2s for FAT/exFAT timestamp resolution
+        if abs(dst_stat.st_mtime - src_stat.st_mtime) < 2:
+            return True
+        if self.hash_check and BuildCache.hash_file(dst_path) == BuildCache.hash_file(os.path.join(self.src, rel_path)):
+            os.utime(dst_path, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+            return True
+        return False
+    
+    def _link_or_copy(self, src_path, tmp_path):
+        """Returns True when the file was linked/cloned rather than copied"""
+        if self.link_mode == 'hardlink':
+            try:
+                os.link(src_path, tmp_path)
+                return True
+            except OSError:
+                pass
+        elif self.link_mode == 'reflink' and sys.platform.startswith('linux'):
+            try:
+                import fcntl
+                with open(src_path, 'rb') as src_file, open(tmp_path, 'wb') as dst_file:
+                    fcntl.ioctl(dst_file.fileno(), self.FICLONE, src_file.fileno())
+                shutil.copystat(src_path, tmp_path)
+                return True
+            except OSError:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        shutil.copy2(src_path, tmp_path)
+        return False
+    
+    def _sync_file(self, rel_path, src_stat):
+        if self._is_unchanged(rel_path, src_stat):
+            with self.lock:
+                self.stats['filesSkipped'] += 1
+                self.stats['bytesSkipped'] += src_stat.st_size
+            return
+        
+        src_path = os.path.join(self.src, rel_path)
+        dst_path = os.path.join(self.dst, rel_path)
+        os.makedirs(os.path.dirname(dst_path), exist_ok=True)
+        if os.path.isdir(dst_path):
+            shutil.rmtree(dst_path)
+        
+        # Write beside the target and swap in, so readers never see a partial file
+        tmp_path = f'{dst_path}.{uuid.uuid4().hex}.sync'
+        try:
+            linked = self._link_or_copy(src_path, tmp_path)
+            os.replace(tmp_path, dst_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        
+        with self.lock:
+            kind = 'Linked' if linked else 'Copied'
+            self.stats[f'files{kind}'] += 1
+            self.stats[f'bytes{kind}'] += src_stat.st_size
+    
+    def _remove_stale(self, source_files):
+        """Delete destination files and folders that no longer exist in the source"""
+        source_dirs = {''}
+        for rel_path in source_files:
+            parent = os.path.dirname(rel_path)
+            while parent and parent not in source_dirs:
+                source_dirs.add(parent)
+                parent = os.path.dirname(parent)
+        
+        src_real = os.path.realpath(self.src)
+        for root, dirs, names in os.walk(self.dst, topdown=False):
+            if self._contains(src_real, os.path.realpath(root)):
+                # Never delete anything that belongs to the source
+                continue
+            rel_root = os.path.relpath(root, self.dst)
+            rel_root = '' if rel_root == '.' else rel_root
+            for name in names:
+                rel_path = os.path.join(rel_root, name) if rel_root else name
+                if rel_path not in source_files:
+                    os.remove(os.path.join(root, name))
+                    self.stats['filesRemoved'] += 1
+            if rel_root and rel_root not in source_dirs and not os.listdir(root):
+                os.rmdir(root)
+    
+    @staticmethod
+    def _contains(parent, path):
+        try:
+            return os.path.commonpath([os.path.normcase(parent), os.path.normcase(path)]) == os.path.normcase(parent)
+        except ValueError:
+            # Different drives
+            return False
+    
+    @classmethod
+    def overlaps(cls, src, dst):
+        """True if one folder is inside the other (after resolving symlinks)"""
+        src, dst = os.path.realpath(src), os.path.realpath(dst)
+        return cls._contains(src, dst) or cls._contains(dst, src)
+    
+    def run(self):
+        """Mirror src into dst and return byte/file counts"""
+        started = time.time()
+        os.makedirs(self.dst, exist_ok=True)
+        if os.path.normcase(os.path.realpath(self.src)) == os.path.normcase(os.path.realpath(self.dst)):
+            return {**self.stats, 'seconds': 0.0}
+        
+        if self.overlaps(self.src, self.dst):
+            raise ValueError(f'Source and destination folders overlap: {self.src} / {self.dst}')
+        
+        source_files = self._source_files()
+        self._remove_stale(source_files)
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            # list() re-raises the first copy error, if any
+            list(pool.map(lambda item: self._sync_file(*item), source_files.items()))
+        
+        return {**self.stats, 'seconds': round(time.time() - started, 3)}
+
+
+class ProjectIndex:
+    """SQLite index of the projects in Documents/HTML2EXE
+    
+    Rows are updated when a project is created or built. Listing reconciles the
+    index with the folder only when the folder's mtime changed (a project folder
+    was added or removed), so /api/projects does not re-read every project.json.
+    """
+    
+    SORT_COLUMNS = {
+        'name': 'name COLLATE NOCASE',
+        'created': 'created',
+        'version': 'version',
+        'projectType': 'project_type',
+        'lastBuilt': 'last_built',
+    }
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS projects (
+            id TEXT PRIMARY KEY,
+            name TEXT,
+            path TEXT,
+            download_folder TEXT,
+            description TEXT,
+            version TEXT,
+            author TEXT,
+            created TEXT,
+            project_type TEXT,
+            analysis TEXT,
+            meta_mtime INTEGER,
+            last_built TEXT,
+            exe_path TEXT
+        );
+        CREATE TABLE IF NOT EXISTS project_frameworks (
+            project_id TEXT,
+            framework TEXT,
+            PRIMARY KEY (project_id, framework)
+        );
+        CREATE INDEX IF NOT EXISTS idx_projects_created ON projects (created);
+        CREATE INDEX IF NOT EXISTS idx_projects_type ON projects (project_type);
+        CREATE INDEX IF NOT EXISTS idx_frameworks ON project_frameworks (framework);
+        CREATE TABLE IF NOT EXISTS index_meta (key TEXT PRIMARY KEY, value TEXT);
+    """
+    
+    def __init__(self, projects_dir=None):
+        if projects_dir is None:
+            projects_dir = os.path.join(os.path.expanduser('~'), 'Documents', 'HTML2EXE')
+        self.projects_dir = projects_dir
+        self.db_path = os.path.join(projects_dir, '.projects.db')
+        self.lock = threading.Lock()
+        self.initialized = False
+    
+    def _connect(self):
+        import sqlite3
+        os.makedirs(self.projects_dir, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        if not self.initialized:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(self.SCHEMA)
+            self.initialized = True
+        return conn
+    
+    def _write_project(self, conn, project_id, meta_mtime):
+        """(Re)load one project's project.json into the index"""
+        project_path = os.path.join(self.projects_dir, project_id)
+        project_meta = {}
+        try:
+            with open(os.path.join(project_path, 'project.json'), 'r', encoding='utf-8') as f:
+                project_meta = json.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"    ⚠️  Error reading metadata for {project_id}: {e}")
+        
+        analysis = project_meta.get('analysis', {
+            'projectType': 'Unknown',
+            'frameworks': [],
+            'technologies': []
+        })
+        conn.execute("""
+            INSERT INTO projects (id, name, path, download_folder, description, version, author,
+                                  created, project_type, analysis, meta_mtime)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                name = excluded.name, path = excluded.path, download_folder = excluded.download_folder,
+                description = excluded.description, version = excluded.version, author = excluded.author,
+                created = excluded.created, project_type = excluded.project_type,
+                analysis = excluded.analysis, meta_mtime = excluded.meta_mtime
+        """, (
+            project_id,
+            project_meta.get('name', project_id),
+            project_path,
+            project_meta.get('downloadFolder', ''),
+            project_meta.get('description', ''),
+            project_meta.get('version', 'unknown'),
+            project_meta.get('author', ''),
+            project_meta.get('created', ''),
+            analysis.get('projectType', 'Unknown'),
+            json.dumps(analysis),
+            meta_mtime,
+        ))
+        conn.execute('DELETE FROM project_frameworks WHERE project_id = ?', (project_id,))
+        conn.executemany('INSERT OR IGNORE INTO project_frameworks (project_id, framework) VALUES (?, ?)',
+                         [(project_id, framework) for framework in analysis.get('frameworks', [])])
+    
+    @staticmethod
+    def _meta_mtime(project_path):
+        try:
+            return os.stat(os.path.join(project_path, 'project.json')).st_mtime_ns
+        except OSError:
+            return 0
+    
+    def reconcile(self, force=False):
+        """Sync the index with the projects folder if the folder changed since last time"""
+        if not os.path.isdir(self.projects_dir):
+            return
+        dir_mtime = str(os.stat(self.projects_dir).st_mtime_ns)
+        
+        with self.lock, self._connect() as conn:
+            row = conn.execute("SELECT value FROM index_meta WHERE key = 'dir_mtime'").fetchone()
+            if row and row['value'] == dir_mtime and not force:
+                return
+            
+            known = {r['id']: r['meta_mtime'] for r in conn.execute('SELECT id, meta_mtime FROM projects')}
+            present = set()
+            for entry in os.scandir(self.projects_dir):
+                # Dot folders (e.g. .build-cache) are builder data, not projects
+                if not entry.is_dir() or entry.name.startswith('.'):
+                    continue
+                present.add(entry.name)
+                meta_mtime = self._meta_mtime(entry.path)
+                if known.get(entry.name) != meta_mtime:
+                    self._write_project(conn, entry.name, meta_mtime)
+            
+            for project_id in set(known) - present:
+                conn.execute('DELETE FROM projects WHERE id = ?', (project_id,))
+                conn.execute('DELETE FROM project_frameworks WHERE project_id = ?', (project_id,))
+            
+            conn.execute("INSERT OR REPLACE INTO index_meta (key, value) VALUES ('dir_mtime', ?)", (dir_mtime,))
+    
+    def upsert(self, project_id):
+        """Refresh one project after create-project rewrote its project.json"""
+        project_path = os.path.join(self.projects_dir, project_id)
+        with self.lock, self._connect() as conn:
+            self._write_project(conn, project_id, self._meta_mtime(project_path))
+    
+    def record_build(self, project_id, exe_path):
+        with self.lock, self._connect() as conn:
+            conn.execute('UPDATE projects SET last_built = ?, exe_path = ? WHERE id = ?',
+                         (datetime.now().isoformat(), exe_path, project_id))
+    
+    def query(self, framework=None, project_type=None, created_after=None, created_before=None,
+              built=None, search=None, sort='created', order='desc', page=1, page_size=0):
+        """Filtered, sorted page of projects and the total match count (page_size 0 = all)"""
+        if sort not in self.SORT_COLUMNS:
+            raise ValueError(f'unknown sort column {sort!r}')
+        if page < 1 or page_size < 0:
+            raise ValueError('page must be >= 1 and pageSize >= 0')
+        
+        self.reconcile()
+        
+        where, params = [], []
+        if framework:
+            where.append('id IN (SELECT project_id FROM project_frameworks WHERE framework = ?)')
+            params.append(framework)
+        if project_type:
+            where.append('project_type = ?')
+            params.append(project_type)
+        if created_after:
+            where.append('created >= ?')
+            params.append(created_after)
+        if created_before:
+            where.append('created < ?')
+            params.append(created_before)
+        if built is not None:
+            where.append('last_built IS NOT NULL' if built else 'last_built IS NULL')
+        if search:
+            where.append('(name LIKE ? OR description LIKE ?)')
+            params.extend([f'%{search}%', f'%{search}%'])
+        where_sql = f"WHERE {' AND '.join(where)}" if where else ''
+        direction = 'ASC' if str(order).lower() == 'asc' else 'DESC'
+        
+        sql = f'SELECT * FROM projects {where_sql} ORDER BY {self.SORT_COLUMNS[sort]} {direction}, id'
+        page_params = list(params)
+        if page_size:
+            sql += ' LIMIT ? OFFSET ?'
+            page_params.extend([page_size, (page - 1) * page_size])
+        
+        with self._connect() as conn:
+            total = conn.execute(f'SELECT COUNT(*) FROM projects {where_sql}', params).fetchone()[0]
+            rows = conn.execute(sql, page_params).fetchall()
+        
+        projects = [{
+            'id': row['id'],
+            'name': row['name'],
+            'path': row['path'],
+            'downloadFolder': row['download_folder'],
+            'description': row['description'],
+            'version': row['version'],
+            'author': row['author'],
+            'created': row['created'],
+            'analysis': json.loads(row['analysis']),
+            'lastBuilt': row['last_built'],
+            'exePath': row['exe_path'],
+        } for row in rows]
+        return projects, total
+
+
+class BuildHistory:
+    """SQLite log of finished builds: phase timings, peak memory, exe size, cache status
+    
+    Kept across sessions so build-time and exe-size regressions show up when
+    PyInstaller or a project's dependencies change (/api/builds/history and
+    `builder.py history`).
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS builds (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_id TEXT,
+            kind TEXT,
+            project TEXT,
+            status TEXT,
+            started_at TEXT,
+            seconds REAL,
+            cache TEXT,
+            mode TEXT,
+            exe_size INTEGER,
+            peak_rss INTEGER,
+            phases TEXT,
+            tools TEXT,
+            fingerprint TEXT,
+            error TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_builds_project ON builds (project, started_at);
+    """
+    
+    def __init__(self, db_path=None):
+        if db_path is None:
+            db_path = os.path.join(os.path.expanduser('~'), 'Documents', 'HTML2EXE', '.build-history.db')
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.initialized = False
+    
+    def _connect(self):
+        import sqlite3
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        if not self.initialized:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(self.SCHEMA)
+            self.initialized = True
+        return conn
+    
+    def record(self, kind, project, result, started_at, finished_at, job_id=None):
+        """Store one finished build from its result dict"""
+        with self.lock, self._connect() as conn:
+            conn.execute("""
+                INSERT INTO builds (job_id, kind, project, status, started_at, seconds, cache, mode,
+                                    exe_size, peak_rss, phases, tools, fingerprint, error)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                job_id,
+                kind,
+                project,
+                'failed' if result.get('error') else 'succeeded',
+                datetime.fromtimestamp(started_at).isoformat(),
+                round(finished_at - started_at, 3),
+                result.get('cache'),
+                result.get('mode', 'pyinstaller'),
+                result.get('exeSize'),
+                result.get('peakRss'),
+                json.dumps(result.get('phases', {})),
+                json.dumps(BuildCache.tool_versions()),
+                result.get('fingerprint'),
+                result.get('error'),
+            ))
+    
+    def query(self, project=None, kind=None, limit=100):
+        """Most recent builds first"""
+        where, params = [], []
+        if project:
+            where.append('project = ?')
+            params.append(project)
+        if kind:
+            where.append('kind = ?')
+            params.append(kind)
+        where_sql = f"WHERE {' AND '.join(where)}" if where else ''
+        
+        with self._connect() as conn:
+            rows = conn.execute(f'SELECT * FROM builds {where_sql} ORDER BY id DESC LIMIT ?',
+                                params + [limit]).fetchall()
+        
+        return [{
+            'id': row['id'],
+            'jobId': row['job_id'],
+            'kind': row['kind'],
+            'project': row['project'],
+            'status': row['status'],
+            'startedAt': row['started_at'],
+            'seconds': row['seconds'],
+            'cache': row['cache'],
+            'mode': row['mode'],
+            'exeSize': row['exe_size'],
+            'peakRss': row['peak_rss'],
+            'phases': json.loads(row['phases'] or '{}'),
+            'tools': json.loads(row['tools'] or '{}'),
+            'fingerprint': row['fingerprint'],
+            'error': row['error'],
+        } for row in rows]
+    
+    def trends(self, builds, window=5):
+        """Per-project summary of builds (newest first): recent vs previous averages
+        
+        Cache hits skip PyInstaller, so only real builds count toward the time averages.
+        """
+        by_project = {}
+        for build in builds:
+            by_project.setdefault((build['project'], build['kind']), []).append(build)
+        
+        def average(values):
+            values = [v for v in values if v is not None]
+            return round(sum(values) / len(values), 3) if values else None
+        
+        def change(recent, previous):
+            if recent is None or not previous:
+                return None
+            return round((recent - previous) / previous * 100, 1)
+        
+        trends = []
+        for (project, kind), project_builds in by_project.items():
+            built = [b for b in project_builds if b['status'] == 'succeeded' and b['cache'] != 'hit']
+            recent, previous = built[:window], built[window:window * 2]
+            recent_seconds = average(b['seconds'] for b in recent)
+            previous_seconds = average(b['seconds'] for b in previous)
+            sizes = [b['exeSize'] for b in project_builds if b['exeSize']]
+            trends.append({
+                'project': project,
+                'kind': kind,
+                'builds': len(project_builds),
+                'failed': sum(1 for b in project_builds if b['status'] == 'failed'),
+                'cacheHits': sum(1 for b in project_builds if b['cache'] == 'hit'),
+                'lastBuilt': project_builds[0]['startedAt'],
+                'recentSeconds': recent_seconds,
+                'previousSeconds': previous_seconds,
+                'secondsChange': change(recent_seconds, previous_seconds),
+                'exeSize': sizes[0] if sizes else None,
+                'previousExeSize': sizes[1] if len(sizes) > 1 else None,
+                'exeSizeChange': change(sizes[0], sizes[1]) if len(sizes) > 1 else None,
+                'peakRss': max((b['peakRss'] for b in recent if b['peakRss']), default=None),
+            })
+        return trends
+    
+    def print_report(self, project=None, kind=None, limit=200, recent=10):
+        """Console report for `builder.py history`"""
+        builds = self.query(project=project, kind=kind, limit=limit)
+        if not builds:
+            print("No builds recorded yet")
+            return
+        
+        def fmt(value, scale=1, digits=1):
+            return '-' if value is None else f'{value / scale:.{digits}f}'
+        
+        def pct(value):
+            return '-' if value is None else f'{value:+.1f}%'
+        
+        mb = 1024 * 1024
+        print(f"📈 Build trends (last {len(builds)} builds, averages over 5 non-cached builds)\n")
+        print(f"{'Project':<28} {'Kind':<22} {'Builds':>6} {'Fail':>5} {'Hits':>5} "
+              f"{'Avg s':>8} {'Prev s':>8} {'Δ time':>8} {'Exe MB':>8} {'Δ size':>8} {'RSS MB':>8}")
+        for t in self.trends(builds):
+            print(f"{t['project'][:28]:<28} {t['kind']:<22} {t['builds']:>6} {t['failed']:>5} {t['cacheHits']:>5} "
+                  f"{fmt(t['recentSeconds']):>8} {fmt(t['previousSeconds']):>8} {pct(t['secondsChange']):>8} "
+                  f"{fmt(t['exeSize'], mb, 2):>8} {pct(t['exeSizeChange']):>8} {fmt(t['peakRss'], mb, 0):>8}")
+        
+        print(f"\n🕒 Most recent builds\n")
+        for b in builds[:recent]:
+            phases = ', '.join(f'{name} {seconds:.1f}s' for name, seconds in b['phases'].items())
+            print(f"{b['startedAt'][:19]}  {b['project'][:28]:<28} {b['status']:<9} {(b['cache'] or '-'):<6} "
+                  f"{b['seconds']:>7.1f}s {fmt(b['exeSize'], mb, 2):>7} MB  {phases}")
+
+
+class HTMLToEXEBuilder:
+    """Main builder application"""
+    
+    def __init__(self, projects_dir='projects', port=8000, build_workers=None, http_threads=32,
+                 cache_max_bytes=2 * 1024 ** 3, build_daemon=True):
+        self.projects_dir = os.path.abspath(projects_dir)
+        self.port = port
+        self.build_workers = build_workers
+        self.http_threads = http_threads
+        self.build_daemon = build_daemon
+        self.build_cache = BuildCache(max_bytes=cache_max_bytes)
+        self.runtime_stubs = RuntimeStubCache()
+        self.dependency_layers = DependencyLayerCache()
+        self.frontend_builds = FrontendBuildCache()
+        self.asset_optimizer = AssetOptimizer()
+        self.project_index = ProjectIndex()
+        self.build_history = BuildHistory()
+        self.icon_store = IconStore()
+        self.server_url = f"http://localhost:{port}"
+        
+        # Create projects directory if it doesn't exist
+        os.makedirs(self.projects_dir, exist_ok=True)
+    
+    def start_server(self):
+        """Start HTTP server"""
+        # Handle both frozen (PyInstaller) and normal Python execution
+        if getattr(sys, 'frozen', False):
+            # Running as PyInstaller executable
+            builder_root = sys._MEIPASS
+        else:
+            # Running as normal Python script
+            builder_root = os.path.dirname(os.path.abspath(__file__))
+        
+        BuilderHTTPHandler.builder_root = builder_root
+        BuilderHTTPHandler.static_cache = StaticFileCache(os.path.join(builder_root, 'builder_ui'))
+        BuilderHTTPHandler.builder = self
+        BuilderHTTPHandler.job_queue = BuildJobQueue(self, max_workers=self.build_workers)
+        print(f"Build workers: {BuilderHTTPHandler.job_queue.max_workers}")
+        
+        # PyInstaller stays loaded in a worker process; it warms up while the UI opens
+        if self.build_daemon and PyInstallerDaemon.supported():
+            PyInstallerProcess.daemon = PyInstallerDaemon()
+            threading.Thread(target=PyInstallerProcess.daemon.start, daemon=True).start()
+        
+        server = BuilderHTTPServer(('localhost', self.port), BuilderHTTPHandler, max_threads=self.http_threads)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        
+        return server
+    
+    def launch_ui(self):
+        """Launch the builder UI in PyWebView"""
+        import webview
+        
+        server = self.start_server()
+        
+        # Get screen dimensions to center the window
+        try:
+            # Primary monitor from pywebview's own screen API (no throwaway Tk root)
+            screen = webview.screens[0]
+            screen_width = screen.width
+            screen_height = screen.height
+            
+            # Calculate center position
+            window_width = 1800
+            window_height = 1200
+            x_position = (screen_width - window_width) // 2
+            y_position = (screen_height - window_height) // 2
+            
+            print(f"Monitor resolution: {screen_width}x{screen_height}")
+            print(f"Window position: ({x_position}, {y_position})")
+        except Exception as e:
+            print(f"Warning: Could not get screen dimensions: {e}")
+            x_position = 100
+            y_position = 100
+        
+        # Create window with frameless style and custom controls
+        window = webview.create_window(
+            title='HTML to EXE Builder',
+            url=self.server_url,
+            width=1800,
+            height=1200,
+            x=x_position,
+            y=y_position,
+            resizable=True,
+            min_size=(1024, 600),
+            frameless=True,
+            background_color='#E8EBF7'
+        )
+        
+        # Store window instance for API access
+        BuilderHTTPHandler.window_instance = window
+        
+        try:
+            webview.start(debug=False)
+        except Exception as e:
+            print(f"Error: {e}")
+        finally:
+            server.shutdown()
+            server.server_close()
+            BuilderHTTPHandler.job_queue.shutdown()
+            if PyInstallerProcess.daemon:
+                PyInstallerProcess.daemon.stop()
+    
+    def create_project(self, name, template='blank', author='', version='1.0.0', description=''):
+        """Create a new project"""
+        project_path = os.path.join(self.projects_dir, name)
+        
+        if os.path.exists(project_path):
+            return {'error': f'Project "{name}" already exists'}
+        
+        os.makedirs(project_path)
+        
+        # Create project metadata
+        project_meta = {
+            'name': name,
+            'author': author,
+            'version': version,
+            'description': description,
+            'template': template,
+            'created': datetime.now().isoformat()
+        }
+        
+        # Write project.json
+        with open(os.path.join(project_path, 'project.json'), 'w') as f:
+            json.dump(project_meta, f, indent=2)
+        
+        # Create template files
+        if template == 'blank':
+            self.create_blank_template(project_path)
+        elif template == 'modern':
+            self.create_modern_template(project_path)
+        elif template == 'dashboard':
+            self.create_dashboard_template(project_path)
+        elif template == 'calculator':
+            self.create_calculator_template(project_path)
+        
+        return {'success': True, 'path': project_path}
+    
+    def scan_folder(self, folder_path):
+        """Scan folder for HTML/CSS/JS files and return structure with analysis"""
+        try:
+            folder_path = os.path.abspath(folder_path)
+            
+            # Check if folder exists
+            if not os.path.isdir(folder_path):
+                return {'error': 'Invalid folder path'}
+            
+            # Analyze project; the same walk also produces the file listing
+            analyzer = ProjectAnalyzer(folder_path)
+            analysis = analyzer.analyze()
+            
+            html_files = analyzer.files['html']
+            css_files = analyzer.files['css']
+            js_files = analyzer.files['js']
+            asset_files = analyzer.files['assets']
+            total_files = analyzer.files['total']
+            
+            # Find entry point (index.html or first HTML file)
+            entry_file = None
+            if 'index.html' in html_files:
+                entry_file = 'index.html'
+            elif html_files:
+                entry_file = html_files[0]
+            
+            # Extract folder name for project name
+            folder_name = os.path.basename(folder_path)
+            
+            return {
+                'success': True,
+                'folderPath': folder_path,
+                'folderName': folder_name,
+                'entryFile': entry_file,
+                'htmlFiles': html_files,
+                'cssFiles': css_files,
+                'jsFiles': js_files,
+                'assetFiles': asset_files[:10],  # Limit to 10 for preview
+                'totalFiles': total_files,
+                'summary': {
+                    'htmlCount': len(html_files),
+                    'cssCount': len(css_files),
+                    'jsCount': len(js_files),
+                    'assetCount': len(asset_files)
+                },
+                'analysis': analysis,  # Add analysis results
+                'analysisCache': analyzer.cache_stats
+            }
+        except Exception as e:
+            return {'error': f'Error scanning folder: {str(e)}'}
+    
+    def build_project(self, data, job=None):
+        """Build an HTML project to EXE using PyInstaller"""
+        result = self._build_project(data, job)
+        if result.get('success'):
+            self.project_index.record_build(data.get('projectId', ''), result.get('exePath'))
+        return result
+    
+    def _build_project(self, data, job=None):
+        try:
+            timings = BuildTimings()
+            project_name = data.get('projectName', '')
+            project_id = data.get('projectId', '')
+            icon_path = data.get('iconPath', '')
+            
+            print(f"\n{'='*60}")
+            print(f"🔨 BUILDING EXE: {project_name}")
+            print(f"{'='*60}")
+            print(f"Project ID: {project_id}")
+            if icon_path:
+                print(f"Icon: {icon_path}")
+            
+            if not project_name or not project_id:
+                return {'error': 'Project name and ID required'}
+            
+            user_home = os.path.expanduser('~')
+            metadata_dir = os.path.join(user_home, 'Documents', 'HTML2EXE', project_id)
+            project_json_path = os.path.join(metadata_dir, 'project.json')
+            project_meta = {}
+            
+            if data.get('projectFolder'):
+                # Headless builds (`builder.py build <folder>`) point straight at a folder
+                project_folder = os.path.abspath(data['projectFolder'])
+            else:
+                print(f"\n📂 Looking for metadata: {project_json_path}")
+                
+                # Read project metadata
+                if not os.path.exists(project_json_path):
+                    print(f"❌ Metadata not found!")
+                    return {'error': f'Project metadata not found'}
+                
+                print(f"✅ Metadata found")
+                
+                with open(project_json_path, 'r') as f:
+                    project_meta = json.load(f)
+                
+                project_folder = project_meta.get('downloadFolder', '')
+            print(f"📦 Project folder: {project_folder}")
+            
+            if not os.path.isdir(project_folder):
+                print(f"❌ Project folder not found!")
+                return {'error': f'Project folder not found: {project_folder}'}
+            
+            print(f"✅ Project folder exists")
+            
+            # Create build directory (batch builds pass their own so parallel builds never share one)
+            build_dir = data.get('buildDir') or os.path.join(metadata_dir, 'build')
+            os.makedirs(build_dir, exist_ok=True)
+            
+            # Framework projects are packaged from their production build, not their sources
+            frontend = None
+            source_folder = project_meta.get('sourceFolder')
+            # The source folder has the installed node_modules; the Downloads copy does not
+            if not (source_folder and os.path.exists(os.path.join(source_folder, 'package.json'))):
+                source_folder = project_folder
+            try:
+                frameworks = project_meta.get('analysis', {}).get('frameworks')
+                if frameworks is None and os.path.exists(os.path.join(source_folder, 'package.json')):
+                    frameworks = ProjectAnalyzer(source_folder).analyze()['frameworks']
+                frontend_plan = FrontendBuildCache.plan(
+                    source_folder, data.get('frontendBuild', project_meta.get('frontendBuild')), frameworks or [])
+            except ValueError as e:
+                return {'error': f'Invalid frontendBuild: {e}'}
+            if frontend_plan:
+                project_folder, frontend, error = self.frontend_builds.get(source_folder, frontend_plan, job)
+                timings.lap('frontend')
+                if error:
+                    return {'error': error, 'frontend': frontend, 'phases': timings.phases}
+            
+            print(f"\n🔧 Creating build script...")
+            
+            # The exe runs the generic HTML runtime; the project itself is appended
+            # to it as an asset archive after PyInstaller finishes
+            build_script = HTML_RUNTIME_SOURCE
+            app_config = self.html_app_config(project_name)
+            
+            build_script_path = os.path.join(build_dir, 'main.py')
+            with open(build_script_path, 'w', encoding='utf-8') as f:
+                f.write(build_script)
+            
+            print(f"✅ Build script created: {build_script_path}")
+            timings.lap('setup')
+            
+            # Build EXE using PyInstaller
+            output_dir = data.get('outputDir') or os.path.join(user_home, 'Downloads')
+            os.makedirs(output_dir, exist_ok=True)
+            exe_name = project_name.replace(' ', '_')
+            
+            print(f"\n⚙️  Running PyInstaller...")
+            print(f"Output directory: {output_dir}")
+            print(f"EXE name: {exe_name}{EXE_SUFFIX}")
+            
+            # Icon: uploaded once to /api/icons and referenced by id
+            final_icon_path = None
+            try:
+                icon_source = self.icon_store.from_request(data)
+            except ValueError as e:
+                return {'error': f'Invalid icon: {e}'}
+            if icon_source:
+                print(f"📥 Icon file: {icon_source} ({os.path.getsize(icon_source)} bytes)")
+                final_icon_path = self.icon_store.ico_for(icon_source)
+            timings.lap('icon')
+            
+            # Fast package: copy a prebuilt runtime stub and append the project assets
+            # Per-project limit from project.json ("sizeBudget"), or given with the request
+            size_budget = data.get('sizeBudget') or project_meta.get('sizeBudget')
+            # Minify / recompress assets before packaging ("optimizeAssets" in project.json)
+            try:
+                optimize = AssetOptimizer.settings(data.get('optimizeAssets', project_meta.get('optimizeAssets')))
+            except ValueError as e:
+                return {'error': f'Invalid optimizeAssets: {e}'}
+            
+            if data.get('fastPackage'):
+                result = self.fast_package(project_name, exe_name, project_folder, output_dir,
+                                           final_icon_path, force=data.get('force'), job=job, timings=timings,
+                                           size_budget=size_budget, optimize=optimize, build_dir=build_dir)
+                if frontend:
+                    result['frontend'] = frontend
+                return result
+            
+            # Create build subdirectories
+            os.makedirs(os.path.join(build_dir, 'build'), exist_ok=True)
+            
+            # PyInstaller command (use absolute Windows paths)
+            cmd = [
+                'pyinstaller',
+                '--onefile',
+                '--windowed',
+                '--noupx',
+                '-y',  # Overwrite without asking
+                f'--name={exe_name}',
+                f'--distpath={output_dir}',
+                f'--workpath={os.path.join(build_dir, "build")}',
+                f'--specpath={build_dir}',
+                '--hidden-import=webview',
+                '--hidden-import=webview.js',
+            ]
+            
+            # Add icon if available - use absolute path for Windows
+            if final_icon_path and os.path.exists(final_icon_path):
+                abs_icon_path = os.path.abspath(final_icon_path)
+                print(f"📌 Icon file ready for PyInstaller:")
+                print(f"   Path: {abs_icon_path}")
+                print(f"   Exists: {os.path.exists(abs_icon_path)}")
+                print(f"   Size: {os.path.getsize(abs_icon_path)} bytes")
+                
+                # PyInstaller handles Windows paths with backslashes correctly
+                cmd.append(f'--icon={abs_icon_path}')
+            
+            cmd.append(build_script_path)
+            
+            print(f"Full PyInstaller command:")
+            print(f"  {' '.join(cmd)}\n")
+            
+            exe_path = os.path.join(output_dir, f'{exe_name}{EXE_SUFFIX}')
+            
+            # Skip PyInstaller entirely when these exact inputs were built before
+            fingerprint = self.build_cache.fingerprint(
+                'build-project',
+                texts=[build_script, json.dumps(app_config, sort_keys=True), ' '.join(cmd),
+                       json.dumps(RuntimeExclusions.profile())] + self.optimize_texts(optimize),
+                files=BuildCache.hash_tree(project_folder),
+                extra_files=[final_icon_path],
+            )
+            timings.lap('fingerprint')
+            if not data.get('force') and self.build_cache.restore(fingerprint, exe_path):
+                print(f"⚡ Build cache hit ({fingerprint[:12]}), skipped PyInstaller")
+                print(f"Location: {exe_path}")
+                print(f"{'='*60}\n")
+                return self.apply_size_budget({
+                    'success': True,
+                    'message': f'EXE restored from build cache!',
+                    'exePath': exe_path,
+                    'exeName': f'{exe_name}{EXE_SUFFIX}',
+                    'cache': 'hit',
+                    'fingerprint': fingerprint,
+                    'frontend': frontend,
+                    'phases': timings.phases,
+                    'sizeReport': (self.build_cache.meta(fingerprint) or {}).get('sizeReport'),
+                    'exeSize': os.path.getsize(exe_path)
+                }, size_budget)
+            
+            stats = {}
+            assets_folder, optimization = self.optimize_assets(project_folder, build_dir, optimize, timings)
+            
+            def append_assets():
+                # Before the self-test, which serves the entry page from the payload
+                print(f"📦 Bundling project assets into the EXE...")
+                with open(exe_path, 'r+b') as f:
+                    stats.update(AssetArchive.append(f, assets_folder, app_config))
+                print(f"   {stats['files']} files, {stats['rawBytes'] / 1024:.0f} KB -> {stats['packedBytes'] / 1024:.0f} KB")
+                timings.lap('assets')
+            
+            # Run PyInstaller under the runtime exclusion profile, then launch the exe headlessly
+            process, self_test, excludes = RuntimeExclusions.build(cmd, exe_path, job=job, timings=timings,
+                                                                   prepare=append_assets)
+            
+            if process.returncode != 0:
+                print(f"\n❌ Build failed!")
+                print(f"Error: {process.tail()}")
+                return {
+                    'error': f'Build failed: {process.tail()}',
+                    'phases': timings.phases,
+                    'peakRss': process.peak_rss
+                }
+            
+            print(f"\n✅ PyInstaller completed successfully")
+            print(f"Checking for EXE at: {exe_path}")
+            
+            if os.path.exists(exe_path):
+                size_report = BuildSizeReport.from_workpath(os.path.join(build_dir, 'build', exe_name),
+                                                            assets_folder=assets_folder)
+                BuildSizeReport.print_report(size_report)
+                
+                self.build_cache.store(fingerprint, exe_path, name=f'{exe_name}{EXE_SUFFIX}',
+                                       meta={'sizeReport': size_report})
+                timings.lap('cacheStore')
+                print(f"✨ EXE CREATED SUCCESSFULLY!")
+                print(f"Size: {os.path.getsize(exe_path) / (1024*1024):.2f} MB")
+                print(f"Location: {exe_path}")
+                print(f"{'='*60}\n")
+                
+                return self.apply_size_budget({
+                    'success': True,
+                    'message': f'EXE created successfully!',
+                    'exePath': exe_path,
+                    'exeName': f'{exe_name}{EXE_SUFFIX}',
+                    'cache': 'bypass' if data.get('force') else 'miss',
+                    'fingerprint': fingerprint,
+                    'assets': stats,
+                    'optimization': optimization,
+                    'frontend': frontend,
+                    'excludes': excludes,
+                    'selfTest': self_test,
+                    'sizeReport': size_report,
+                    'phases': timings.phases,
+                    'peakRss': process.peak_rss,
+                    'exeSize': os.path.getsize(exe_path)
+                }, size_budget)
+            else:
+                print(f"❌ EXE was not created at expected location!")
+                return {
+                    'error': 'EXE was not created'
+                }
+        
+        except Exception as e:
+            print(f"\n❌ BUILD ERROR: {str(e)}")
+            import traceback
+            traceback.print_exc()
+            return {'error': f'Build error: {str(e)}'}
+    
+    def apply_size_budget(self, result, budget):
+        """Check a finished HTML build against its sizeBudget: warn, or turn it into an error"""
+        status, message = BuildSizeReport.check_budget(result['exeSize'], budget)
+        if status:
+            result['sizeBudget'] = {'status': status, 'message': message}
+        if status == 'warn':
+            print(f"⚠️  {message}")
+        elif status == 'fail':
+            print(f"❌ {message}")
+            report = result.get('sizeReport') or {}
+            largest = ', '.join(f"{name} ({size / (1024*1024):.1f} MB)" for name, size in
+                                sorted(report.get('modules', []) + report.get('files', []), key=lambda item: -item[1])[:5])
+            return {
+                'error': f"{message}. Largest: {largest}" if largest else message,
+                'exePath': result['exePath'],
+                'sizeBudget': result['sizeBudget'],
+                'sizeReport': result.get('sizeReport'),
+                'phases': result.get('phases'),
+                'exeSize': result['exeSize']
+            }
+        return result
+    
+    @staticmethod
+    def optimize_texts(optimize):
+        """Fingerprint texts for the asset optimization settings (none when it is off)"""
+        if not optimize:
+            return []
+        return [json.dumps({'optimizeAssets': optimize, 'format': AssetOptimizer.FORMAT_VERSION,
+                            'pillow': HAS_PILLOW}, sort_keys=True)]
+    
+    def optimize_assets(self, project_folder, build_dir, optimize, timings):
+        """(folder to package, report): the project folder, or its optimized copy in build_dir"""
+        if not optimize:
+            return project_folder, None
+        print(f"🗜️  Optimizing assets...")
+        report = self.asset_optimizer.run(project_folder, os.path.join(build_dir, 'assets'), optimize)
+        AssetOptimizer.print_report(report)
+        timings.lap('optimize')
+        return os.path.join(build_dir, 'assets'), report
+    
+    def html_app_config(self, project_name):
+        """Window settings stored in the payload config block for the HTML runtime"""
+        return {
+            'title': project_name,
+            'width': 1024,
+            'height': 768,
+            'resizable': True,
+            'backgroundColor': '#ffffff',
+        }
+    
+    def fast_package(self, project_name, exe_name, project_folder, output_dir, icon_path=None, force=False, job=None,
+                     timings=None, size_budget=None, optimize=None, build_dir=None):
+        """Package an HTML project without running PyInstaller for it
+        
+        The runtime stub is built once per toolchain/icon (RuntimeStubCache); each
+        project build is a copy of the stub plus an appended asset archive.
+        """
+        started = time.time()
+        timings = timings or BuildTimings()
+        exe_path = os.path.join(output_dir, f'{exe_name}{EXE_SUFFIX}')
+        config = self.html_app_config(project_name)
+        
+        fingerprint = self.build_cache.fingerprint(
+            'fast-package',
+            texts=[HTML_RUNTIME_SOURCE, json.dumps(config, sort_keys=True)] + self.optimize_texts(optimize),
+            files=BuildCache.hash_tree(project_folder),
+            extra_files=[icon_path],
+        )
+        timings.lap('fingerprint')
+        if not force and self.build_cache.restore(fingerprint, exe_path):
+            print(f"⚡ Build cache hit ({fingerprint[:12]}), nothing to package")
+            return self.apply_size_budget({
+                'success': True,
+                'message': f'EXE restored from build cache!',
+                'exePath': exe_path,
+                'exeName': f'{exe_name}{EXE_SUFFIX}',
+                'mode': 'fast',
+                'cache': 'hit',
+                'fingerprint': fingerprint,
+                'phases': timings.phases,
+                'sizeReport': (self.build_cache.meta(fingerprint) or {}).get('sizeReport'),
+                'exeSize': os.path.getsize(exe_path)
+            }, size_budget)
+        
+        stub_path, error = self.runtime_stubs.get(icon_path, job)
+        timings.lap('stub')
+        if error:
+            return {'error': error, 'phases': timings.phases}
+        
+        assets_folder, optimization = self.optimize_assets(project_folder, build_dir, optimize, timings)
+        print(f"📦 Appending project assets to runtime stub...")
+        tmp_path = f'{exe_path}.{uuid.uuid4().hex}.tmp'
+        try:
+            shutil.copyfile(stub_path, tmp_path)
+            with open(tmp_path, 'r+b') as f:
+                stats = AssetArchive.append(f, assets_folder, config)
+            os.replace(tmp_path, exe_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        timings.lap('assets')
+        
+        # Stub contributors plus this project's assets
+        size_report = self.runtime_stubs.size_report(stub_path)
+        asset_sizes = [[f'assets/{rel_path}', size] for rel_path, size in BuildSizeReport.asset_sizes(assets_folder)]
+        size_report['files'] = sorted(size_report['files'] + asset_sizes, key=lambda item: -item[1])[:BuildSizeReport.TOP]
+        BuildSizeReport.print_report(size_report)
+        
+        self.build_cache.store(fingerprint, exe_path, name=f'{exe_name}{EXE_SUFFIX}', meta={'sizeReport': size_report})
+        timings.lap('cacheStore')
+        elapsed = time.time() - started
+        print(f"✨ EXE PACKAGED in {elapsed:.2f}s: {stats['files']} files, "
+              f"{stats['rawBytes'] / 1024:.0f} KB -> {stats['packedBytes'] / 1024:.0f} KB")
+        print(f"Location: {exe_path}")
+        print(f"{'='*60}\n")
+        
+        return self.apply_size_budget({
+            'success': True,
+            'message': f'EXE created successfully!',
+            'exePath': exe_path,
+            'exeName': f'{exe_name}{EXE_SUFFIX}',
+            'mode': 'fast',
+            'cache': 'bypass' if force else 'miss',
+            'fingerprint': fingerprint,
+            'assets': stats,
+            'optimization': optimization,
+            'sizeReport': size_report,
+            'seconds': round(elapsed, 3),
+            'phases': timings.phases,
+            'exeSize': os.path.getsize(exe_path)
+        }, size_budget)
+    
+    @staticmethod
+    def python_spec(entry_point_path, python_path, datas_list, hidden_imports, excludes, optimize_level,
+                    single_file, exe_name, console, icon_path=None):
+        """PyInstaller spec for a Python app: onefile, or onedir (EXE + COLLECT) when single_file is False"""
+        # Create datas string for spec file
+        datas_string = "[]"
+        if datas_list:
+            # Use forward slashes to avoid escape character issues
+            datas_entries = [f"(r'{src}', '{dest.replace(chr(92), '/')}')" for src, dest in datas_list]
+            datas_string = "[" + ", ".join(datas_entries) + "]"
+        
+        icon_statement = ""
+        if icon_path and os.path.exists(icon_path):
+            icon_path_escaped = icon_path.replace('\\', '\\\\')
+            icon_statement = f",\n    icon=r'{icon_path_escaped}'"
+        
+        console_value = 'True' if console else 'False'
+        # Optimized bytecode is compiled at build time; the O options set the same
+        # level on the frozen interpreter so sys.flags.optimize agrees
+        options_string = str([('O', None, 'OPTION')] * optimize_level)
+        spec_content = f"""# -*- mode: python ; coding: utf-8 -*-
+
+a = Analysis(
+    [r'{entry_point_path}'],
+    pathex=[r'{python_path}'],
+    binaries=[],
+    datas={datas_string},
+    hiddenimports={hidden_imports},
+    hookspath=[],
+    hooksconfig={{}},
+    runtime_hooks=[],
+    excludes={excludes},
+    noarchive=False,
+    optimize={optimize_level},
+)
+pyz = PYZ(a.pure)
+"""
+        if single_file:
+            spec_content += f"""
+exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.datas,
+    {options_string},
+    name=r'{exe_name}',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    runtime_tmpdir=None,
+    console={console_value}{icon_statement}
+)
+"""
+        else:
+            # Onedir: binaries and data sit next to the exe instead of being
+            # unpacked to a temp folder on every launch
+            spec_content += f"""
+exe = EXE(
+    pyz,
+    a.scripts,
+    {options_string},
+    exclude_binaries=True,
+    name=r'{exe_name}',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,
+    console={console_value}{icon_statement}
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name=r'{exe_name}',
+)
+"""
+        return spec_content
+    
+    def layered_python_build(self, python_path, import_scan, exe_name, output_dir, settings, icon_path=None,
+                             force=False, job=None, timings=None):
+        """Python build as a cached dependency layer plus a freshly packed application layer
         
-        # Store window instance for API access
-        BuilderHTTPHandler.window_instance = window
+        PyInstaller only runs when the dependency layer's key changes (DependencyLayerCache);
+        otherwise a build compiles the project's reachable modules, zips them with the
+        data files and copies them onto the cached layer.
+        """
+        started = time.time()
+        timings = timings or BuildTimings()
+        single_file = settings['singleFile']
+        if single_file:
+            exe_path = output_path = os.path.join(output_dir, f'{exe_name}{EXE_SUFFIX}')
+        else:
+            output_path = os.path.join(output_dir, exe_name)
+            exe_path = os.path.join(output_path, f'{exe_name}{EXE_SUFFIX}')
         
+        print(f"\n📦 Packing application layer...")
         try:
-            webview.start(debug=False)
-        except Exception as e:
-            print(f"Error: {e}")
-        finally:
-            server.shutdown()
-    
-    def create_project(self, name, template='blank', author='', version='1.0.0', description=''):
-        """Create a new project"""
-        project_path = os.path.join(self.projects_dir, name)
-        
-        if os.path.exists(project_path):
-            return {'error': f'Project "{name}" already exists'}
+            app_layer, app_stats = PythonAppLayer.build(python_path, import_scan['projectModules'],
+                                                        import_scan['dataFiles'], import_scan['entry'],
+                                                        settings['optimize'])
+        except (SyntaxError, ValueError) as e:
+            return {'error': f'Could not compile the application layer: {e}', 'phases': timings.phases}
+        timings.lap('appLayer')
+        print(f"  {app_stats['modules']} modules, {app_stats['dataFiles']} data files, "
+              f"{app_stats['rawBytes'] / 1024:.0f} KB -> {app_stats['packedBytes'] / 1024:.0f} KB")
         
-        os.makedirs(project_path)
+        layer_key = self.dependency_layers.layer_key(settings, icon_path)
+        fingerprint = self.build_cache.fingerprint(
+            'python-layered',
+            texts=[layer_key, app_stats['hash'], exe_name],
+        )
+        timings.lap('fingerprint')
+        if not force and self.build_cache.restore(fingerprint, output_path):
+            print(f"⚡ Build cache hit ({fingerprint[:12]}), nothing to package")
+            exe_size = BuildCache.path_size(output_path)
+            return {
+                'success': True,
+                'message': f'EXE restored from build cache! EXE is in Downloads/',
+                'exePath': exe_path,
+                'appDir': None if single_file else output_path,
+                'exeName': f'{exe_name}{EXE_SUFFIX}',
+                'size': f'{exe_size / (1024*1024):.2f} MB',
+                'mode': 'layered',
+                'cache': 'hit',
+                'fingerprint': fingerprint,
+                'phases': timings.phases,
+                'exeSize': exe_size
+            }
         
-        # Create project metadata
-        project_meta = {
-            'name': name,
-            'author': author,
-            'version': version,
-            'description': description,
-            'template': template,
-            'created': datetime.now().isoformat()
-        }
+        layer_key, layer_path, process, error = self.dependency_layers.get(settings, icon_path, job)
+        if process:
+            timings.pyinstaller(process)
+        else:
+            timings.lap('dependencyLayer')
+        if error:
+            return {'error': error, 'phases': timings.phases}
         
-        # Write project.json
-        with open(os.path.join(project_path, 'project.json'), 'w') as f:
-            json.dump(project_meta, f, indent=2)
+        print(f"🔗 Joining application layer to dependency layer {layer_key}...")
+        tmp_path = f'{output_path}.{uuid.uuid4().hex}.tmp'
+        try:
+            if single_file:
+                shutil.copyfile(layer_path, tmp_path)
+                shutil.copymode(layer_path, tmp_path)
+                with open(tmp_path, 'r+b') as f:
+                    PythonAppLayer.append(f, app_layer)
+            else:
+                shutil.copytree(layer_path, tmp_path)
+                os.replace(os.path.join(tmp_path, f'{DependencyLayerCache.LAYER_NAME}{EXE_SUFFIX}'),
+                           os.path.join(tmp_path, f'{exe_name}{EXE_SUFFIX}'))
+                # PyInstaller 6 keeps everything but the exe in _internal (sys._MEIPASS)
+                contents_dir = os.path.join(tmp_path, '_internal')
+                PythonAppLayer.extract(app_layer, contents_dir if os.path.isdir(contents_dir) else tmp_path)
+            # Without the .exe suffix the two modes share a path; clear whichever output is there
+            if os.path.isdir(output_path):
+                shutil.rmtree(output_path)
+            elif os.path.exists(output_path):
+                os.remove(output_path)
+            os.replace(tmp_path, output_path)
+        finally:
+            if os.path.isdir(tmp_path):
+                shutil.rmtree(tmp_path, ignore_errors=True)
+            elif os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        timings.lap('join')
         
-        # Create template files
-        if template == 'blank':
-            self.create_blank_template(project_path)
-        elif template == 'modern':
-            self.create_modern_template(project_path)
-        elif template == 'dashboard':
-            self.create_dashboard_template(project_path)
-        elif template == 'calculator':
-            self.create_calculator_template(project_path)
+        self.build_cache.store(fingerprint, output_path, name=f'{exe_name}{EXE_SUFFIX}')
+        timings.lap('cacheStore')
+        exe_size = BuildCache.path_size(output_path)
+        elapsed = time.time() - started
+        print(f"\n✨ BUILD SUCCESSFUL in {elapsed:.2f}s "
+              f"(dependency layer {'rebuilt' if process else 'reused'})")
+        print(f"EXE File: {exe_path}")
+        print(f"Size: {exe_size / (1024*1024):.2f} MB")
+        print(f"{'='*60}\n")
         
-        return {'success': True, 'path': project_path}
+        return {
+            'success': True,
+            'message': f'Python to EXE conversion successful! EXE is in Downloads/',
+            'exePath': exe_path,
+            'appDir': None if single_file else output_path,
+            'exeName': f'{exe_name}{EXE_SUFFIX}',
+            'size': f'{exe_size / (1024*1024):.2f} MB',
+            'mode': 'layered',
+            'cache': 'bypass' if force else 'miss',
+            'fingerprint': fingerprint,
+            'dependencyLayer': {'key': layer_key, 'cache': 'miss' if process else 'hit',
+                                'imports': len(settings['imports'])},
+            'appLayer': app_stats,
+            'seconds': round(elapsed, 3),
+            'phases': timings.phases,
+            'peakRss': process.peak_rss if process else None,
+            'exeSize': exe_size
+        }
     
-    def scan_folder(self, folder_path):
-        """Scan folder for HTML/CSS/JS files and return structure with analysis"""
+    def convert_python_to_exe(self, data, job=None):
+        """Convert Python script/project to EXE"""
         try:
-            folder_path = os.path.abspath(folder_path)
+            timings = BuildTimings()
+            python_path = data.get('pythonPath', '')
+            exe_name = data.get('exeName', 'MyApp')
+            hide_console = data.get('hideConsole', True)
+            single_file = data.get('singleFile', True)
+            optimize = data.get('optimize', False)
+            # true means level 2; a number picks the level (1 strips asserts, 2 also docstrings)
+            optimize_level = (2 if optimize else 0) if isinstance(optimize, bool) else optimize
+            if optimize_level not in (0, 1, 2):
+                return {'error': f'optimize must be true, false or a level from 0 to 2, got {optimize!r}'}
             
-            # Check if folder exists
-            if not os.path.isdir(folder_path):
-                return {'error': 'Invalid folder path'}
+            print(f"\n{'='*60}")
+            print(f"🔨 PYTHON TO EXE CONVERSION")
+            print(f"{'='*60}")
+            print(f"Python Project: {python_path}")
+            print(f"EXE Name: {exe_name}")
+            print(f"Hide Console: {hide_console}")
+            print(f"Single File: {single_file}")
+            print(f"Optimize: level {optimize_level}")
             
-            # Find main HTML file
-            html_files = []
-            css_files = []
-            js_files = []
-            asset_files = []
-            total_files = 0
+            # Validate Python project path
+            if not os.path.exists(python_path):
+                return {'error': f'Python project path not found: {python_path}'}
             
-            for root, dirs, files in os.walk(folder_path):
-                # Skip node_modules and other common ignored directories
-                dirs[:] = [d for d in dirs if d not in ['node_modules', '.git', '.vscode', '__pycache__', 'dist', 'build']]
-                
-                for file in files:
-                    total_files += 1
-                    if file.endswith('.html'):
-                        html_files.append(os.path.relpath(os.path.join(root, file), folder_path))
-                    elif file.endswith(('.css', '.scss', '.sass')):
-                        css_files.append(os.path.relpath(os.path.join(root, file), folder_path))
-                    elif file.endswith('.js'):
-                        js_files.append(os.path.relpath(os.path.join(root, file), folder_path))
-                    elif file.endswith(('png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.ico')):
-                        asset_files.append(os.path.relpath(os.path.join(root, file), folder_path))
+            python_path = os.path.abspath(python_path)
             
-            # Find entry point (index.html or first HTML file)
-            entry_file = None
-            if 'index.html' in html_files:
-                entry_file = 'index.html'
-            elif html_files:
-                entry_file = html_files[0]
+            # Find entry point (main.py, app.py, or first .py file)
+            entry_point = None
+            py_files = []
             
-            # Extract folder name for project name
-            folder_name = os.path.basename(folder_path)
+            for file in os.listdir(python_path):
+                if file.endswith('.py'):
+                    py_files.append(file)
+                    if file in ['main.py', 'app.py', 'run.py']:
+                        entry_point = file
             
-            # Analyze project for framework and version info
-            analyzer = ProjectAnalyzer(folder_path)
-            analysis = analyzer.analyze()
+            # If no standard entry point found, use first Python file
+            if not entry_point and py_files:
+                entry_point = py_files[0]
             
-            return {
-                'success': True,
-                'folderPath': folder_path,
-                'folderName': folder_name,
-                'entryFile': entry_file,
-                'htmlFiles': html_files,
-                'cssFiles': css_files,
-                'jsFiles': js_files,
-                'assetFiles': asset_files[:10],  # Limit to 10 for preview
-                'totalFiles': total_files,
-                'summary': {
-                    'htmlCount': len(html_files),
-                    'cssCount': len(css_files),
-                    'jsCount': len(js_files),
-                    'assetCount': len(asset_files)
-                },
-                'analysis': analysis  # Add analysis results
-            }
+            if not entry_point:
+                return {
+                    'error': 'No Python (.py) files found in the project folder. Please ensure your project has a main.py, app.py, or other Python file.'
+                }
+            
+            entry_point_path = os.path.join(python_path, entry_point)
+            print(f"✓ Entry point: {entry_point}")
+            
+            # Check for requirements.txt
+            requirements_path = os.path.join(python_path, 'requirements.txt')
+            has_requirements = os.path.exists(requirements_path)
+            if has_requirements:
+                print(f"✓ Dependencies file found: requirements.txt")
+            
+            # Analyze project for data files and dependencies
+            print(f"\n📊 Analyzing project structure...")
+            datas_list = []
+            binaries_list = []
+            
+            # Import graph of every module reachable from the entry point, and the data files it refers to
+            try:
+                data_include, data_exclude = PythonImportScanner.load_manifest(python_path, data.get('dataFiles'))
+            except ValueError as e:
+                return {'error': f'Invalid data file manifest: {e}'}
+            import_scan = PythonImportScanner(python_path).scan(entry_point, data_include, data_exclude)
+            hidden_imports = import_scan['hiddenimports']
+            excludes = import_scan['excludes']
+            print(f"  🔍 Parsed {import_scan['parsed']} of {import_scan['modules']} modules "
+                  f"({import_scan['reused']} cached), {import_scan['reachable']} reachable from {entry_point}")
+            for dist, version in import_scan['distributions'].items():
+                print(f"  📚 Uses {dist} {version}")
+            for module in hidden_imports:
+                print(f"  🔍 Hidden import: {module}")
+            if excludes:
+                print(f"  ✂️  Excluding unused: {', '.join(excludes)}")
+            for module in import_scan['missing']:
+                print(f"  ⚠️  Imported but not installed in the builder's environment: {module}")
+            for rel_path, error in import_scan['errors'].items():
+                print(f"  ⚠️  Could not parse {rel_path}: {error}")
+            
+            # Only the data files the code refers to (or the manifest includes) are bundled,
+            # each at its project-relative folder so __file__-relative paths still resolve
+            for rel_path in import_scan['dataFiles']:
+                datas_list.append((os.path.join(python_path, *rel_path.split('/')), os.path.dirname(rel_path) or '.'))
+            for rel_path in import_scan['dataFiles'][:20]:
+                print(f"  📦 Data file: {rel_path}")
+            if len(import_scan['dataFiles']) > 20:
+                print(f"  📦 ... and {len(import_scan['dataFiles']) - 20} more data files")
+            print(f"  📦 {len(import_scan['dataFiles'])} data files from {import_scan['dataReferences']} path references")
+            
+            timings.lap('scan')
+            
+            # Create build directory
+            user_home = os.path.expanduser('~')
+            build_base_dir = os.path.join(user_home, 'Documents', 'HTMLToExe_PythonBuilds')
+            build_dir = data.get('buildDir') or os.path.join(build_base_dir, exe_name)
+            output_dir = data.get('outputDir') or os.path.join(user_home, 'Downloads')
+            
+            os.makedirs(output_dir, exist_ok=True)
+            os.makedirs(build_dir, exist_ok=True)
+            os.makedirs(os.path.join(build_dir, 'build'), exist_ok=True)
+            
+            print(f"\n📁 Build directory: {build_dir}")
+            
+            # Icon: uploaded once to /api/icons and referenced by id
+            final_icon_path = None
+            try:
+                icon_source = self.icon_store.from_request(data)
+            except ValueError as e:
+                return {'error': f'Invalid icon: {e}'}
+            if icon_source:
+                print(f"📥 Icon file: {os.path.basename(icon_source)}")
+                final_icon_path = self.icon_store.ico_for(icon_source)
+            timings.lap('icon')
+            
+            # Default: reuse the dependency layer for this import set, rebuild only the app layer
+            if data.get('layered', True):
+                return self.layered_python_build(python_path, import_scan, exe_name, output_dir, {
+                    'imports': import_scan['imports'],
+                    'excludes': excludes,
+                    'distributions': import_scan['distributions'],
+                    'requirements': BuildCache.hash_file(requirements_path) if has_requirements else None,
+                    'optimize': optimize_level,
+                    'singleFile': single_file,
+                    'console': not hide_console,
+                }, final_icon_path, data.get('force'), job, timings)
+            
+            # Generate PyInstaller spec file
+            print(f"\n📝 Generating PyInstaller spec file...")
+            spec_path = os.path.join(build_dir, f'{exe_name}.spec')
+            
+            spec_content = self.python_spec(entry_point_path, python_path, datas_list, hidden_imports, excludes,
+                                            optimize_level, single_file, exe_name, not hide_console, final_icon_path)
+            
+            with open(spec_path, 'w') as f:
+                f.write(spec_content)
+            
+            print(f"✅ Spec file created: {spec_path}")
+            timings.lap('spec')
+            
+            # Create PyInstaller command using spec file
+            cmd = [
+                'pyinstaller',
+                f'--distpath={output_dir}',
+                f'--workpath={os.path.join(build_dir, "build")}',
+                '--noconfirm',
+                '-y',
+                spec_path
+            ]
+            
+            # Onedir builds produce output_dir/<name>/ with the exe inside
+            if single_file:
+                exe_path = output_path = os.path.join(output_dir, f'{exe_name}{EXE_SUFFIX}')
+            else:
+                output_path = os.path.join(output_dir, exe_name)
+                exe_path = os.path.join(output_path, f'{exe_name}{EXE_SUFFIX}')
+            # Without the .exe suffix the two modes share a path; clear the other mode's output
+            if single_file and os.path.isdir(output_path):
+                shutil.rmtree(output_path)
+            elif not single_file and os.path.isfile(output_path):
+                os.remove(output_path)
+            
+            # Skip PyInstaller entirely when these exact inputs were built before
+            fingerprint = self.build_cache.fingerprint(
+                'convert-python-to-exe',
+                texts=[spec_content, ' '.join(cmd)],
+                files=BuildCache.hash_tree(python_path, skip_dirs={'venv', '.venv', 'env', '__pycache__', '.git', 'build', 'dist', 'node_modules'}),
+                extra_files=[final_icon_path],
+            )
+            timings.lap('fingerprint')
+            if not data.get('force') and self.build_cache.restore(fingerprint, output_path):
+                exe_size = BuildCache.path_size(output_path) / (1024*1024)
+                print(f"⚡ Build cache hit ({fingerprint[:12]}), skipped PyInstaller")
+                print(f"EXE File: {exe_path}")
+                print(f"{'='*60}\n")
+                return {
+                    'success': True,
+                    'message': f'EXE restored from build cache! EXE is in Downloads/',
+                    'exePath': exe_path,
+                    'appDir': None if single_file else output_path,
+                    'exeName': f'{exe_name}{EXE_SUFFIX}',
+                    'size': f'{exe_size:.2f} MB',
+                    'cache': 'hit',
+                    'fingerprint': fingerprint,
+                    'phases': timings.phases,
+                    'exeSize': BuildCache.path_size(output_path)
+                }
+            
+            print(f"\n⚙️  Running PyInstaller with spec file...")
+            print(f"Spec file: {spec_path}\n")
+            
+            # Run PyInstaller, streaming its output to the job
+            process = PyInstallerProcess(cmd, cwd=build_dir, job=job)
+            process.run()
+            timings.pyinstaller(process)
+            
+            if process.returncode != 0:
+                print(f"\n❌ Build failed!")
+                # The last lines of the output hold the actual error
+                return {
+                    'error': f'PyInstaller build failed: {process.tail(10)}',
+                    'phases': timings.phases,
+                    'peakRss': process.peak_rss
+                }
+            
+            if os.path.exists(exe_path):
+                self.build_cache.store(fingerprint, output_path, name=f'{exe_name}{EXE_SUFFIX}')
+                timings.lap('cacheStore')
+                exe_size = BuildCache.path_size(output_path) / (1024*1024)
+                print(f"\n✨ BUILD SUCCESSFUL!")
+                print(f"EXE File: {exe_path}")
+                print(f"Size: {exe_size:.2f} MB")
+                print(f"{'='*60}\n")
+                
+                return {
+                    'success': True,
+                    'message': f'Python to EXE conversion successful! EXE is in Downloads/',
+                    'exePath': exe_path,
+                    'appDir': None if single_file else output_path,
+                    'exeName': f'{exe_name}{EXE_SUFFIX}',
+                    'size': f'{exe_size:.2f} MB',
+                    'cache': 'bypass' if data.get('force') else 'miss',
+                    'fingerprint': fingerprint,
+                    'phases': timings.phases,
+                    'peakRss': process.peak_rss,
+                    'exeSize': BuildCache.path_size(output_path)
+                }
+            else:
+                print(f"❌ EXE was not created at expected location!")
+                print(f"Checked: {exe_path}")
+                return {
+                    'error': 'EXE was not created. Check the build output above for errors.'
+                }
+        
         except Exception as e:
-            return {'error': f'Error scanning folder: {str(e)}'}
+            print(f"\n❌ BUILD ERROR: {str(e)}")
+            import traceback
+            traceback.print_exc()
+            return {'error': f'Build error: {str(e)}'}
     
     def create_project(self, name, template='blank', author='', version='1.0.0', description=''):
         """Create a new project"""
@@ -1533,14 +6118,825 @@ p {
         self.create_blank_template(path)
 
 
+class BatchBuilder:
+    """Headless batch builds for `builder.py build` (CI runners, no display needed)
+    
+    Targets are project ids, folders, or entries of a JSON manifest. Each build runs
+    in its own process through the same HTMLToEXEBuilder methods the HTTP API queues,
+    with its own PyInstaller workpath and log file. Batches of DAEMON_MIN_BUILDS or
+    more share one PyInstaller worker; its warm-up costs more than it saves a
+    smaller batch.
+    """
+    
+    DAEMON_MIN_BUILDS = 4
+    
+    def __init__(self, projects_dir='projects', max_workers=None, output_dir=None, work_dir=None,
+                 defaults=None, build_daemon=True):
+        self.projects_dir = projects_dir
+        self.build_daemon = build_daemon
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.output_dir = os.path.abspath(output_dir) if output_dir else None
+        if work_dir is None:
+            work_dir = os.path.join(os.path.expanduser('~'), 'Documents', 'HTML2EXE', '.batch-builds')
+        self.work_dir = os.path.abspath(work_dir)
+        self.defaults = defaults or {}
+        self.metadata_root = os.path.join(os.path.expanduser('~'), 'Documents', 'HTML2EXE')
+        self.icon_store = IconStore()
+        self.icon_ids = {}
+    
+    def load_manifest(self, manifest_path):
+        """Entries from a manifest: a JSON list, or {"defaults": {...}, "builds": [...]}
+        
+        Entries are a project id / folder string, or an object with "project" or
+        "folder" plus optional "name", "kind" ("html" or "python"), "icon" (a .png or
+        .ico file) and build options (fastPackage, force, hideConsole, ...). Relative
+        folders and icons resolve from the manifest.
+        """
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if isinstance(manifest, list):
+            manifest = {'builds': manifest}
+        
+        base_dir = os.path.dirname(os.path.abspath(manifest_path))
+        entries = []
+        for entry in manifest.get('builds', []):
+            if isinstance(entry, str):
+                entry = {'target': entry}
+            entry = {**manifest.get('defaults', {}), **entry}
+            for key in ('folder', 'icon'):
+                if entry.get(key):
+                    entry[key] = os.path.join(base_dir, entry[key])
+            entries.append(entry)
+        return entries
+    
+    def resolve(self, entry):
+        """Turn a target string or manifest entry into a build task"""
+        if isinstance(entry, str):
+            entry = {'target': entry}
+        entry = dict(entry)
+        options = {**self.defaults, **{k: v for k, v in entry.items()
+                                       if k not in ('target', 'project', 'folder', 'name', 'kind')}}
+        
+        target = entry.get('target')
+        if target and os.path.isdir(target):
+            entry['folder'] = target
+        elif target:
+            entry['project'] = target
+        
+        if entry.get('project'):
+            project_id = entry['project']
+            project_json_path = os.path.join(self.metadata_root, project_id, 'project.json')
+            if not os.path.exists(project_json_path):
+                raise ValueError(f'Not a folder or known project id: {project_id}')
+            with open(project_json_path, 'r', encoding='utf-8') as f:
+                project_meta = json.load(f)
+            name = entry.get('name') or project_meta.get('name', project_id)
+            kind = 'build-project'
+            data = {'projectId': project_id, 'projectName': name}
+        else:
+            folder = os.path.abspath(entry['folder'])
+            if not os.path.isdir(folder):
+                raise ValueError(f'Folder not found: {folder}')
+            name = entry.get('name') or os.path.basename(folder)
+            kind = {'html': 'build-project', 'python': 'convert-python-to-exe'}.get(entry.get('kind')) \
+                or self.detect_kind(folder)
+            if kind == 'build-project':
+                folder_id = hashlib.sha1(folder.encode('utf-8')).hexdigest()[:12]
+                data = {'projectId': f'cli-{folder_id}', 'projectName': name, 'projectFolder': folder}
+            else:
+                data = {'pythonPath': folder, 'exeName': name.replace(' ', '_')}
+        
+        exe_name = data.get('exeName') or name.replace(' ', '_')
+        icon_file = options.pop('icon', None)
+        data.update(options)
+        if icon_file:
+            data['iconId'] = self.import_icon(icon_file)
+        data['buildDir'] = os.path.join(self.work_dir, exe_name)
+        if self.output_dir:
+            data['outputDir'] = self.output_dir
+        return {'kind': kind, 'name': name, 'exeName': exe_name, 'data': data,
+                'target': entry.get('target') or entry.get('project') or entry.get('folder'),
+                'log': os.path.join(data['buildDir'], 'build.log'),
+                'projectsDir': self.projects_dir}
+    
+    def import_icon(self, icon_file):
+        """Icon id for a file on disk, adding it to the icon store once per path"""
+        icon_file = os.path.abspath(icon_file)
+        if icon_file not in self.icon_ids:
+            if not os.path.isfile(icon_file):
+                raise ValueError(f'Icon not found: {icon_file}')
+            with open(icon_file, 'rb') as f:
+                try:
+                    icon_id, _ = self.icon_store.save_stream(f, os.path.getsize(icon_file))
+                except ValueError as e:
+                    raise ValueError(f'Invalid icon {icon_file}: {e}')
+            self.icon_ids[icon_file] = icon_id
+        return self.icon_ids[icon_file]
+    
+    @staticmethod
+    def detect_kind(folder):
+        names = os.listdir(folder)
+        if any(name.lower().endswith(('.html', '.htm')) for name in names):
+            return 'build-project'
+        if any(name.endswith('.py') for name in names):
+            return 'convert-python-to-exe'
+        raise ValueError(f'No index.html or .py files in {folder}')
+    
+    def run(self, entries):
+        """Build every entry on a process pool and return the summary"""
+        tasks = [self.resolve(entry) for entry in entries]
+        exe_names = [task['exeName'] for task in tasks]
+        duplicates = sorted({name for name in exe_names if exe_names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f'Several builds would write the same exe: {", ".join(duplicates)}')
+        
+        # One PyInstaller worker serves every build process (jobs fork inside it),
+        # warming only the module graphs these builds start from
+        daemon = None
+        if self.build_daemon and len(tasks) >= self.DAEMON_MIN_BUILDS and PyInstallerDaemon.supported():
+            daemon = PyInstallerDaemon(graphs=sorted({name for task in tasks
+                                                      for name in PyInstallerDaemon.KIND_GRAPHS[task['kind']]}))
+            try:
+                with contextlib.redirect_stdout(sys.stderr):
+                    daemon.start()
+                PyInstallerProcess.daemon = daemon
+                for task in tasks:
+                    task['daemon'] = daemon.address()
+            except (OSError, RuntimeError) as e:
+                print(f"⚠️  Building without the PyInstaller worker: {e}", file=sys.stderr)
+                daemon = None
+        try:
+            return self._run_tasks(tasks)
+        finally:
+            if daemon:
+                daemon.stop()
+                PyInstallerProcess.daemon = None
+    
+    def _run_tasks(self, tasks):
+        from concurrent.futures import ProcessPoolExecutor
+        
+        # Shared icons are converted, and fast packages' runtime stubs built, once up
+        # front instead of by every worker that needs them
+        with contextlib.redirect_stdout(sys.stderr):
+            icon_paths = {icon_id: self.icon_store.ico_for(self.icon_store.path(icon_id))
+                          for icon_id in sorted({task['data'].get('iconId') for task in tasks} - {None})}
+            stub_icons = {task['data'].get('iconId') for task in tasks
+                          if task['kind'] == 'build-project' and task['data'].get('fastPackage')}
+            for icon_id in sorted(stub_icons, key=str):
+                RuntimeStubCache().get(icon_paths.get(icon_id))
+        
+        started = time.time()
+        results = []
+        print(f"🏗️  Building {len(tasks)} target(s) on {self.max_workers} worker process(es)", file=sys.stderr)
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {pool.submit(BatchBuilder.build_task, task): task for task in tasks}
+            for future in as_completed(futures):
+                task = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = {'target': task['target'], 'kind': task['kind'], 'name': task['name'],
+                              'status': 'failed', 'error': f'Worker crashed: {e}', 'log': task['log']}
+                icon = '✅' if result['status'] == 'succeeded' else '❌'
+                # Errors end with PyInstaller's last output line; the full text is in the summary
+                error = (result.get('error') or '').strip().splitlines()
+                print(f"{icon} {result['name']} ({result['kind']}) {result.get('seconds', 0):.1f}s"
+                      f"{'  ' + error[-1] if error else ''}", file=sys.stderr)
+                results.append(result)
+        
+        order = {task['target']: index for index, task in enumerate(tasks)}
+        results.sort(key=lambda r: order.get(r['target'], 0))
+        return {
+            'success': all(r['status'] == 'succeeded' for r in results),
+            'succeeded': sum(1 for r in results if r['status'] == 'succeeded'),
+            'failed': sum(1 for r in results if r['status'] == 'failed'),
+            'workers': self.max_workers,
+            'seconds': round(time.time() - started, 3),
+            'builds': results,
+        }
+    
+    @staticmethod
+    def build_task(task):
+        """Worker process: one build, with its console output captured in its log file"""
+        os.makedirs(os.path.dirname(task['log']), exist_ok=True)
+        started = time.time()
+        if task.get('daemon'):
+            PyInstallerProcess.daemon = PyInstallerDaemon.attach(task['daemon'])
+        with open(task['log'], 'w', encoding='utf-8') as log, \
+                contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+            builder = HTMLToEXEBuilder(projects_dir=task['projectsDir'], build_daemon=False)
+            try:
+                result = getattr(builder, BuildJobQueue.handlers[task['kind']])(task['data'])
+            except Exception as e:
+                result = {'error': f'Build error: {str(e)}'}
+            finished = time.time()
+            try:
+                builder.build_history.record(task['kind'], task['name'], result, started, finished)
+            except Exception as e:
+                print(f"⚠️  Could not record build history: {e}")
+        
+        return {
+            'target': task['target'],
+            'kind': task['kind'],
+            'name': task['name'],
+            'status': 'failed' if result.get('error') else 'succeeded',
+            'seconds': round(finished - started, 3),
+            'exePath': result.get('exePath'),
+            'exeSize': result.get('exeSize'),
+            'cache': result.get('cache'),
+            'phases': result.get('phases'),
+            'peakRss': result.get('peakRss'),
+            'sizeBudget': result.get('sizeBudget'),
+            'optimization': result.get('optimization'),
+            'frontend': result.get('frontend'),
+            'error': result.get('error'),
+            'log': task['log'],
+        }
+
+
+class StartupBenchmark:
+    """Cold import time and time-to-first-request, each measured in a fresh interpreter
+    
+    `builder.py bench-startup` exits non-zero when a budget is exceeded or when a
+    plain `import builder` pulls in modules that are meant to load lazily.
+    """
+    
+    LAZY_MODULES = ('webview', 'tkinter', 'PIL', 'ahocorasick', 'importlib.metadata',
+                    'concurrent.futures.process', 'subprocess', 'sqlite3', 'gzip')
+    
+    def __init__(self, runs=5):
+        self.runs = runs
+        self.module_dir = os.path.dirname(os.path.abspath(__file__))
+    
+    def import_profile(self):
+        """One `python -X importtime -c "import builder"`: total ms, slowest direct imports, lazy leaks"""
+        import subprocess
+        process = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import builder'],
+                                 cwd=self.module_dir, capture_output=True, text=True)
+        if process.returncode != 0:
+            raise RuntimeError(f'import builder failed:\n{process.stderr[-2000:]}')
+        
+        total_ms, direct, loaded = None, [], set()
+        for line in process.stderr.splitlines():
+            if not line.startswith('import time:') or 'self [us]' in line:
+                continue
+            _, cumulative, name = line[len('import time:'):].split('|')
+            depth = (len(name) - len(name.lstrip())) // 2
+            module = name.strip()
+            loaded.add(module)
+            if module == 'builder' and depth == 0:
+                total_ms = int(cumulative) / 1000
+            elif depth == 1:
+                direct.append((module, int(cumulative) / 1000))
+        
+        direct.sort(key=lambda item: item[1], reverse=True)
+        return {
+            'importMs': total_ms,
+            'slowestImports': direct[:8],
+            'lazyModulesLoaded': [m for m in self.LAZY_MODULES if m in loaded],
+        }
+    
+    def first_request_ms(self):
+        """Spawn the builder server and time until /api/jobs answers"""
+        import http.client
+        import socket
+        import subprocess
+        import tempfile
+        
+        with socket.socket() as probe:
+            probe.bind(('localhost', 0))
+            port = probe.getsockname()[1]
+        projects_dir = tempfile.mkdtemp(prefix='html2exe-bench-')
+        # No PyInstaller worker: spawning and warming one per run would skew the timing
+        code = ('import builder, time\n'
+                f'builder.HTMLToEXEBuilder(projects_dir={projects_dir!r}, port={port}, build_daemon=False)'
+                '.start_server()\n'
+                'time.sleep(60)\n')
+        
+        started = time.perf_counter()
+        process = subprocess.Popen([sys.executable, '-c', code], cwd=self.module_dir,
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            while time.perf_counter() - started < 30:
+                try:
+                    conn = http.client.HTTPConnection('localhost', port, timeout=5)
+                    conn.request('GET', '/api/jobs')
+                    if conn.getresponse().status == 200:
+                        return (time.perf_counter() - started) * 1000
+                except OSError:
+                    if process.poll() is not None:
+                        raise RuntimeError('builder server exited during startup')
+                    time.sleep(0.005)
+            raise RuntimeError('builder server did not answer within 30s')
+        finally:
+            process.kill()
+            process.wait()
+            shutil.rmtree(projects_dir, ignore_errors=True)
+    
+    def run(self):
+        """Median of several runs of both measurements"""
+        profiles = [self.import_profile() for _ in range(self.runs)]
+        first_requests = sorted(self.first_request_ms() for _ in range(self.runs))
+        import_times = sorted(p['importMs'] for p in profiles)
+        return {
+            'runs': self.runs,
+            'importMs': round(import_times[len(import_times) // 2], 1),
+            'firstRequestMs': round(first_requests[len(first_requests) // 2], 1),
+            'slowestImports': [[name, round(ms, 1)] for name, ms in profiles[-1]['slowestImports']],
+            'lazyModulesLoaded': sorted({m for p in profiles for m in p['lazyModulesLoaded']}),
+        }
+
+
+class ServerLoadBenchmark:
+    """Latency of GET /api/projects while scan-folder walks a large tree
+    
+    `builder.py bench-load` spawns the builder server with its home folder (and so
+    every cache) in a temp dir, generates a project of FILES JavaScript files, and
+    keeps scan-folder running over it while keep-alive clients time project listing.
+    The analysis cache is cleared before each scan so every scan does the full walk.
+    """
+    
+    def __init__(self, clients=4, requests=200, files=20000):
+        self.clients = clients
+        self.requests = requests
+        self.files = files
+        self.module_dir = os.path.dirname(os.path.abspath(__file__))
+    
+    def make_tree(self, folder):
+        """index.html plus `files` small scripts, 200 per folder"""
+        with open(os.path.join(folder, 'index.html'), 'w', encoding='utf-8') as f:
+            f.write('<!DOCTYPE html><html><body><script src="js/0/0.js"></script></body></html>')
+        for i in range(self.files):
+            sub_dir = os.path.join(folder, 'js', str(i // 200))
+            if i % 200 == 0:
+                os.makedirs(sub_dir, exist_ok=True)
+            with open(os.path.join(sub_dir, f'{i}.js'), 'w', encoding='utf-8') as f:
+                f.write(f'export function f{i}(x) {{ return document.querySelector("#n{i}") || x; }}\n')
+    
+    def run(self):
+        """p50/p99 of project listing under scan load, and how many scans ran meanwhile"""
+        import http.client
+        import socket
+        import subprocess
+        import tempfile
+        
+        home = tempfile.mkdtemp(prefix='html2exe-load-')
+        tree = os.path.join(home, 'tree')
+        os.makedirs(tree)
+        self.make_tree(tree)
+        analysis_cache = os.path.join(home, 'Documents', 'HTML2EXE', '.analysis-cache')
+        
+        with socket.socket() as probe:
+            probe.bind(('localhost', 0))
+            port = probe.getsockname()[1]
+        code = ('import builder, time\n'
+                f'builder.HTMLToEXEBuilder(projects_dir={os.path.join(home, "projects")!r}, port={port}, '
+                'build_daemon=False).start_server()\n'
+                'time.sleep(3600)\n')
+        env = {**os.environ, 'HOME': home, 'USERPROFILE': home}
+        process = subprocess.Popen([sys.executable, '-c', code], cwd=self.module_dir, env=env,
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        
+        def request(conn, method, path, body=None):
+            conn.request(method, path, body=body, headers={'Content-Type': 'application/json'})
+            response = conn.getresponse()
+            response.read()
+            if response.status != 200:
+                raise RuntimeError(f'{method} {path} answered {response.status}')
+        
+        stop = threading.Event()
+        scans = []
+        
+        def scan_loop():
+            conn = http.client.HTTPConnection('localhost', port, timeout=300)
+            body = json.dumps({'folderPath': tree})
+            while not stop.is_set():
+                shutil.rmtree(analysis_cache, ignore_errors=True)
+                started = time.perf_counter()
+                request(conn, 'POST', '/api/scan-folder', body)
+                scans.append((time.perf_counter() - started) * 1000)
+            conn.close()
+        
+        def client(latencies):
+            conn = http.client.HTTPConnection('localhost', port, timeout=60)
+            for _ in range(self.requests // self.clients):
+                started = time.perf_counter()
+                request(conn, 'GET', '/api/projects')
+                latencies.append((time.perf_counter() - started) * 1000)
+            conn.close()
+        
+        try:
+            deadline = time.time() + 30
+            while True:
+                try:
+                    request(http.client.HTTPConnection('localhost', port, timeout=5), 'GET', '/api/projects')
+                    break
+                except OSError:
+                    if process.poll() is not None or time.time() > deadline:
+                        raise RuntimeError('builder server did not start')
+                    time.sleep(0.05)
+            
+            scanner = threading.Thread(target=scan_loop, daemon=True)
+            scanner.start()
+            # Let the first scan get going before timing starts
+            time.sleep(0.2)
+            latencies = [[] for _ in range(self.clients)]
+            workers = [threading.Thread(target=client, args=(latencies[i],)) for i in range(self.clients)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            stop.set()
+            scanner.join()
+        finally:
+            process.kill()
+            process.wait()
+            shutil.rmtree(home, ignore_errors=True)
+        
+        times = sorted(ms for client_times in latencies for ms in client_times)
+        if not times or not scans:
+            raise RuntimeError('no requests completed')
+        scans.sort()
+        return {
+            'clients': self.clients,
+            'requests': len(times),
+            'files': self.files,
+            'p50Ms': round(times[len(times) // 2], 1),
+            'p99Ms': round(times[min(len(times) - 1, int(len(times) * 0.99))], 1),
+            'maxMs': round(times[-1], 1),
+            'scans': len(scans),
+            'scanMedianMs': round(scans[len(scans) // 2], 1),
+        }
+
+
+class SignatureBenchmark:
+    """Substring searches against the Aho-Corasick automaton in SignatureMatcher
+    
+    `builder.py bench-signatures` scans a generated JavaScript file with each
+    shipped signature scope and with synthetic tables of growing size, both ways,
+    to show where AUTOMATON_MIN_PATTERNS belongs.
+    """
+    
+    SIZES = (8, 16, 24, 32, 48, 64, 96)
+    WORDS = ('const', 'let', 'function', 'return', 'document', 'querySelector', 'addEventListener', 'window',
+             '=>', '{', '}', '(', ')', ';', 'if', 'else', 'for', 'item', 'value', 'this.state', 'props')
+    
+    def __init__(self, runs=50, text_bytes=300000):
+        self.runs = runs
+        self.text_bytes = text_bytes
+    
+    def sample_text(self):
+        """Framework-free source text, so every pattern is searched to the end"""
+        import random
+        words = random.Random(0).choices(self.WORDS, k=self.text_bytes // 4)
+        return ' '.join(words)[:self.text_bytes]
+    
+    def time_ms(self, matcher, text):
+        """Median ms per scan"""
+        matcher.scan(text)
+        times = []
+        for _ in range(self.runs):
+            started = time.perf_counter()
+            matcher.scan(text)
+            times.append((time.perf_counter() - started) * 1000)
+        times.sort()
+        return round(times[len(times) // 2], 3)
+    
+    def measure(self, name, signatures, text):
+        literals = SignatureMatcher(signatures, automaton=False)
+        return {
+            'table': name,
+            'literals': len(literals.literals),
+            'substringMs': self.time_ms(literals, text),
+            'automatonMs': self.time_ms(SignatureMatcher(signatures, automaton=True), text),
+        }
+    
+    def run(self):
+        """Timings per table, and the smallest synthetic table where the automaton wins"""
+        if not HAS_AHOCORASICK:
+            raise RuntimeError('pyahocorasick is not installed (pip install pyahocorasick)')
+        text = self.sample_text()
+        tables = [self.measure(scope, [s for s in FRAMEWORK_SIGNATURES if s['scope'] == scope], text)
+                  for scope in ('html', 'js')]
+        
+        # Synthetic tables: the shipped literals, then numbered variants of them
+        shipped = [pattern for signature in FRAMEWORK_SIGNATURES if signature['scope'] != 'package'
+                   for pattern in signature['patterns'] if not pattern.startswith('re:')]
+        crossover = None
+        for size in self.SIZES:
+            signatures = [{'name': f'synthetic-{i}', 'patterns': [shipped[i % len(shipped)] +
+                                                                   (f'#{i}' if i >= len(shipped) else '')]}
+                          for i in range(size)]
+            row = self.measure(f'synthetic-{size}', signatures, text)
+            tables.append(row)
+            if crossover is None and row['automatonMs'] < row['substringMs']:
+                crossover = size
+        return {
+            'runs': self.runs,
+            'textBytes': len(text),
+            'threshold': SignatureMatcher.AUTOMATON_MIN_PATTERNS,
+            'crossover': crossover,
+            'tables': tables,
+        }
+
+
+class ColdStartBenchmark:
+    """Launch time of a sample Python app frozen in each output mode
+    
+    `builder.py bench-coldstart` converts SAMPLE_APP as onefile and onedir, each at
+    optimize level 0 and 2, then times complete runs (spawn to exit) of every exe.
+    Runs are interleaved across modes so disk cache and CPU drift affect all alike.
+    """
+    
+    SAMPLE_APP = """\"\"\"Cold-start sample: a typical standard-library-heavy command line tool\"\"\"
+import argparse
+import asyncio
+import csv
+import decimal
+import email.mime.text
+import http.client
+import json
+import logging
+import sqlite3
+import sys
+import xml.etree.ElementTree
+
+
+def summarize(rows):
+    \"\"\"Total of the amount column, as a Decimal\"\"\"
+    assert rows, 'no rows'
+    return sum(decimal.Decimal(row['amount']) for row in rows)
+
+
+if __name__ == '__main__':
+    rows = [{'amount': '1.25'}, {'amount': '2.50'}]
+    docstrings = 'stripped' if summarize.__doc__ is None else 'kept'
+    print(f'ready total={summarize(rows)} optimize={sys.flags.optimize} docstrings={docstrings}')
+"""
+    MODES = (
+        ('onefile', True, 0),
+        ('onefile-O2', True, 2),
+        ('onedir', False, 0),
+        ('onedir-O2', False, 2),
+    )
+    
+    def __init__(self, runs=10, work_dir=None):
+        self.runs = runs
+        if work_dir is None:
+            work_dir = os.path.join(os.path.expanduser('~'), 'Documents', 'HTML2EXE', '.coldstart-bench')
+        self.work_dir = os.path.abspath(work_dir)
+    
+    def build(self):
+        """Convert the sample app in every mode; returns {mode: result dict}"""
+        app_dir = os.path.join(self.work_dir, 'app')
+        os.makedirs(app_dir, exist_ok=True)
+        with open(os.path.join(app_dir, 'main.py'), 'w', encoding='utf-8') as f:
+            f.write(self.SAMPLE_APP)
+        
+        builder = HTMLToEXEBuilder(projects_dir=os.path.join(self.work_dir, 'projects'))
+        results = {}
+        for mode, single_file, optimize in self.MODES:
+            print(f"🏗️  Building {mode}...", file=sys.stderr)
+            with contextlib.redirect_stdout(sys.stderr):
+                result = builder.convert_python_to_exe({
+                    'pythonPath': app_dir,
+                    'exeName': f'coldstart-{mode}',
+                    'hideConsole': False,
+                    'singleFile': single_file,
+                    'optimize': optimize,
+                    'buildDir': os.path.join(self.work_dir, 'build', mode),
+                    'outputDir': os.path.join(self.work_dir, 'dist'),
+                })
+            if result.get('error'):
+                raise RuntimeError(f'{mode} build failed: {result["error"]}')
+            results[mode] = result
+        return results
+    
+    @staticmethod
+    def launch_ms(exe_path):
+        """One full run of the exe; returns (ms, first line of its output)"""
+        import subprocess
+        started = time.perf_counter()
+        process = subprocess.run([exe_path], capture_output=True, text=True)
+        elapsed = (time.perf_counter() - started) * 1000
+        if process.returncode != 0 or not process.stdout.startswith('ready'):
+            raise RuntimeError(f'{exe_path} failed ({process.returncode}):\n{process.stderr[-2000:]}')
+        return elapsed, process.stdout.strip()
+    
+    def run(self):
+        """Median and best launch time per mode, plus the size each mode ships"""
+        builds = self.build()
+        samples = {mode: [] for mode in builds}
+        output = {}
+        for mode, result in builds.items():
+            # First launch only warms the disk cache
+            _, output[mode] = self.launch_ms(result['exePath'])
+        for _ in range(self.runs):
+            for mode, result in builds.items():
+                samples[mode].append(self.launch_ms(result['exePath'])[0])
+        
+        modes = []
+        for mode, single_file, optimize in self.MODES:
+            times = sorted(samples[mode])
+            modes.append({
+                'mode': mode,
+                'singleFile': single_file,
+                'optimize': optimize,
+                'medianMs': round(times[len(times) // 2], 1),
+                'bestMs': round(times[0], 1),
+                'sizeBytes': builds[mode]['exeSize'],
+                'output': output[mode],
+            })
+        return {'runs': self.runs, 'modes': modes}
+
+
 def main():
     parser = argparse.ArgumentParser(description='HTML to EXE Builder')
     parser.add_argument('--port', type=int, default=8000, help='Server port')
     parser.add_argument('--projects', default='projects', help='Projects directory')
+    parser.add_argument('--build-workers', type=int, default=None, help='Concurrent builds (default: CPU count)')
+    parser.add_argument('--http-threads', type=int, default=32, help='HTTP worker threads')
+    parser.add_argument('--build-cache-mb', type=int, default=2048, help='Build cache size limit in MB')
+    parser.add_argument('--no-build-daemon', action='store_true',
+                        help='Start a new pyinstaller process per build instead of a long-lived worker')
+    
+    subparsers = parser.add_subparsers(dest='command')
+    history_parser = subparsers.add_parser('history', help='Show build history and per-project trends')
+    history_parser.add_argument('--project', help='Only builds of this project / exe name')
+    history_parser.add_argument('--kind', choices=sorted(BuildJobQueue.handlers), help='Only builds of this kind')
+    history_parser.add_argument('--limit', type=int, default=200, help='Number of recent builds to consider')
+    history_parser.add_argument('--json', action='store_true', help='Print builds and trends as JSON')
+    
+    build_parser = subparsers.add_parser('build', help='Build projects headlessly (no UI) and print a JSON summary')
+    build_parser.add_argument('targets', nargs='*', help='Project ids or project folders (HTML or Python)')
+    build_parser.add_argument('--manifest', help='JSON manifest of builds (list, or {"defaults": {}, "builds": []})')
+    build_parser.add_argument('-j', '--jobs', type=int, default=None, help='Parallel builds (default: CPU count)')
+    build_parser.add_argument('--output', help='Folder for built executables (default: Downloads)')
+    build_parser.add_argument('--work-dir', help='Root for per-build PyInstaller workpaths and logs')
+    build_parser.add_argument('--fast', action='store_true', help='Fast-package HTML projects onto the runtime stub')
+    build_parser.add_argument('--force', action='store_true', help='Ignore the build cache')
+    build_parser.add_argument('--icon', help='Icon (.png or .ico) for builds that do not set their own')
+    build_parser.add_argument('--summary', help='Also write the JSON summary to this file')
+    
+    daemon_parser = subparsers.add_parser('pyinstaller-daemon', help='Long-lived PyInstaller worker (started by the builder)')
+    daemon_parser.add_argument('--daemon-port', type=int, default=0, help='Local port to listen on (0: any free port)')
+    daemon_parser.add_argument('--max-jobs', type=int, default=PyInstallerDaemon.MAX_JOBS,
+                               help='Restart after this many jobs')
+    daemon_parser.add_argument('--max-rss-mb', type=int, default=PyInstallerDaemon.MAX_RSS // (1024 * 1024),
+                               help='Restart once the worker uses more memory than this')
+    daemon_parser.add_argument('--graphs', default=','.join(PyInstallerDaemon.GRAPHS),
+                               help='Comma-separated module graphs to warm (stdlib, webview)')
+    
+    bench_parser = subparsers.add_parser('bench-startup', help='Measure import time and time-to-first-request')
+    bench_parser.add_argument('--runs', type=int, default=5, help='Fresh interpreters per measurement')
+    bench_parser.add_argument('--max-import-ms', type=float, default=250, help='Fail above this median import time')
+    bench_parser.add_argument('--max-first-request-ms', type=float, default=1500,
+                              help='Fail above this median time from spawn to first API response')
+    bench_parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    
+    coldstart_parser = subparsers.add_parser('bench-coldstart',
+                                             help='Compare launch time of onefile/onedir and optimized builds')
+    coldstart_parser.add_argument('--runs', type=int, default=10, help='Timed launches per mode')
+    coldstart_parser.add_argument('--work-dir', help='Where the sample app and its builds go')
+    coldstart_parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    
+    load_parser = subparsers.add_parser('bench-load', help='Time project listing while a large folder is scanned')
+    load_parser.add_argument('--clients', type=int, default=4, help='Concurrent keep-alive clients')
+    load_parser.add_argument('--requests', type=int, default=200, help='GET /api/projects requests in total')
+    load_parser.add_argument('--files', type=int, default=20000, help='JavaScript files in the scanned folder')
+    load_parser.add_argument('--max-p99-ms', type=float, default=250, help='Fail above this p99 latency')
+    load_parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    
+    signatures_parser = subparsers.add_parser('bench-signatures',
+                                              help='Compare substring and automaton framework signature matching')
+    signatures_parser.add_argument('--runs', type=int, default=50, help='Timed scans per table and method')
+    signatures_parser.add_argument('--json', action='store_true', help='Print results as JSON')
     
     args = parser.parse_args()
     
-    builder = HTMLToEXEBuilder(projects_dir=args.projects, port=args.port)
+    if args.command == 'pyinstaller-daemon':
+        PyInstallerDaemon.serve(port=args.daemon_port, max_jobs=args.max_jobs,
+                                max_rss=args.max_rss_mb * 1024 * 1024,
+                                graphs=[name for name in args.graphs.split(',') if name])
+        return
+    
+    if args.command == 'bench-startup':
+        result = StartupBenchmark(runs=args.runs).run()
+        failures = []
+        if result['importMs'] > args.max_import_ms:
+            failures.append(f"import builder took {result['importMs']} ms (budget {args.max_import_ms:g} ms)")
+        if result['firstRequestMs'] > args.max_first_request_ms:
+            failures.append(f"first request after {result['firstRequestMs']} ms (budget {args.max_first_request_ms:g} ms)")
+        if result['lazyModulesLoaded']:
+            failures.append(f"import builder loaded lazy modules: {', '.join(result['lazyModulesLoaded'])}")
+        result['failures'] = failures
+        
+        if args.json:
+            print(json.dumps(result, indent=2))
+        else:
+            print(f"⏱️  import builder: {result['importMs']} ms (median of {result['runs']})")
+            print(f"⏱️  spawn -> first API response: {result['firstRequestMs']} ms")
+            print(f"   Slowest direct imports: " +
+                  ', '.join(f'{name} {ms} ms' for name, ms in result['slowestImports']))
+            for failure in failures:
+                print(f"❌ {failure}")
+            if not failures:
+                print(f"✅ Startup within budget")
+        sys.exit(1 if failures else 0)
+    
+    if args.command == 'bench-coldstart':
+        try:
+            result = ColdStartBenchmark(runs=args.runs, work_dir=args.work_dir).run()
+        except (RuntimeError, OSError) as e:
+            print(f"❌ {e}", file=sys.stderr)
+            sys.exit(1)
+        
+        if args.json:
+            print(json.dumps(result, indent=2))
+        else:
+            print(f"⏱️  Launch to exit, median of {result['runs']} runs:")
+            for mode in result['modes']:
+                print(f"   {mode['mode']:<11} {mode['medianMs']:>8} ms  (best {mode['bestMs']} ms, "
+                      f"{mode['sizeBytes'] / (1024*1024):.1f} MB)  {mode['output']}")
+        sys.exit(0)
+    
+    if args.command == 'bench-load':
+        try:
+            result = ServerLoadBenchmark(clients=args.clients, requests=args.requests, files=args.files).run()
+        except (RuntimeError, OSError) as e:
+            print(f"❌ {e}", file=sys.stderr)
+            sys.exit(1)
+        
+        if args.json:
+            print(json.dumps(result, indent=2))
+        else:
+            print(f"⏱️  GET /api/projects during scan-folder ({result['files']} files, {result['clients']} clients): "
+                  f"p50 {result['p50Ms']} ms, p99 {result['p99Ms']} ms, max {result['maxMs']} ms")
+            print(f"   {result['scans']} scans ran meanwhile, median {result['scanMedianMs']} ms each")
+        if result['p99Ms'] > args.max_p99_ms:
+            print(f"❌ p99 {result['p99Ms']} ms is over the {args.max_p99_ms:g} ms budget", file=sys.stderr)
+            sys.exit(1)
+        sys.exit(0)
+    
+    if args.command == 'bench-signatures':
+        try:
+            result = SignatureBenchmark(runs=args.runs).run()
+        except RuntimeError as e:
+            print(f"❌ {e}", file=sys.stderr)
+            sys.exit(1)
+        
+        if args.json:
+            print(json.dumps(result, indent=2))
+        else:
+            print(f"⏱️  Signature scan of {result['textBytes'] // 1000} KB, median of {result['runs']} runs:")
+            for row in result['tables']:
+                print(f"   {row['table']:<13} {row['literals']:>3} literals  substring {row['substringMs']:>7} ms  "
+                      f"automaton {row['automatonMs']:>7} ms")
+            print(f"   Automaton first wins at {result['crossover'] or 'none'} literals "
+                  f"(AUTOMATON_MIN_PATTERNS = {result['threshold']})")
+        sys.exit(0)
+    
+    if args.command == 'build':
+        defaults = {}
+        if args.fast:
+            defaults['fastPackage'] = True
+        if args.force:
+            defaults['force'] = True
+        if args.icon:
+            defaults['icon'] = args.icon
+        batch = BatchBuilder(projects_dir=args.projects, max_workers=args.jobs, output_dir=args.output,
+                             work_dir=args.work_dir, defaults=defaults, build_daemon=not args.no_build_daemon)
+        try:
+            entries = list(args.targets)
+            if args.manifest:
+                entries.extend(batch.load_manifest(args.manifest))
+            if not entries:
+                build_parser.error('give at least one project id, folder or --manifest')
+            summary = batch.run(entries)
+        except (ValueError, OSError) as e:
+            print(f"❌ {e}", file=sys.stderr)
+            sys.exit(2)
+        
+        output = json.dumps(summary, indent=2)
+        print(output)
+        if args.summary:
+            with open(args.summary, 'w', encoding='utf-8') as f:
+                f.write(output)
+        sys.exit(0 if summary['success'] else 1)
+    
+    if args.command == 'history':
+        history = BuildHistory()
+        if args.json:
+            builds = history.query(project=args.project, kind=args.kind, limit=args.limit)
+            print(json.dumps({'builds': builds, 'trends': history.trends(builds)}, indent=2))
+        else:
+            history.print_report(project=args.project, kind=args.kind, limit=args.limit)
+        return
+    
+    builder = HTMLToEXEBuilder(projects_dir=args.projects, port=args.port,
+                               build_workers=args.build_workers, http_threads=args.http_threads,
+                               cache_max_bytes=args.build_cache_mb * 1024 * 1024,
+                               build_daemon=not args.no_build_daemon)
     
     user_home = os.path.expanduser('~')
     projects_cache_dir = os.path.join(user_home, 'Documents', 'HTML2EXE')
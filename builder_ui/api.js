@@ -28,8 +28,10 @@ class BuilderAPI {
     }
     
     // Project endpoints
-    async getProjects() {
-        return this.request('/projects');
+    async getProjects(query = {}) {
+        // query: page, pageSize, sort, order, framework, projectType, createdAfter, createdBefore, built, q
+        const params = new URLSearchParams(query).toString();
+        return this.request(params ? `/projects?${params}` : '/projects');
     }
     
     async getProject(projectId) {
@@ -74,6 +76,28 @@ class BuilderAPI {
         return this.request(`/build-status/${buildId}`);
     }
     
+    async getJobs() {
+        return this.request('/jobs');
+    }
+    
+    async getJob(jobId) {
+        return this.request(`/jobs/${jobId}`);
+    }
+    
+    async uploadIcon(file) {
+        // Raw bytes, not a data URI; returns { success, iconId, size }
+        return this.request('/icons', {
+            method: 'POST',
+            headers: { 'Content-Type': file.type || 'application/octet-stream' },
+            body: file
+        });
+    }
+    
+    jobEvents(jobId) {
+        // Server-Sent Events: 'log' (PyInstaller output line), 'phase' (progress), 'state'
+        return new EventSource(`${this.baseUrl}/jobs/${jobId}/events`);
+    }
+    
     // File endpoints
     async getProjectFiles(projectId) {
         return this.request(`/projects/${projectId}/files`);
@@ -121,36 +145,6 @@ class BuilderAPI {
 // Initialize API
 const api = new BuilderAPI();
 
-// Handle API Events
-class APIEventHandler {
-    constructor(api) {
-        this.api = api;
-        this.setupEventListeners();
-    }
-    
-    setupEventListeners() {
-        // Set up WebSocket or polling for real-time updates
-        this.pollBuildStatus();
-    }
-    
-    pollBuildStatus() {
-        setInterval(async () => {
-            try {
-                // Poll for any active builds
-                const buildElement = document.getElementById('buildProgressSection');
-                if (buildElement && buildElement.style.display !== 'none') {
-                    // Update progress
-                }
-            } catch (error) {
-                console.error('Polling error:', error);
-            }
-        }, 1000);
-    }
-}
-
-// Initialize event handler
-const apiHandler = new APIEventHandler(api);
-
 // WebSocket support for real-time updates
 class BuilderWebSocket {
     constructor(url = 'ws://localhost:8000/ws') {
@@ -238,5 +232,5 @@ try {
 
 // Export for use in other scripts
 if (typeof module !== 'undefined' && module.exports) {
-    module.exports = { BuilderAPI, APIEventHandler, BuilderWebSocket };
+    module.exports = { BuilderAPI, BuilderWebSocket };
 }
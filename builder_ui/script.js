@@ -166,16 +166,26 @@ function updateStats() {
 }
 
 // Projects Page
-function loadProjects() {
+const PROJECTS_PAGE_SIZE = 60;
+let projectQuery = {};   // Server-side filters for /api/projects
+let projectPage = 1;
+let projectTotal = 0;
+
+function loadProjects(append = false) {
     const projectsList = document.getElementById('projectsList');
-    projectsList.innerHTML = '<div class="loading">Loading projects...</div>';
+    if (!append) {
+        projectPage = 1;
+        projectsList.innerHTML = '<div class="loading">Loading projects...</div>';
+    }
     
-    // Fetch projects from API
-    fetch('/api/projects')
+    // Fetch one page of projects from the API
+    const params = new URLSearchParams({ ...projectQuery, page: projectPage, pageSize: PROJECTS_PAGE_SIZE });
+    fetch(`/api/projects?${params}`)
         .then(response => response.json())
         .then(data => {
-            if (data.success && data.projects.length > 0) {
-                projects = data.projects;
+            if (data.success && (data.projects.length > 0 || append)) {
+                projects = append ? projects.concat(data.projects) : data.projects;
+                projectTotal = data.total;
                 updateStats();
                 
                 projectsList.innerHTML = projects.map(project => `
@@ -194,7 +204,11 @@ function loadProjects() {
                             <span>📅 ${new Date(project.created).toLocaleDateString()}</span>
                         </div>
                     </div>
-                `).join('');
+                `).join('') + (projects.length < projectTotal ? `
+                    <button class="btn-secondary load-more" onclick="loadMoreProjects()">
+                        Load more (${projectTotal - projects.length} remaining)
+                    </button>
+                ` : '');
             } else {
                 projects = [];
                 updateStats();
@@ -371,12 +385,25 @@ function showProjectMenu(projectId) {
     }
 }
 
+function loadMoreProjects() {
+    projectPage++;
+    loadProjects(true);
+}
+
 function filterProjects(filter) {
     document.querySelectorAll('.filter-btn').forEach(btn => btn.classList.remove('active'));
     event.target.classList.add('active');
     
-    console.log('Filtering projects:', filter);
-    // Implement filtering logic
+    // Filtering, sorting and paging happen on the server
+    if (filter === 'recent') {
+        const monthAgo = new Date(Date.now() - 30 * 24 * 60 * 60 * 1000);
+        projectQuery = { createdAfter: monthAgo.toISOString().slice(0, 19), sort: 'created', order: 'desc' };
+    } else if (filter === 'built') {
+        projectQuery = { built: 'true', sort: 'lastBuilt', order: 'desc' };
+    } else {
+        projectQuery = {};
+    }
+    loadProjects();
 }
 
 // Create Project Page
@@ -567,28 +594,52 @@ function buildProject() {
     // Prepare build data
     const buildData = {
         projectName: exeName,
-        projectId: projectId
+        projectId: projectId,
+        fastPackage: document.getElementById('fastPackage').checked
     };
     
     // Handle icon file if selected (.ico or .png)
     if (iconInput.files && iconInput.files[0]) {
         const iconFile = iconInput.files[0];
-        const reader = new FileReader();
-        
-        reader.onload = function(e) {
-            // Send icon as base64 data URI
-            buildData.iconData = e.target.result;
-            console.log(`Icon selected: ${iconFile.name} (${iconFile.type})`);
-            executeBuild(buildData);
-        };
+        console.log(`Icon selected: ${iconFile.name} (${iconFile.type})`);
         
-        reader.readAsDataURL(iconFile);
+        uploadIcon(iconFile)
+            .then(iconId => {
+                buildData.iconId = iconId;
+                executeBuild(buildData);
+            })
+            .catch(error => {
+                document.getElementById('buildStatus').textContent = '❌ Icon upload failed!';
+                loadingOverlay.classList.add('hidden');
+                setTimeout(() => {
+                    loadingOverlay.style.display = 'none';
+                    alert(`Icon upload failed: ${error.message}`);
+                }, 300);
+            });
     } else {
         // No icon selected, build without icon
         executeBuild(buildData);
     }
 }
 
+function uploadIcon(iconFile) {
+    // Send the raw file (no base64); builds reference it by the returned id
+    return fetch('/api/icons', {
+        method: 'POST',
+        headers: {
+            'Content-Type': iconFile.type || 'application/octet-stream'
+        },
+        body: iconFile
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (!data.success) {
+            throw new Error(data.error || 'Upload failed');
+        }
+        return data.iconId;
+    });
+}
+
 function executeBuild(buildData) {
     // Call backend API to build project
     fetch('/api/build-project', {
@@ -604,12 +655,40 @@ function executeBuild(buildData) {
             return { status: response.status, data: data };
         });
     })
+    .then(({ status, data }) => {
+        // Builds run on the server job queue; stream its output until it finishes
+        return data.jobId ? waitForJob(data.jobId, {
+            onLog: line => {
+                const log = document.getElementById('buildLog');
+                log.textContent += line + '\n';
+                log.scrollTop = log.scrollHeight;
+            },
+            onPhase: progress => {
+                document.getElementById('buildStatus').textContent = formatBuildPhase(progress);
+                if (progress.percent !== null) {
+                    document.getElementById('progressFill').style.width = progress.percent + '%';
+                }
+            }
+        }) : { status, data };
+    })
     .then(({ status, data }) => {
         document.getElementById('progressFill').style.width = '100%';
         
         if (data.success) {
             document.getElementById('buildStatus').textContent = '✨ Build complete!';
             document.getElementById('buildLog').textContent += `✅ Build successful!\n\nEXE Location: ${data.exePath}\n\nYou can now run this file!`;
+            if (data.cache === 'hit') {
+                document.getElementById('buildLog').textContent += `\n\n⚡ Inputs unchanged - restored from build cache`;
+            }
+            if (data.frontend) {
+                document.getElementById('buildLog').textContent += `\n\n🧩 Packaged the ${data.frontend.output || 'production'} build (${data.frontend.cache === 'hit' ? 'cached' : 'built'}): ${data.frontend.files} files`;
+            }
+            if (data.optimization) {
+                document.getElementById('buildLog').textContent += `\n\n🗜️ Asset optimization saved ${(data.optimization.bytesSaved / 1024).toFixed(0)} KB`;
+            }
+            if (data.sizeBudget && data.sizeBudget.status === 'warn') {
+                document.getElementById('buildLog').textContent += `\n\n⚠️ ${data.sizeBudget.message}`;
+            }
             
             // Mark as built
             const projectId = document.getElementById('buildProject').value;
@@ -656,6 +735,50 @@ function executeBuild(buildData) {
     });
 }
 
+function waitForJob(jobId, handlers = {}) {
+    // Follow a build job's event stream (PyInstaller output and phase progress)
+    // until it succeeds or fails, then resolve with its result
+    return new Promise((resolve, reject) => {
+        const events = api.jobEvents(jobId);
+        
+        events.addEventListener('log', event => {
+            if (handlers.onLog) handlers.onLog(JSON.parse(event.data).line);
+        });
+        
+        events.addEventListener('phase', event => {
+            if (handlers.onPhase) handlers.onPhase(JSON.parse(event.data));
+        });
+        
+        events.addEventListener('state', event => {
+            const job = JSON.parse(event.data);
+            if (job.state === 'succeeded' || job.state === 'failed') {
+                events.close();
+                resolve({ status: 200, data: job.result || { error: job.error } });
+            }
+        });
+        
+        events.onerror = () => {
+            // EventSource reconnects on its own (resuming from Last-Event-ID);
+            // once it gives up, fall back to the job's final status
+            if (events.readyState !== EventSource.CLOSED) return;
+            api.getJob(jobId)
+                .then(data => {
+                    if (data.job.state === 'succeeded' || data.job.state === 'failed') {
+                        resolve({ status: 200, data: data.job.result || { error: data.job.error } });
+                    } else {
+                        reject(new Error('Lost connection to build job'));
+                    }
+                })
+                .catch(reject);
+        };
+    });
+}
+
+function formatBuildPhase(progress) {
+    const percent = progress.percent !== null ? ` ${Math.round(progress.percent)}%` : '';
+    return `⚙️ ${progress.phase}${percent} (${progress.elapsed.toFixed(1)}s)`;
+}
+
 function simulateBuild(project, exeName) {
     const steps = [
         { text: 'Validating project structure...', progress: 10 },
@@ -810,6 +933,7 @@ function convertPythonToExe() {
     const hideConsole = document.getElementById('pythonHideConsole').checked;
     const singleFile = document.getElementById('pythonSingleFile').checked;
     const optimize = document.getElementById('pythonOptimize').checked;
+    const layered = document.getElementById('pythonLayered').checked;
     const iconFile = document.getElementById('pythonExeIcon').files[0];
     
     // Show loading overlay
@@ -822,20 +946,24 @@ function convertPythonToExe() {
     // Show progress section
     document.getElementById('pythonConvertProgress').style.display = 'block';
     
-    let iconData = null;
     if (iconFile) {
-        const reader = new FileReader();
-        reader.onload = function(e) {
-            iconData = e.target.result;
-            executeConversion(pythonPath, exeName, hideConsole, singleFile, optimize, iconData);
-        };
-        reader.readAsDataURL(iconFile);
+        uploadIcon(iconFile)
+            .then(iconId => executeConversion(pythonPath, exeName, hideConsole, singleFile, optimize, layered, iconId))
+            .catch(error => {
+                updatePythonConvertStatus('✗ Icon upload failed');
+                loadingOverlay.classList.add('hidden');
+                setTimeout(() => {
+                    loadingOverlay.style.display = 'none';
+                    alert('❌ Icon upload failed\n\n' + error.message);
+                    document.getElementById('pythonConvertProgress').style.display = 'none';
+                }, 300);
+            });
     } else {
-        executeConversion(pythonPath, exeName, hideConsole, singleFile, optimize, null);
+        executeConversion(pythonPath, exeName, hideConsole, singleFile, optimize, layered, null);
     }
 }
 
-function executeConversion(pythonPath, exeName, hideConsole, singleFile, optimize, iconData) {
+function executeConversion(pythonPath, exeName, hideConsole, singleFile, optimize, layered, iconId) {
     updatePythonConvertStatus('Analyzing Python project...');
     
     const conversionData = {
@@ -844,7 +972,8 @@ function executeConversion(pythonPath, exeName, hideConsole, singleFile, optimiz
         hideConsole: hideConsole,
         singleFile: singleFile,
         optimize: optimize,
-        iconData: iconData
+        layered: layered,
+        iconId: iconId
     };
     
     fetch('/api/convert-python-to-exe', {
@@ -860,13 +989,28 @@ function executeConversion(pythonPath, exeName, hideConsole, singleFile, optimiz
             return { status: response.status, data: data };
         });
     })
+    .then(({ status, data }) => {
+        // Builds run on the server job queue; stream its output until it finishes
+        return data.jobId ? waitForJob(data.jobId, {
+            onLog: line => addPythonConvertLog(line),
+            onPhase: progress => updatePythonConvertStatus(formatBuildPhase(progress), progress.percent)
+        }) : { status, data };
+    })
     .then(({ status, data }) => {
         // Check if conversion was successful
         if (data.success) {
             updatePythonConvertStatus('✓ Python to EXE conversion completed!');
             addPythonConvertLog(`✅ Build successful!`);
             addPythonConvertLog(`EXE Location: ${data.exePath}`);
+            if (data.appDir) {
+                addPythonConvertLog(`App Folder: ${data.appDir} (ship the whole folder)`);
+            }
             addPythonConvertLog(`File Size: ${data.size}`);
+            if (data.cache === 'hit') {
+                addPythonConvertLog('⚡ Inputs unchanged - restored from build cache');
+            } else if (data.dependencyLayer && data.dependencyLayer.cache === 'hit') {
+                addPythonConvertLog(`⚡ Dependencies unchanged - only your code was rebuilt (${data.seconds}s)`);
+            }
             
             // Update progress to 100%
             document.getElementById('pythonProgressFill').style.width = '100%';
@@ -885,6 +1029,7 @@ function executeConversion(pythonPath, exeName, hideConsole, singleFile, optimiz
                 document.getElementById('pythonHideConsole').checked = true;
                 document.getElementById('pythonSingleFile').checked = true;
                 document.getElementById('pythonOptimize').checked = false;
+                document.getElementById('pythonLayered').checked = true;
                 document.getElementById('pythonExeIcon').value = '';
             }, 300);
         } else {
@@ -919,10 +1064,11 @@ function executeConversion(pythonPath, exeName, hideConsole, singleFile, optimiz
     });
 }
 
-function updatePythonConvertStatus(message) {
+function updatePythonConvertStatus(message, progress = null) {
     document.getElementById('pythonConvertStatus').textContent = message;
-    const progress = Math.random() * 30 + 70;  // Simulate progress 70-100%
-    document.getElementById('pythonProgressFill').style.width = progress + '%';
+    if (progress !== null) {
+        document.getElementById('pythonProgressFill').style.width = progress + '%';
+    }
 }
 
 function addPythonConvertLog(message) {
@@ -0,0 +1,222 @@
+"""FrontendBuildCache with a stub build command in place of a real npm toolchain"""
+
+import json
+import os
+import sys
+
+import pytest
+
+from builder import FrontendBuildCache
+
+# Writes <output>/index.html (default dist/) from src/app.js, as a bundler would
+STUB_BUILD = """
+import os, sys
+output = sys.argv[1] if len(sys.argv) > 1 else 'dist'
+os.makedirs(output, exist_ok=True)
+with open('src/app.js', encoding='utf-8') as f:
+    source = f.read()
+with open(os.path.join(output, 'index.html'), 'w', encoding='utf-8') as f:
+    f.write('<script>' + source + '</script>')
+"""
+
+
+def write(path, text=''):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def make_project(folder, scripts=None, lockfiles=('package-lock.json',), source='console.log(1)'):
+    write(os.path.join(folder, 'package.json'), json.dumps({'name': 'app', 'scripts': scripts or {}}))
+    for lockfile in lockfiles:
+        write(os.path.join(folder, lockfile), '{}')
+    write(os.path.join(folder, 'src', 'app.js'), source)
+    write(os.path.join(folder, 'stub_build.py'), STUB_BUILD)
+    return str(folder)
+
+
+def stub_plan(folder, *args):
+    return FrontendBuildCache.plan(folder, {'command': [sys.executable, 'stub_build.py', *args]}, [])
+
+
+# -- plan() --
+
+@pytest.mark.parametrize('lockfiles, manager', [
+    (('package-lock.json',), 'npm'),
+    (('yarn.lock',), 'yarn'),
+    (('pnpm-lock.yaml', 'package-lock.json'), 'pnpm'),
+    (('bun.lockb',), 'bun'),
+    ((), 'npm'),
+])
+def test_plan_runs_the_lockfiles_package_manager(tmp_path, lockfiles, manager):
+    folder = make_project(tmp_path, scripts={'build': 'vite build'}, lockfiles=lockfiles)
+    plan = FrontendBuildCache.plan(folder, None, ['React'])
+    assert plan['command'] == [manager, 'run', 'build']
+    assert plan['packageManager'] == manager
+    assert not plan['custom']
+
+
+def test_plan_skips_projects_without_a_framework_or_build_script(tmp_path):
+    folder = make_project(tmp_path, scripts={'build': 'vite build'})
+    assert FrontendBuildCache.plan(folder, None, []) is None
+    assert FrontendBuildCache.plan(make_project(tmp_path / 'cdn'), None, ['Vue.js']) is None
+
+
+def test_plan_forced_and_disabled(tmp_path):
+    folder = make_project(tmp_path, scripts={'build': 'tsc'})
+    assert FrontendBuildCache.plan(folder, True, [])['command'] == ['npm', 'run', 'build']
+    assert FrontendBuildCache.plan(folder, False, ['React']) is None
+    with pytest.raises(ValueError, match='no "build" script'):
+        FrontendBuildCache.plan(make_project(tmp_path / 'empty'), True, [])
+
+
+@pytest.mark.parametrize('settings', [{'script': 'build', 'unknown': 1}, 'yes', 1])
+def test_plan_rejects_invalid_settings(tmp_path, settings):
+    with pytest.raises(ValueError):
+        FrontendBuildCache.plan(make_project(tmp_path), settings, ['React'])
+
+
+def test_plan_custom_command_and_output(tmp_path):
+    folder = make_project(tmp_path)
+    plan = FrontendBuildCache.plan(folder, {'command': 'node build.js --prod', 'output': 'public'}, [])
+    assert plan['command'] == ['node', 'build.js', '--prod']
+    assert plan['output'] == 'public'
+    assert plan['custom']
+
+
+# -- build_key() --
+
+def test_build_key_follows_sources_not_output(tmp_path):
+    folder = make_project(tmp_path)
+    cache = FrontendBuildCache(cache_dir=str(tmp_path / 'cache'))
+    plan = stub_plan(folder)
+    key = cache.build_key(folder, plan)
+    
+    write(os.path.join(folder, 'dist', 'index.html'), 'built')
+    write(os.path.join(folder, 'node_modules', 'lib', 'index.js'), 'installed')
+    assert cache.build_key(folder, plan) == key
+    
+    write(os.path.join(folder, 'src', 'app.js'), 'console.log(2)')
+    assert cache.build_key(folder, plan) != key
+    
+    edited = cache.build_key(folder, plan)
+    write(os.path.join(folder, 'package-lock.json'), '{"lockfileVersion": 3}')
+    assert cache.build_key(folder, plan) != edited
+
+
+def test_build_key_covers_the_command(tmp_path):
+    folder = make_project(tmp_path)
+    cache = FrontendBuildCache(cache_dir=str(tmp_path / 'cache'))
+    assert cache.build_key(folder, stub_plan(folder)) != cache.build_key(folder, stub_plan(folder, 'out'))
+
+
+# -- find_output() --
+
+@pytest.mark.parametrize('index_path, expected', [
+    ('dist/index.html', 'dist'),                                  # Vite
+    ('build/index.html', 'build'),                                # Create React App
+    ('dist/my-app/browser/index.html', 'dist/my-app/browser'),    # Angular
+])
+def test_find_output(tmp_path, index_path, expected):
+    write(os.path.join(tmp_path, *index_path.split('/')), '<html></html>')
+    assert FrontendBuildCache.find_output(str(tmp_path)) == os.path.join(str(tmp_path), *expected.split('/'))
+
+
+def test_find_output_ignores_stale_output(tmp_path):
+    index_path = os.path.join(tmp_path, 'dist', 'index.html')
+    write(index_path, '<html></html>')
+    os.utime(index_path, (1000, 1000))
+    assert FrontendBuildCache.find_output(str(tmp_path), since=10000) is None
+
+
+# -- get() --
+
+def test_get_builds_once_then_hits(tmp_path):
+    folder = make_project(tmp_path / 'app')
+    cache = FrontendBuildCache(cache_dir=str(tmp_path / 'cache'))
+    plan = stub_plan(folder)
+    
+    output, info, error = cache.get(folder, plan)
+    assert error is None
+    assert info['cache'] == 'miss' and info['output'] == 'dist' and info['files'] == 1
+    with open(os.path.join(output, 'index.html'), encoding='utf-8') as f:
+        assert 'console.log(1)' in f.read()
+    
+    output_again, info, error = cache.get(folder, plan)
+    assert error is None and info['cache'] == 'hit' and output_again == output
+
+
+def test_get_reports_a_failing_build(tmp_path):
+    folder = make_project(tmp_path / 'app')
+    cache = FrontendBuildCache(cache_dir=str(tmp_path / 'cache'))
+    plan = FrontendBuildCache.plan(folder, {'command': [sys.executable, '-c', 'import sys; print("boom"); sys.exit(3)']}, [])
+    
+    output, info, error = cache.get(folder, plan)
+    assert output is None
+    assert 'exit code 3' in error and 'boom' in error
+    assert not os.path.exists(os.path.join(cache.cache_dir, info['key']))
+
+
+def test_get_reports_a_build_without_index_html(tmp_path):
+    folder = make_project(tmp_path / 'app')
+    cache = FrontendBuildCache(cache_dir=str(tmp_path / 'cache'))
+    plan = FrontendBuildCache.plan(folder, {'command': [sys.executable, '-c', 'pass']}, [])
+    
+    output, _, error = cache.get(folder, plan)
+    assert output is None and 'no index.html' in error
+
+
+def test_get_needs_installed_dependencies(tmp_path, monkeypatch):
+    folder = make_project(tmp_path / 'app', scripts={'build': 'vite build'})
+    # A package manager on PATH, so the missing node_modules is what fails
+    bin_dir = tmp_path / 'bin'
+    write(os.path.join(bin_dir, 'npm'), '#!/bin/sh\nexit 0\n')
+    os.chmod(os.path.join(bin_dir, 'npm'), 0o755)
+    monkeypatch.setenv('PATH', str(bin_dir))
+    cache = FrontendBuildCache(cache_dir=str(tmp_path / 'cache'))
+    
+    output, _, error = cache.get(folder, FrontendBuildCache.plan(folder, None, ['React']))
+    assert output is None and 'run `npm install` first' in error
+
+
+def test_get_needs_the_package_manager(tmp_path, monkeypatch):
+    folder = make_project(tmp_path / 'app', scripts={'build': 'vite build'})
+    monkeypatch.setenv('PATH', str(tmp_path / 'empty-bin'))
+    cache = FrontendBuildCache(cache_dir=str(tmp_path / 'cache'))
+    
+    output, _, error = cache.get(folder, FrontendBuildCache.plan(folder, None, ['React']))
+    assert output is None and 'npm, which was not found' in error
+
+
+# -- eviction --
+
+def test_new_output_replaces_the_projects_earlier_one(tmp_path):
+    cache = FrontendBuildCache(cache_dir=str(tmp_path / 'cache'))
+    other = make_project(tmp_path / 'other')
+    other_output, _, _ = cache.get(other, stub_plan(other))
+    
+    folder = make_project(tmp_path / 'app')
+    outputs = []
+    for edit in range(FrontendBuildCache.MAX_ENTRIES + 5):
+        write(os.path.join(folder, 'src', 'app.js'), f'console.log({edit})')
+        output, _, error = cache.get(folder, stub_plan(folder))
+        assert error is None
+        outputs.append(output)
+    
+    entries = sorted(entry.name for entry in os.scandir(cache.cache_dir) if entry.is_dir())
+    assert entries == sorted([os.path.basename(other_output), os.path.basename(outputs[-1])])
+    assert not os.path.exists(f'{outputs[0]}.json')
+
+
+def test_cap_counts_projects(tmp_path, monkeypatch):
+    monkeypatch.setattr(FrontendBuildCache, 'MAX_ENTRIES', 2)
+    cache = FrontendBuildCache(cache_dir=str(tmp_path / 'cache'))
+    outputs = []
+    for name in ('a', 'b', 'c'):
+        folder = make_project(tmp_path / name, source=f'console.log("{name}")')
+        outputs.append(cache.get(folder, stub_plan(folder))[0])
+        # Distinct mtimes for the most-recently-used order
+        os.utime(outputs[-1], (len(outputs), len(outputs)))
+    
+    assert not os.path.exists(outputs[0])
+    assert os.path.isdir(outputs[1]) and os.path.isdir(outputs[2])